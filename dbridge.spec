@@ -13,6 +13,8 @@ a = Analysis(
         'pymysql',
         'psycopg2',
         'pandas',
+        'xlsxwriter',
+        'openpyxl',
         'matplotlib',
         'cryptography'
     ],
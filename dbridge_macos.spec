@@ -12,6 +12,8 @@ a = Analysis(
         'pymysql',
         'psycopg2',
         'pandas',
+        'xlsxwriter',
+        'openpyxl',
         'matplotlib',
         'cryptography'
     ],
@@ -10,6 +10,8 @@ setup(
         "pymysql>=1.0.2",
         "psycopg2-binary>=2.9.5",
         "pandas>=1.5.2",
+        "XlsxWriter>=3.0.0",
+        "openpyxl>=3.0.10",
         "matplotlib>=3.6.2",
     ],
     entry_points={
@@ -7,21 +7,184 @@ from typing import Dict, List, Union, Optional, Any, Tuple
 import sqlalchemy
 from sqlalchemy import create_engine, inspect, Engine
 from sqlalchemy.engine import Connection
+from sqlalchemy.dialects.mysql.reflection import ReflectedState
 import pandas as pd
+import csv
+import decimal
+import gzip
+import io
+import itertools
 import json
+import numbers
 import os
 import pathlib
 import subprocess
 import tempfile
 import re
+import shutil
 import base64
 import hashlib
-from datetime import datetime
+from contextlib import closing, contextmanager
+from datetime import date, datetime, time, timedelta
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from PyQt6.QtCore import QObject, pyqtSignal
 
+# How much of a failed client tool's stderr is kept for the error message
+STDERR_TAIL_BYTES = 64 * 1024
+
+# Write buffer size for exported data files
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Number of rows fetched per round trip when streaming a table into a file
+EXPORT_CHUNK_SIZE = 10000
+
+# Rows combined into one INSERT statement of a generated SQL dump
+DEFAULT_ROWS_PER_INSERT = 1000
+
+# Length at which a multi-row INSERT is ended early, whatever its row count
+MAX_INSERT_LENGTH = 4 * 1024 * 1024
+
+# gzip level of compressed exports; the fastest level already shrinks
+# dumps and CSV files several times over
+EXPORT_GZIP_LEVEL = 1
+
+# DDL statements whose only variable part is a single identifier, by kind
+DDL_TEMPLATES = {
+    'create_database': "CREATE DATABASE {};",
+    'drop_database': "DROP DATABASE {};",
+    'drop_table': "DROP TABLE {};",
+}
+
+# Common system database names across different database systems, lower case
+SYSTEM_DATABASES = frozenset((
+    'information_schema',  # MySQL, PostgreSQL
+    'mysql',               # MySQL
+    'performance_schema',  # MySQL
+    'sys',                 # MySQL
+    'pg_catalog',          # PostgreSQL
+    'postgres',            # PostgreSQL default admin database
+    'template0',           # PostgreSQL
+    'template1'            # PostgreSQL
+))
+
+# System databases of a MongoDB server
+MONGO_SYSTEM_DATABASES = frozenset(('admin', 'local', 'config'))
+
+
+def write_dataframe_csv(data: pd.DataFrame, file_path) -> None:
+    """Write a DataFrame to a CSV file through a large write buffer
+    
+    Args:
+        data: DataFrame to write
+        file_path: Path of the CSV file
+    """
+    with open(file_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+        data.to_csv(f, index=False, lineterminator='\n')
+
+
+@contextmanager
+def open_export_file(file_path, compress=False):
+    """Open an export file for writing UTF-8 text through a large buffer
+    
+    Args:
+        file_path: Path of the file
+        compress: Gzip the file on the fly
+        
+    Yields:
+        Text file opened with newline=''
+    """
+    with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as raw:
+        if compress:
+            with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=EXPORT_GZIP_LEVEL) as gz, \
+                    io.TextIOWrapper(gz, encoding='utf-8', newline='') as f:
+                yield f
+        else:
+            with io.TextIOWrapper(raw, encoding='utf-8', newline='') as f:
+                yield f
+
+
+def _sql_literal(value) -> str:
+    """Format a value read from the database as a SQL literal"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, bytes):
+        return f"X'{value.hex()}'"
+    # Escape single quotes in string values
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def open_excel_writer(file_path) -> pd.ExcelWriter:
+    """Open an ExcelWriter for an export
+    
+    Uses xlsxwriter in constant-memory mode when it is installed, otherwise
+    an openpyxl write-only workbook. Both flush rows to disk as they are
+    written instead of keeping whole sheets in memory.
+    
+    Args:
+        file_path: Path of the .xlsx file
+    """
+    try:
+        import xlsxwriter  # noqa: F401
+    except ImportError:
+        return pd.ExcelWriter(file_path, engine='openpyxl', engine_kwargs={'write_only': True})
+    return pd.ExcelWriter(
+        file_path, engine='xlsxwriter', engine_kwargs={'options': {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            'remove_timezone': True,
+        }}
+    )
+
+
+# Cell values that both Excel writers accept as they are. Like pandas'
+# to_excel, everything else (dicts, lists, bytes, ...) is written as a string.
+EXCEL_CELL_TYPES = (str, numbers.Real, decimal.Decimal, date, time, timedelta)
+
+
+def _excel_cell(value):
+    """Convert a value read from the database into one an Excel writer accepts"""
+    if value is None or isinstance(value, EXCEL_CELL_TYPES):
+        return value
+    return str(value)
+
+
+def write_frames_to_sheet(writer: pd.ExcelWriter, frames, sheet_name: str) -> None:
+    """Append DataFrames to a new sheet below a single header row
+    
+    Both writers from open_excel_writer only accept rows in order, while
+    DataFrame.to_excel writes column by column, so the rows are written to
+    the worksheet directly, one after the other.
+    
+    Args:
+        writer: Writer from open_excel_writer
+        frames: Iterable of DataFrames with the same columns
+        sheet_name: Name of the sheet, at most 31 characters
+    """
+    if writer.engine == 'xlsxwriter':
+        worksheet = writer.book.add_worksheet(sheet_name)
+        row_numbers = itertools.count()
+        
+        def append(values):
+            worksheet.write_row(next(row_numbers), 0, values)
+    else:
+        # openpyxl write-only worksheet
+        append = writer.book.create_sheet(sheet_name).append
+    
+    header_written = False
+    for chunk in frames:
+        if not header_written:
+            append([str(column) for column in chunk.columns])
+            header_written = True
+        # Missing values become empty cells
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for values in chunk.itertuples(index=False, name=None):
+            append([_excel_cell(value) for value in values])
+
+
 class DatabaseConnection:
     """Class representing a database connection"""
     
@@ -45,8 +208,13 @@ class DatabaseConnection:
             'can_drop_database': False,
             'is_admin': False
         }
+        self._quoted_identifiers = {}
+        self._select_queries = {}
+        self._database_engines = {}
+        
+        # Permissions are looked up on first use, see _permission()
+        self._permissions_checked = False
         self._connect()
-        self._check_permissions()
     
     def _connect(self) -> None:
         """Establish the database connection"""
@@ -96,9 +264,12 @@ class DatabaseConnection:
             print(f"Error checking permissions: {e}")
             # If we can't check permissions, default to restricted
     
-    def _build_connection_string(self) -> str:
+    def _build_connection_string(self, database: Optional[str] = None) -> str:
         """Build the SQLAlchemy connection string
         
+        Args:
+            database: Database to connect to instead of the configured one
+        
         Returns:
             SQLAlchemy connection string
             
@@ -118,20 +289,23 @@ class DatabaseConnection:
         else:
             encoded_password = ''
             
+        if database is None:
+            database = self.params.get('database', '')
+            
         if self.params['type'] == 'MySQL':
             # Handle case where database name is not provided
-            if 'database' in self.params and self.params['database'].strip():
-                return f"mysql+pymysql://{encoded_user}:{encoded_password}@{self.params['host']}:{self.params['port']}/{self.params['database']}"
+            if database.strip():
+                return f"mysql+pymysql://{encoded_user}:{encoded_password}@{self.params['host']}:{self.params['port']}/{database}"
             else:
                 return f"mysql+pymysql://{encoded_user}:{encoded_password}@{self.params['host']}:{self.params['port']}/"
         elif self.params['type'] == 'PostgreSQL':
             # Handle case where database name is not provided
-            if 'database' in self.params and self.params['database'].strip():
-                return f"postgresql+psycopg2://{encoded_user}:{encoded_password}@{self.params['host']}:{self.params['port']}/{self.params['database']}"
+            if database.strip():
+                return f"postgresql+psycopg2://{encoded_user}:{encoded_password}@{self.params['host']}:{self.params['port']}/{database}"
             else:
                 return f"postgresql+psycopg2://{encoded_user}:{encoded_password}@{self.params['host']}:{self.params['port']}/"
         elif self.params['type'] == 'SQLite':
-            return f"sqlite:///{self.params['database']}"
+            return f"sqlite:///{database}"
         else:
             raise ValueError(f"Unsupported database type: {self.params['type']}")
     
@@ -151,11 +325,14 @@ class DatabaseConnection:
             raise ValueError("Database connection is not established")
         return pd.read_sql(query, self.engine)
     
-    def execute_non_query(self, query: str) -> int:
+    def execute_non_query(self, query: str, database: Optional[str] = None) -> int:
         """Execute a non-query SQL statement (INSERT, UPDATE, DELETE, etc.)
         
         Args:
             query: SQL statement to execute
+            database: Database to run the statement in without switching the
+                session, defaults to the current one. Table names in the
+                statement should come from qualified_name() for this database.
             
         Returns:
             Number of rows affected
@@ -165,7 +342,8 @@ class DatabaseConnection:
         """
         if self.engine is None:
             raise ValueError("Database connection is not established")
-        with self.engine.connect() as connection:
+        engine, _ = self._engine_for_database(database)
+        with engine.connect() as connection:
             # Start a transaction
             with connection.begin():
                 result = connection.execute(sqlalchemy.text(query))
@@ -173,6 +351,111 @@ class DatabaseConnection:
                 # if no exceptions are raised
             return result.rowcount
     
+    def execute_batch(self, statements: List[str], database: Optional[str] = None) -> int:
+        """Execute several non-query statements in a single transaction
+        
+        The statements share one connection and are committed together, so a
+        failing statement rolls back the ones before it on databases with
+        transactional DDL such as PostgreSQL.
+        
+        Args:
+            statements: SQL statements to execute in order
+            database: Database to run the statements in, as for execute_non_query
+            
+        Returns:
+            Total number of rows affected
+            
+        Raises:
+            ValueError: If database connection is not established
+        """
+        if self.engine is None:
+            raise ValueError("Database connection is not established")
+        engine, _ = self._engine_for_database(database)
+        rowcount = 0
+        with engine.connect() as connection:
+            with connection.begin():
+                for statement in statements:
+                    rowcount += connection.execute(sqlalchemy.text(statement)).rowcount
+        return rowcount
+    
+    def quote_ident(self, name: str) -> str:
+        """Quote a table or column name for use in a SQL statement
+        
+        Args:
+            name: Identifier to quote
+            
+        Returns:
+            The identifier quoted for this connection's database type
+        """
+        quoted = self._quoted_identifiers.get(name)
+        if quoted is None:
+            if self.params['type'] == 'MySQL':
+                quoted = "`" + name.replace("`", "``") + "`"
+            else:
+                quoted = '"' + name.replace('"', '""') + '"'
+            self._quoted_identifiers[name] = quoted
+        return quoted
+    
+    def select_all_query(self, table_name: str) -> str:
+        """Build the statement that reads every row of a table
+        
+        The text is built once per table, so repeated exports send the
+        driver the same SQL string each time.
+        
+        Args:
+            table_name: Name of the table to read
+            
+        Returns:
+            SELECT statement with the table name quoted
+        """
+        query = self._select_queries.get(table_name)
+        if query is None:
+            query = f"SELECT * FROM {self.quote_ident(table_name)}"
+            self._select_queries[table_name] = query
+        return query
+    
+    def qualified_name(self, name: str, database: Optional[str] = None) -> str:
+        """Quote a table name for a statement run with execute_non_query(database=...)
+        
+        MySQL reaches other databases through the same session, so the name is
+        prefixed with the database there. Other types run the statement on an
+        engine connected to the database and need no prefix.
+        
+        Args:
+            name: Table name
+            database: Database of the table, defaults to the current one
+            
+        Returns:
+            The quoted, and where needed qualified, table name
+        """
+        _, schema = self._engine_for_database(database)
+        if schema is None:
+            return self.quote_ident(name)
+        return f"{self.quote_ident(schema)}.{self.quote_ident(name)}"
+    
+    def execute_ddl(self, kind: str, identifier: str, database: Optional[str] = None) -> int:
+        """Execute a DDL statement that names a single database object
+        
+        Identifiers cannot be bound as parameters, so the statement is built
+        from a fixed template and the identifier quoted for this database type.
+        
+        Args:
+            kind: Key of the statement in DDL_TEMPLATES, e.g. 'drop_table'
+            identifier: Name of the database or table
+            database: Database of the table, defaults to the current one
+            
+        Returns:
+            Number of rows affected
+            
+        Raises:
+            ValueError: If kind is not a known statement
+        """
+        template = DDL_TEMPLATES.get(kind)
+        if template is None:
+            raise ValueError(f"Unsupported DDL statement: {kind}")
+        statement = template.format(self.qualified_name(identifier, database))
+        return self.execute_non_query(statement, database=database)
+    
     def get_database_name(self):
         """Get the name of the connected database"""
         if 'database' in self.params and self.params['database'].strip():
@@ -180,17 +463,29 @@ class DatabaseConnection:
         else:
             return "(No database selected)"
             
+    def _permission(self, name: str) -> bool:
+        """Look up a permission of the current user
+        
+        The grants are queried the first time any permission is needed and
+        remembered for the lifetime of the connection, so connections that
+        never open the database manager do not pay for the round trip.
+        """
+        if not self._permissions_checked:
+            self._permissions_checked = True
+            self._check_permissions()
+        return self.user_permissions.get(name, False)
+            
     def can_create_database(self):
         """Check if the current user can create databases"""
-        return self.user_permissions.get('can_create_database', False)
+        return self._permission('can_create_database')
         
     def can_drop_database(self):
         """Check if the current user can drop databases"""
-        return self.user_permissions.get('can_drop_database', False)
+        return self._permission('can_drop_database')
         
     def is_admin(self):
         """Check if the current user has admin privileges"""
-        return self.user_permissions.get('is_admin', False)
+        return self._permission('is_admin')
     
     def is_system_database(self, database_name):
         """Check if the given database is a system database
@@ -203,21 +498,9 @@ class DatabaseConnection:
         """
         if not database_name:
             return False
-            
-        # Common system database names across different database systems
-        system_databases = [
-            'information_schema',  # MySQL, PostgreSQL
-            'mysql',               # MySQL
-            'performance_schema',  # MySQL
-            'sys',                 # MySQL
-            'pg_catalog',          # PostgreSQL
-            'postgres',            # PostgreSQL default admin database
-            'template0',           # PostgreSQL
-            'template1'            # PostgreSQL
-        ]
         
         # Case-insensitive check
-        return database_name.lower() in [db.lower() for db in system_databases]
+        return database_name.lower() in SYSTEM_DATABASES
     
     def get_available_databases(self):
         """Get a list of available databases on the server"""
@@ -297,16 +580,61 @@ class DatabaseConnection:
             print(f"Error deselecting database: {e}")
             return False
     
-    def get_tables(self):
-        """Get a list of tables in the database"""
+    def _engine_for_database(self, database=None):
+        """Get the engine for working in a database
+        
+        The current session is never switched to another database. MySQL reaches
+        other databases as schemas of the same connection; PostgreSQL cannot
+        cross databases, so a separate engine is kept per database and reused.
+        
+        Args:
+            database: Database to work in, or None for the current one
+            
+        Returns:
+            Tuple of (engine, schema), where schema is the database to qualify
+            names with or None if the engine is already connected to it
+        """
+        if database is None or database == self.get_database_name() or self.params['type'] == 'SQLite':
+            return self.engine, None
+            
+        if self.params['type'] == 'MySQL':
+            return self.engine, database
+            
+        engine = self._database_engines.get(database)
+        if engine is None:
+            engine = create_engine(self._build_connection_string(database))
+            self._database_engines[database] = engine
+        return engine, None
+    
+    def _inspect_database(self, database=None):
+        """Get an inspector for reading the metadata of a database
+        
+        Args:
+            database: Database to inspect, or None for the current one
+            
+        Returns:
+            Tuple of (inspector, schema) to pass to the inspector methods
+        """
+        engine, schema = self._engine_for_database(database)
+        if engine is self.engine:
+            # Refresh the inspector to ensure we get the latest metadata
+            self.inspector = inspect(self.engine)
+            return self.inspector, schema
+        return inspect(engine), schema
+    
+    def get_tables(self, database=None):
+        """Get a list of tables in the database
+        
+        Args:
+            database: Database to list, defaults to the current one
+        """
         try:
             if self.engine is None:
                 return []
-            # Refresh the inspector to ensure we get the latest table list
-            self.inspector = inspect(self.engine)
-            if self.inspector is None:
+            inspector, schema = self._inspect_database(database)
+            if inspector is None:
                 return []
-            return self.inspector.get_table_names()
+            return inspector.get_table_names(schema=schema)
         except Exception as e:
             # Log the error but return an empty list to avoid crashing
             print(f"Error getting tables: {e}")
@@ -327,22 +655,203 @@ class DatabaseConnection:
             print(f"Error getting views: {e}")
             return []
     
-    def get_columns(self, table_name):
-        """Get the columns of a table"""
+    def get_columns(self, table_name, database=None):
+        """Get the columns of a table
+        
+        Args:
+            table_name: Table to describe
+            database: Database containing the table, defaults to the current one
+        """
         try:
             if self.engine is None:
                 raise ValueError("Database connection is not established")
-            # Refresh the inspector to ensure we get the latest column information
-            self.inspector = inspect(self.engine)
-            if self.inspector is None:
+            inspector, schema = self._inspect_database(database)
+            if inspector is None:
                 raise ValueError("Database inspector could not be created")
-            columns = self.inspector.get_columns(table_name)
+            columns = inspector.get_columns(table_name, schema=schema)
             return [{'name': col['name'], 'type': str(col['type'])} for col in columns]
         except Exception as e:
             print(f"Error getting columns for table '{table_name}': {e}")
             # Re-raise the exception to be handled by the caller
             raise
     
+    def get_all_columns(self, database=None):
+        """Get the columns of every table in a database with one metadata query
+        
+        Args:
+            database: Database to describe, defaults to the current one
+            
+        Returns:
+            Dictionary mapping table names to lists of column dictionaries
+            in the format returned by get_columns()
+        """
+        if self.engine is None:
+            return {}
+            
+        if self.params['type'] == 'MySQL':
+            schema = database or self.params.get('database', '')
+            if not schema.strip():
+                return {}
+            query = sqlalchemy.text(
+                "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE FROM information_schema.columns "
+                "WHERE TABLE_SCHEMA = :schema ORDER BY TABLE_NAME, ORDINAL_POSITION"
+            )
+            query_params = {'schema': schema}
+        elif self.params['type'] == 'SQLite':
+            query = sqlalchemy.text(
+                "SELECT m.name, p.name, p.type FROM sqlite_master AS m "
+                "JOIN pragma_table_info(m.name) AS p "
+                "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' ORDER BY m.name, p.cid"
+            )
+            query_params = {}
+        else:
+            # PostgreSQL reflects all tables of a schema in one catalog query
+            inspector, schema = self._inspect_database(database)
+            return {
+                table: [{'name': col['name'], 'type': str(col['type'])} for col in columns]
+                for (_, table), columns in inspector.get_multi_columns(schema=schema).items()
+            }
+            
+        columns_by_table = {}
+        with self.engine.connect() as conn:
+            for table, name, column_type in conn.execute(query, query_params):
+                columns_by_table.setdefault(table, []).append(
+                    {'name': name, 'type': self._reflected_type_name(name, column_type)}
+                )
+        return columns_by_table
+    
+    def _reflected_type_name(self, column_name, column_type):
+        """Name a column type read from the catalog the way get_columns() does
+        
+        The declared type is parsed by the same SQLAlchemy dialect code that
+        reflects a single table, so INT(11) becomes INTEGER, varchar(20)
+        becomes VARCHAR(20) and an untyped SQLite column becomes NULL.
+        
+        Args:
+            column_name: Name of the column, only used in warnings
+            column_type: Type as stored in the catalog, e.g. "int(11) unsigned"
+        """
+        dialect = self.engine.dialect
+        if self.params['type'] == 'SQLite':
+            return str(dialect._resolve_type_affinity(column_type.upper()))
+        
+        # MySQL's reflection parses the column lines of SHOW CREATE TABLE,
+        # whose types are written like information_schema's COLUMN_TYPE
+        state = ReflectedState()
+        dialect._tabledef_parser._parse_column(
+            f"  {dialect.identifier_preparer.quote_identifier(column_name)} {column_type},", state
+        )
+        return str(state.columns[0]['type']) if state.columns else 'NULL'
+    
+    def get_all_indexes(self, database=None):
+        """Get the indexes of every table in a database with one metadata query
+        
+        Args:
+            database: Database to describe, defaults to the current one
+            
+        Returns:
+            Dictionary mapping table names to lists of index dictionaries
+            in the format returned by get_indexes(), sorted by name
+        """
+        if self.engine is None:
+            return {}
+        
+        if self.params['type'] == 'MySQL':
+            schema = database or self.params.get('database', '')
+            if not schema.strip():
+                return {}
+            query = sqlalchemy.text(
+                "SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME FROM information_schema.statistics "
+                "WHERE TABLE_SCHEMA = :schema AND INDEX_NAME <> 'PRIMARY' "
+                "ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX"
+            )
+            query_params = {'schema': schema}
+        elif self.params['type'] == 'SQLite':
+            # The automatic indexes of PRIMARY KEY and UNIQUE constraints are
+            # left out, as by get_indexes()
+            query = sqlalchemy.text(
+                "SELECT m.name, i.name, c.name FROM sqlite_master AS m "
+                "JOIN pragma_index_list(m.name) AS i "
+                "JOIN pragma_index_info(i.name) AS c "
+                "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' "
+                "AND i.name NOT LIKE 'sqlite_autoindex%' ORDER BY m.name, i.name, c.seqno"
+            )
+            query_params = {}
+        else:
+            inspector, schema = self._inspect_database(database)
+            return {
+                table: [{'name': idx['name'], 'columns': idx['column_names']} for idx in indexes]
+                for (_, table), indexes in inspector.get_multi_indexes(schema=schema).items()
+            }
+        
+        indexes_by_name = {}
+        with self.engine.connect() as conn:
+            for table, name, column in conn.execute(query, query_params):
+                indexes_by_name.setdefault((table, name), []).append(column)
+        
+        indexes_by_table = {}
+        for (table, name), columns in indexes_by_name.items():
+            # Like get_indexes(), skip indexes on expressions
+            if None not in columns:
+                indexes_by_table.setdefault(table, []).append({'name': name, 'columns': columns})
+        return indexes_by_table
+    
+    def get_table_row_counts(self, tables):
+        """Get the approximate number of rows of several tables with one query
+        
+        The counts are the estimates the database keeps in its statistics,
+        so no table is scanned. SQLite only has them in sqlite_stat1 once
+        ANALYZE has been run; without that table no counts are returned.
+        
+        Args:
+            tables: Names of the tables in the current database
+            
+        Returns:
+            Dictionary mapping table names to row counts. Tables without a
+            count are left out, and the dictionary is empty if the counts
+            could not be read.
+        """
+        if self.engine is None or not tables:
+            return {}
+        
+        db_type = self.params['type']
+        if db_type == 'MySQL':
+            query = sqlalchemy.text(
+                "SELECT TABLE_NAME, TABLE_ROWS FROM information_schema.tables "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :names"
+            ).bindparams(sqlalchemy.bindparam('names', expanding=True))
+            query_params = {'names': list(tables)}
+        elif db_type == 'PostgreSQL':
+            query = sqlalchemy.text(
+                "SELECT relname, n_live_tup FROM pg_stat_user_tables "
+                "WHERE schemaname = current_schema() AND relname IN :names"
+            ).bindparams(sqlalchemy.bindparam('names', expanding=True))
+            query_params = {'names': list(tables)}
+        else:
+            # Every sqlite_stat1 row of a table starts with its row count
+            query = sqlalchemy.text(
+                "SELECT tbl, MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 "
+                "WHERE tbl IN :names GROUP BY tbl"
+            ).bindparams(sqlalchemy.bindparam('names', expanding=True))
+            query_params = {'names': list(tables)}
+        
+        try:
+            with self.engine.connect() as conn:
+                if db_type == 'SQLite' and conn.execute(sqlalchemy.text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+                )).first() is None:
+                    # Counting the rows instead would read every table in full
+                    return {}
+                return {
+                    table: int(count)
+                    for table, count in conn.execute(query, query_params)
+                    if count is not None
+                }
+        except Exception as e:
+            # The counts are only used to scale progress, so carry on without
+            print(f"Error getting table row counts: {e}")
+            return {}
+    
     def get_primary_key(self, table_name):
         """Get the primary key columns of a table"""
         if self.engine is None:
@@ -363,29 +872,41 @@ class DatabaseConnection:
             return []
         return self.inspector.get_foreign_keys(table_name)
     
-    def get_indexes(self, table_name):
-        """Get the indexes of a table"""
+    def get_indexes(self, table_name, database=None):
+        """Get the indexes of a table
+        
+        Args:
+            table_name: Table to describe
+            database: Database containing the table, defaults to the current one
+        """
         if self.engine is None:
             return []
-        # Refresh the inspector to ensure we get the latest index information
-        self.inspector = inspect(self.engine)
-        if self.inspector is None:
+        inspector, schema = self._inspect_database(database)
+        if inspector is None:
             return []
-        indexes = self.inspector.get_indexes(table_name)
+        indexes = inspector.get_indexes(table_name, schema=schema)
         return [{'name': idx['name'], 'columns': idx['column_names']} for idx in indexes]
     
     def close(self):
         """Close the database connection"""
         if self.engine:
             self.engine.dispose()
+        for engine in self._database_engines.values():
+            engine.dispose()
+        self._database_engines.clear()
     
-    def export_database_to_sql(self, file_path, tables=None):
+    def export_database_to_sql(self, file_path, tables=None, rows_per_insert=DEFAULT_ROWS_PER_INSERT,
+                               compress=False):
         """
         Export the entire database or specific tables to a SQL file
         
         Args:
             file_path (str): Path to save the SQL file
             tables (list, optional): List of table names to export. If None, export all tables.
+            rows_per_insert (int, optional): Rows per INSERT statement in dumps
+                generated by DBridge (SQLite). mysqldump and pg_dump use
+                their own settings.
+            compress (bool, optional): Gzip the SQL file
             
         Returns:
             bool: True if export was successful, False otherwise
@@ -394,78 +915,127 @@ class DatabaseConnection:
             db_type = self.params['type']
             
             if db_type == 'SQLite':
-                return self._export_sqlite_to_sql(file_path, tables)
+                return self._export_sqlite_to_sql(file_path, tables, rows_per_insert, compress)
             elif db_type == 'MySQL':
-                return self._export_mysql_to_sql(file_path, tables)
+                return self._export_mysql_to_sql(file_path, tables, compress)
             elif db_type == 'PostgreSQL':
-                return self._export_postgresql_to_sql(file_path, tables)
+                return self._export_postgresql_to_sql(file_path, tables, compress)
             else:
                 raise ValueError(f"Export not supported for database type: {db_type}")
         except Exception as e:
             print(f"Export error: {e}")
             raise
     
-    def _export_sqlite_to_sql(self, file_path, tables=None):
-        """Export SQLite database to SQL file"""
+    def _run_client_tool(self, cmd, output=None, **kwargs):
+        """Run a database client tool such as mysqldump or psql
+        
+        stderr is spooled to a temporary file rather than a pipe, and only its
+        last STDERR_TAIL_BYTES are attached to the CalledProcessError, so a
+        noisy failure cannot exhaust memory.
+        
+        Args:
+            cmd: Command line to run
+            output: Binary file object without a usable file descriptor, such
+                as a GzipFile, that stdout is copied into. Use stdout=f for
+                plain files so the tool writes to them directly.
+            **kwargs: Extra arguments for subprocess.run
+            
+        Raises:
+            subprocess.CalledProcessError: If the tool exits with an error
+        """
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                if output is None:
+                    subprocess.run(cmd, stderr=stderr_file, check=True, **kwargs)
+                else:
+                    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, **kwargs) as proc:
+                        shutil.copyfileobj(proc.stdout, output, EXPORT_BUFFER_SIZE)
+                    if proc.returncode:
+                        raise subprocess.CalledProcessError(proc.returncode, cmd)
+            except subprocess.CalledProcessError as e:
+                size = stderr_file.seek(0, os.SEEK_END)
+                stderr_file.seek(max(0, size - STDERR_TAIL_BYTES))
+                e.stderr = stderr_file.read()
+                raise
+    
+    def _export_sqlite_to_sql(self, file_path, tables=None, rows_per_insert=DEFAULT_ROWS_PER_INSERT,
+                              compress=False):
+        """Export SQLite database to SQL file
+        
+        Rows are streamed from the cursor into the file in chunks of
+        EXPORT_CHUNK_SIZE, and the statements are wrapped in a single
+        transaction so the dump also imports quickly. Up to rows_per_insert
+        rows share one INSERT statement, unless it grows past
+        MAX_INSERT_LENGTH first.
+        """
         try:
             db_path = self.params['database']
             
-            with open(file_path, 'w') as f:
-                # Add header
-                f.write(f"-- SQLite database export from DBridge\n")
-                f.write(f"-- Exported on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"-- Database: {os.path.basename(db_path)}\n\n")
-                
-                # Get list of tables to export
-                if tables is None:
-                    tables = self.get_tables()
-                
-                # Export each table
-                for table in tables:
-                    # Get table schema
-                    schema_query = f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table}';"
-                    schema_result = self.execute_query(schema_query)
-                    
-                    if not schema_result.empty:
-                        create_table_sql = schema_result.iloc[0, 0]
-                        f.write(f"{create_table_sql};\n\n")
-                    
-                    # Get table data
-                    data_query = f"SELECT * FROM {table};"
-                    data = self.execute_query(data_query)
+            # Get list of tables to export
+            if tables is None:
+                tables = self.get_tables()
+            
+            raw_connection = self.engine.raw_connection()
+            try:
+                cursor = raw_connection.cursor()
+                with open_export_file(file_path, compress) as f:
+                    # Add header
+                    f.write(f"-- SQLite database export from DBridge\n")
+                    f.write(f"-- Exported on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write(f"-- Database: {os.path.basename(db_path)}\n\n")
+                    f.write("BEGIN TRANSACTION;\n\n")
                     
-                    if not data.empty:
+                    # Export each table
+                    for table in tables:
+                        quoted_table = self.quote_ident(table)
+                        
+                        # Get table schema
+                        cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?;", (table,))
+                        schema_row = cursor.fetchone()
+                        if schema_row is not None:
+                            f.write(f"{schema_row[0]};\n\n")
+                        
+                        # Get table data
+                        cursor.execute(self.select_all_query(table))
+                        rows = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+                        if not rows:
+                            continue
+                        
                         f.write(f"-- Data for table {table}\n")
                         
-                        # Generate INSERT statements
-                        for _, row in data.iterrows():
-                            values = []
-                            for val in row:
-                                if pd.isna(val):
-                                    values.append("NULL")
-                                elif isinstance(val, (int, float)):
-                                    values.append(str(val))
-                                else:
-                                    # Escape single quotes in string values
-                                    val_str = str(val).replace("'", "''")
-                                    values.append(f"'{val_str}'")
-                            
-                            f.write(f"INSERT INTO {table} VALUES ({', '.join(values)});\n")
+                        # Generate multi-row INSERT statements
+                        batch = []
+                        batch_length = 0
+                        while rows:
+                            for row in rows:
+                                values = "(" + ", ".join(_sql_literal(value) for value in row) + ")"
+                                batch.append(values)
+                                batch_length += len(values)
+                                if len(batch) >= rows_per_insert or batch_length >= MAX_INSERT_LENGTH:
+                                    f.write(f"INSERT INTO {quoted_table} VALUES {', '.join(batch)};\n")
+                                    batch.clear()
+                                    batch_length = 0
+                            rows = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+                        if batch:
+                            f.write(f"INSERT INTO {quoted_table} VALUES {', '.join(batch)};\n")
                         
                         f.write("\n")
+                    
+                    f.write("COMMIT;\n")
+                cursor.close()
+            finally:
+                raw_connection.close()
             
             return True
         except Exception as e:
             print(f"SQLite export error: {e}")
             raise
     
-    def _export_mysql_to_sql(self, file_path, tables=None):
+    def _export_mysql_to_sql(self, file_path, tables=None, compress=False):
         """Export MySQL database to SQL file using mysqldump"""
         try:
-            # Check if mysqldump is available
-            try:
-                subprocess.run(['mysqldump', '--version'], capture_output=True, check=True)
-            except (subprocess.SubprocessError, FileNotFoundError):
+            # Check if mysqldump is available, without starting it
+            if shutil.which('mysqldump') is None:
                 raise RuntimeError("mysqldump utility not found. Please install MySQL client tools.")
             
             # Build mysqldump command
@@ -497,22 +1067,26 @@ class DatabaseConnection:
                 cmd.append('--databases')
                 cmd.append(self.params['database'])
             
-            # Run mysqldump and save output to file
-            with open(file_path, 'w') as f:
-                subprocess.run(cmd, stdout=f, env=env, check=True)
+            if compress:
+                # Compress the dump on its way from mysqldump to the file
+                with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as raw, \
+                        gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=EXPORT_GZIP_LEVEL) as gz:
+                    self._run_client_tool(cmd, output=gz, env=env)
+            else:
+                # Run mysqldump with its stdout going straight to the file
+                with open(file_path, 'wb') as f:
+                    self._run_client_tool(cmd, stdout=f, env=env)
             
             return True
         except Exception as e:
             print(f"MySQL export error: {e}")
             raise
     
-    def _export_postgresql_to_sql(self, file_path, tables=None):
+    def _export_postgresql_to_sql(self, file_path, tables=None, compress=False):
         """Export PostgreSQL database to SQL file using pg_dump"""
         try:
-            # Check if pg_dump is available
-            try:
-                subprocess.run(['pg_dump', '--version'], capture_output=True, check=True)
-            except (subprocess.SubprocessError, FileNotFoundError):
+            # Check if pg_dump is available, without starting it
+            if shutil.which('pg_dump') is None:
                 raise RuntimeError("pg_dump utility not found. Please install PostgreSQL client tools.")
             
             # Create a temporary password file for pg_dump
@@ -541,9 +1115,13 @@ class DatabaseConnection:
                     for table in tables:
                         cmd.extend(['--table', table])
                 
-                # Run pg_dump and save output to file
-                with open(file_path, 'w') as f:
-                    subprocess.run(cmd, stdout=f, env=env, check=True)
+                # pg_dump gzips plain text output itself
+                if compress:
+                    cmd.append(f'--compress={EXPORT_GZIP_LEVEL}')
+                
+                # Run pg_dump with its stdout going straight to the file
+                with open(file_path, 'wb') as f:
+                    self._run_client_tool(cmd, stdout=f, env=env)
                 
                 return True
             finally:
@@ -554,6 +1132,120 @@ class DatabaseConnection:
             print(f"PostgreSQL export error: {e}")
             raise
     
+    def export_table_to_csv(self, table_name, file_path, compress=False):
+        """
+        Export a single table to a CSV file
+        
+        Args:
+            table_name (str): Name of the table to export
+            file_path (str): Path to save the CSV file
+            compress (bool, optional): Gzip the CSV file
+            
+        Returns:
+            bool: True if export was successful
+            
+        Raises:
+            ValueError: If database connection is not established
+        """
+        if self.engine is None:
+            raise ValueError("Database connection is not established")
+        
+        with open_export_file(file_path, compress) as f:
+            self.write_table_csv(table_name, f)
+        return True
+    
+    def write_table_csv(self, table_name, f):
+        """
+        Stream a table as CSV into an open text file
+        
+        Rows are streamed from the driver straight into the file instead of
+        being loaded into a DataFrame first.
+        
+        Args:
+            table_name (str): Name of the table to export
+            f: Text file opened with newline=''
+            
+        Raises:
+            ValueError: If database connection is not established
+        """
+        if self.engine is None:
+            raise ValueError("Database connection is not established")
+        
+        db_type = self.params['type']
+        query = self.select_all_query(table_name)
+        
+        raw_connection = self.engine.raw_connection()
+        try:
+            if db_type == 'MySQL':
+                # Unbuffered cursor so rows are fetched as they are written
+                import pymysql.cursors
+                cursor = raw_connection.cursor(pymysql.cursors.SSCursor)
+            else:
+                cursor = raw_connection.cursor()
+            
+            # Close the cursor before the connection goes back to the pool,
+            # also when the export fails with rows left unread
+            with closing(cursor):
+                if db_type == 'PostgreSQL':
+                    # Let the server produce the CSV and copy it out directly.
+                    # With a binary buffer under f the server encodes the CSV as
+                    # UTF-8 and the bytes are written without decoding them.
+                    target = getattr(f, 'buffer', None)
+                    if target is None:
+                        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH CSV HEADER", f)
+                    else:
+                        f.flush()
+                        cursor.copy_expert(
+                            f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER, ENCODING 'UTF8')", target
+                        )
+                else:
+                    cursor.execute(query)
+                    writer = csv.writer(f, lineterminator='\n')
+                    writer.writerow([column[0] for column in cursor.description])
+                    writer.writerows(cursor)
+        finally:
+            raw_connection.close()
+    
+    def export_table_to_excel(self, table_name, file_path):
+        """
+        Export a single table to an Excel file
+        
+        Args:
+            table_name (str): Name of the table to export
+            file_path (str): Path to save the Excel file
+            
+        Returns:
+            bool: True if export was successful
+        """
+        with open_excel_writer(file_path) as writer:
+            self.write_table_to_sheet(writer, table_name)
+        return True
+    
+    def write_table_to_sheet(self, writer, table_name, sheet_name=None):
+        """
+        Stream a table into a sheet of an open ExcelWriter
+        
+        The table is read in chunks of EXPORT_CHUNK_SIZE rows which are appended
+        to the same sheet, so the whole table is never held in memory at once.
+        
+        Args:
+            writer (pd.ExcelWriter): Writer to add the sheet to
+            table_name (str): Name of the table to export
+            sheet_name (str, optional): Sheet name, defaults to the table name
+            
+        Raises:
+            ValueError: If database connection is not established
+        """
+        if self.engine is None:
+            raise ValueError("Database connection is not established")
+        
+        # Excel limits sheet names to 31 chars
+        sheet_name = (sheet_name or table_name)[:31]
+        query = self.select_all_query(table_name)
+        
+        chunks = pd.read_sql(query, self.engine, chunksize=EXPORT_CHUNK_SIZE)
+        write_frames_to_sheet(writer, chunks, sheet_name)
+    
     def import_sql_file(self, file_path):
         """
         Import a SQL file into the database
@@ -633,7 +1325,7 @@ class DatabaseConnection:
             
             # Run mysql client with input from file
             with open(file_path, 'r') as f:
-                subprocess.run(cmd, stdin=f, env=env, check=True)
+                self._run_client_tool(cmd, stdin=f, env=env)
             
             return True
         except Exception as e:
@@ -671,7 +1363,7 @@ class DatabaseConnection:
                 ]
                 
                 # Run psql
-                subprocess.run(cmd, env=env, check=True)
+                self._run_client_tool(cmd, env=env)
                 
                 return True
             finally:
@@ -842,14 +1534,20 @@ class MongoConnection:
             return self.db.name
         return "(No database selected)"
 
-    def get_tables(self) -> List[str]:
-        return self.get_collections()
+    def _database(self, database: Optional[str] = None):
+        if database is None or self.client is None:
+            return self.db
+        return self.client[database]
 
-    def get_collections(self) -> List[str]:
-        if self.db is None:
+    def get_tables(self, database: Optional[str] = None) -> List[str]:
+        return self.get_collections(database)
+
+    def get_collections(self, database: Optional[str] = None) -> List[str]:
+        db = self._database(database)
+        if db is None:
             return []
         try:
-            return self.db.list_collection_names()
+            return db.list_collection_names()
         except Exception as e:
             print(f"Error getting collections: {e}")
             return []
@@ -857,11 +1555,12 @@ class MongoConnection:
     def get_views(self) -> List[str]:
         return []
 
-    def get_columns(self, collection_name: str) -> List[Dict[str, Any]]:
-        if self.db is None:
+    def get_columns(self, collection_name: str, database: Optional[str] = None) -> List[Dict[str, Any]]:
+        db = self._database(database)
+        if db is None:
             return []
         try:
-            collection = self.db[collection_name]
+            collection = db[collection_name]
             docs = list(collection.find({}, limit=10))
             if not docs:
                 return [{'name': '_id', 'type': 'ObjectId'}]
@@ -875,17 +1574,32 @@ class MongoConnection:
             print(f"Error getting fields for collection '{collection_name}': {e}")
             return []
 
+    def get_all_columns(self, database: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        # Fields are sampled from documents, so there is no single metadata query
+        return {
+            collection: self.get_columns(collection, database)
+            for collection in self.get_collections(database)
+        }
+
+    def get_table_row_counts(self, tables: List[str]) -> Dict[str, int]:
+        db = self._database()
+        if db is None:
+            return {}
+        # Estimates come from the collection metadata, no documents are read
+        return {collection: db[collection].estimated_document_count() for collection in tables}
+
     def get_primary_key(self, collection_name: str) -> List[str]:
         return ['_id']
 
     def get_foreign_keys(self, collection_name: str) -> List[Any]:
         return []
 
-    def get_indexes(self, collection_name: str) -> List[Dict[str, Any]]:
-        if self.db is None:
+    def get_indexes(self, collection_name: str, database: Optional[str] = None) -> List[Dict[str, Any]]:
+        db = self._database(database)
+        if db is None:
             return []
         try:
-            collection = self.db[collection_name]
+            collection = db[collection_name]
             indexes = list(collection.list_indexes())
             return [
                 {'name': idx.get('name', ''), 'columns': list(idx.get('key', {}).keys())}
@@ -895,6 +1609,13 @@ class MongoConnection:
             print(f"Error getting indexes for collection '{collection_name}': {e}")
             return []
 
+    def get_all_indexes(self, database: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        # Indexes are listed per collection, so there is no single metadata query
+        return {
+            collection: self.get_indexes(collection, database)
+            for collection in self.get_collections(database)
+        }
+
     def get_available_databases(self) -> List[str]:
         if self.client is None:
             return []
@@ -944,8 +1665,7 @@ class MongoConnection:
             return False
 
     def is_system_database(self, database_name: str) -> bool:
-        system_databases = ['admin', 'local', 'config']
-        return database_name.lower() in system_databases
+        return database_name.lower() in MONGO_SYSTEM_DATABASES
 
     def can_create_database(self) -> bool:
         return self.user_permissions.get('can_create_database', False)
@@ -956,15 +1676,17 @@ class MongoConnection:
     def is_admin(self) -> bool:
         return self.user_permissions.get('is_admin', False)
 
-    def create_collection(self, collection_name: str) -> None:
-        if self.db is None:
+    def create_collection(self, collection_name: str, database: Optional[str] = None) -> None:
+        db = self._database(database)
+        if db is None:
             raise ValueError("No database selected")
-        self.db.create_collection(collection_name)
+        db.create_collection(collection_name)
 
-    def drop_collection(self, collection_name: str) -> None:
-        if self.db is None:
+    def drop_collection(self, collection_name: str, database: Optional[str] = None) -> None:
+        db = self._database(database)
+        if db is None:
             raise ValueError("No database selected")
-        self.db[collection_name].drop()
+        db[collection_name].drop()
 
     def create_database(self, database_name: str) -> None:
         if self.client is None:
@@ -977,7 +1699,8 @@ class MongoConnection:
             raise ValueError("No client connection")
         self.client.drop_database(database_name)
 
-    def export_database_to_sql(self, file_path: str, tables: Optional[List[str]] = None) -> bool:
+    def export_database_to_sql(self, file_path: str, tables: Optional[List[str]] = None,
+                               rows_per_insert: int = DEFAULT_ROWS_PER_INSERT, compress: bool = False) -> bool:
         raise ValueError("SQL export is not supported for MongoDB connections")
 
     def import_sql_file(self, file_path: str) -> bool:
@@ -1005,11 +1728,29 @@ class MongoConnection:
             docs = list(self.db[coll_name].find({}))
             data[coll_name] = docs
 
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             json.dump(data, f, cls=MongoJSONEncoder, indent=2, ensure_ascii=False)
 
         return True
 
+    def export_table_to_csv(self, table_name: str, file_path: str, compress: bool = False) -> bool:
+        with open_export_file(file_path, compress) as f:
+            self.write_table_csv(table_name, f)
+        return True
+
+    def write_table_csv(self, table_name: str, f) -> None:
+        df = self.execute_query(json.dumps({"collection": table_name}))
+        df.to_csv(f, index=False, lineterminator='\n')
+
+    def export_table_to_excel(self, table_name: str, file_path: str) -> bool:
+        with open_excel_writer(file_path) as writer:
+            self.write_table_to_sheet(writer, table_name)
+        return True
+
+    def write_table_to_sheet(self, writer: pd.ExcelWriter, table_name: str, sheet_name: Optional[str] = None) -> None:
+        df = self.execute_query(json.dumps({"collection": table_name}))
+        write_frames_to_sheet(writer, [df], (sheet_name or table_name)[:31])
+
     def import_from_json(self, file_path: str) -> bool:
         if self.db is None:
             raise ValueError("No database selected")
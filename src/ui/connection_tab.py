@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QTabWidget, QLabel,
     QMessageBox, QComboBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QSignalBlocker, pyqtSignal
 
 from src.ui.query_editor import QueryEditor
 from src.ui.results_view import ResultsView
@@ -185,9 +185,9 @@ class ConnectionTab(QWidget):
                 op = parsed.get('operation', 'find')
                 idx = self.mongodb_operation.findText(op)
                 if idx >= 0:
-                    self.mongodb_operation.blockSignals(True)
-                    self.mongodb_operation.setCurrentIndex(idx)
-                    self.mongodb_operation.blockSignals(False)
+                    # Blocked so the operation's template does not replace the query
+                    with QSignalBlocker(self.mongodb_operation):
+                        self.mongodb_operation.setCurrentIndex(idx)
             except (ValueError, AttributeError):
                 pass
 
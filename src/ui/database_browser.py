@@ -18,6 +18,7 @@ from PyQt6.QtGui import QStandardItemModel, QStandardItem, QIcon
 
 from src.ui.import_export_dialog import ImportExportDialog
 from src.ui.database_manager import DatabaseManagerDialog
+from src.ui.worker import run_in_background
 
 class DatabaseTreeModel(QStandardItemModel):
     """Tree model for displaying database structure"""
@@ -845,8 +846,13 @@ class DatabaseBrowser(QWidget):
         # Construct full file path
         file_path = os.path.join(directory, filename)
         
-        # Check if file exists and confirm overwrite
-        if os.path.exists(file_path):
+        # Reserve the file with a single exclusive create instead of a separate
+        # existence check, and only ask about overwriting when it is already there
+        created_file = False
+        try:
+            os.close(os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            created_file = True
+        except FileExistsError:
             confirm = QMessageBox.question(
                 self,
                 "File Exists",
@@ -857,48 +863,80 @@ class DatabaseBrowser(QWidget):
             
             if confirm != QMessageBox.StandardButton.Yes:
                 return
+        except OSError as e:
+            QMessageBox.critical(self, "Export Error", f"Cannot write to {file_path}: {str(e)}")
+            return
         
-        try:
-            # Show a progress dialog
-            from PyQt6.QtWidgets import QProgressDialog
-            from PyQt6.QtCore import Qt
-            
-            progress = QProgressDialog(f"Exporting table {table_name}...", "Cancel", 0, 100, self)
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.setValue(10)
-            
-            if format_type == "sql":
-                # SQL export for a single table
-                db_type = connection.params['type']
-                progress.setLabelText(f"Exporting {table_name} as SQL ({db_type})...")
-                connection.export_database_to_sql(file_path, [table_name])
-            else:
-                # CSV or Excel export
-                progress.setLabelText(f"Fetching data from {table_name}...")
-                data = connection.execute_query(f"SELECT * FROM {table_name}")
-                
-                progress.setValue(50)
-                progress.setLabelText(f"Writing {format_type.upper()} file...")
-                
-                if format_type == "csv":
-                    data.to_csv(file_path, index=False)
-                else:  # xlsx
-                    data.to_excel(file_path, index=False)
-            
+        # Show a progress dialog while the export runs on a pool thread
+        from PyQt6.QtWidgets import QProgressDialog
+        from PyQt6.QtCore import Qt
+        
+        if format_type == "sql":
+            db_type = connection.params['type']
+            label = f"Exporting {table_name} as SQL ({db_type})..."
+        else:
+            label = f"Exporting {table_name} as {format_type.upper()}..."
+        
+        progress = QProgressDialog(label, "Cancel", 0, 100, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        # The export cannot be interrupted once it is running
+        progress.setCancelButton(None)
+        # Only show the dialog if the export takes noticeably long, so small
+        # tables don't flash a window on screen
+        progress.setMinimumDuration(500)
+        progress.setAutoClose(True)
+        progress.setAutoReset(True)
+        
+        def on_finished(_):
             progress.setValue(100)
             QMessageBox.information(self, "Export Complete", f"Table '{table_name}' exported successfully to {file_path}")
-        except subprocess.CalledProcessError as e:
+        
+        def on_error(error):
+            progress.close()
+            if created_file:
+                self._discard_reserved_file(file_path)
+            self._show_export_error(error)
+        
+        run_in_background(
+            self._write_table_export, connection, table_name, format_type, file_path,
+            on_finished=on_finished, on_error=on_error
+        )
+    
+    def _write_table_export(self, connection, table_name, format_type, file_path):
+        """Write a single table to file_path
+        
+        Runs on a pool thread, so it must not touch any widgets.
+        """
+        if format_type == "sql":
+            # SQL export for a single table
+            connection.export_database_to_sql(file_path, [table_name])
+        elif format_type == "csv":
+            # CSV is streamed by the driver without building a DataFrame
+            connection.export_table_to_csv(table_name, file_path)
+        else:  # xlsx
+            connection.export_table_to_excel(table_name, file_path)
+    
+    def _show_export_error(self, error):
+        """Report a failed table export to the user"""
+        if isinstance(error, subprocess.CalledProcessError):
             # Handle command-line tool errors
-            error_msg = f"Export failed with error code {e.returncode}.\n\n"
+            error_msg = f"Export failed with error code {error.returncode}.\n\n"
             
-            if hasattr(e, 'stderr') and e.stderr:
-                error_details = e.stderr.decode('utf-8', errors='replace')
+            if hasattr(error, 'stderr') and error.stderr:
+                error_details = error.stderr.decode('utf-8', errors='replace')
                 error_msg += f"Error details:\n{error_details}"
             else:
                 error_msg += "No additional error details available."
-            
-            QMessageBox.critical(self, "Export Error", error_msg)
-        except Exception as e:
+        else:
             # Handle other errors
-            error_msg = f"Failed to export table: {str(e)}"
-            QMessageBox.critical(self, "Export Error", error_msg)
\ No newline at end of file
+            error_msg = f"Failed to export table: {str(error)}"
+        
+        QMessageBox.critical(self, "Export Error", error_msg)
+    
+    def _discard_reserved_file(self, file_path):
+        """Remove a file reserved by _export_table if the export never wrote to it"""
+        try:
+            if os.path.getsize(file_path) == 0:
+                os.remove(file_path)
+        except OSError:
+            pass
\ No newline at end of file
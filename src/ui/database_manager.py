@@ -7,53 +7,276 @@ from PyQt6.QtWidgets import (
     QListWidget, QLabel, QComboBox, QTableWidget, QTableWidgetItem,
     QCheckBox, QLineEdit, QMessageBox, QInputDialog, QDialogButtonBox,
     QGroupBox, QFormLayout, QSplitter, QMenuBar, QMenu, QScrollArea,
-    QTextEdit, QFrame, QSizePolicy, QToolButton
+    QTextEdit, QFrame, QSizePolicy, QToolButton, QAbstractItemView, QListView,
+    QStyledItemDelegate
 )
 from PyQt6.QtGui import QAction, QFont
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QSignalBlocker, QTimer
 import sys
 import json
-from typing import Dict, Any, Union, Optional, List, cast
+import logging
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Any, Union, Optional, List
 
+from src.ui.worker import run_in_background
+
+
+logger = logging.getLogger(__name__)
 
 # Global test mode flag
 _TEST_MODE = False
 
+# Delay before a table selector change reloads the columns/indexes list, so
+# quickly stepping through tables only loads the one the user stops on
+TABLE_SELECTION_DEBOUNCE_MS = 80
+
+# How long a status message below the tabs stays visible
+STATUS_MESSAGE_TIMEOUT_MS = 3000
+
+# First SQLite version with ALTER TABLE ... DROP COLUMN
+SQLITE_DROP_COLUMN_VERSION = (3, 35, 0)
+
 # Dictionary to store original methods
 _original_methods = {}
 
+# Replacements installed in test mode: (class, attribute, stand-in), built once
+_test_overrides = (
+    (QMessageBox, 'information', lambda *args, **kwargs: QMessageBox.StandardButton.Ok),
+    (QMessageBox, 'warning', lambda *args, **kwargs: QMessageBox.StandardButton.Ok),
+    (QMessageBox, 'critical', lambda *args, **kwargs: QMessageBox.StandardButton.Ok),
+    (QMessageBox, 'question', lambda *args, **kwargs: QMessageBox.StandardButton.Yes),
+    (QInputDialog, 'getText', lambda *args, **kwargs: ("test_value", True)),
+    (QDialog, 'exec', lambda self: True),
+)
+
+# Whether the test overrides are currently installed
+_patched = False
+
 def set_global_test_mode(enabled=True):
     """Set test mode globally for all dialogs"""
-    global _TEST_MODE
+    global _TEST_MODE, _patched
     _TEST_MODE = enabled
     
+    # Nothing to do if the dialogs are already in the requested state
+    if enabled == _patched:
+        return
+    _patched = enabled
+    
     # Override QMessageBox and QInputDialog methods in test mode
     if enabled:
-        # Store original methods if not already stored
-        if not _original_methods:
-            _original_methods['information'] = QMessageBox.information
-            _original_methods['warning'] = QMessageBox.warning
-            _original_methods['critical'] = QMessageBox.critical
-            _original_methods['question'] = QMessageBox.question
-            _original_methods['getText'] = QInputDialog.getText
-            _original_methods['exec'] = QDialog.exec
-        
-        # Override with test versions
-        QMessageBox.information = lambda *args, **kwargs: QMessageBox.StandardButton.Ok
-        QMessageBox.warning = lambda *args, **kwargs: QMessageBox.StandardButton.Ok
-        QMessageBox.critical = lambda *args, **kwargs: QMessageBox.StandardButton.Ok
-        QMessageBox.question = lambda *args, **kwargs: QMessageBox.StandardButton.Yes
-        QInputDialog.getText = lambda *args, **kwargs: ("test_value", True)
-        QDialog.exec = lambda self: True
+        for owner, name, replacement in _test_overrides:
+            # Store original methods if not already stored
+            _original_methods.setdefault(name, getattr(owner, name))
+            setattr(owner, name, replacement)
     else:
-        # Restore original methods if they exist
-        if _original_methods:
-            QMessageBox.information = _original_methods['information']
-            QMessageBox.warning = _original_methods['warning']
-            QMessageBox.critical = _original_methods['critical']
-            QMessageBox.question = _original_methods['question']
-            QInputDialog.getText = _original_methods['getText']
-            QDialog.exec = _original_methods['exec']
+        # Restore original methods
+        for owner, name, _ in _test_overrides:
+            setattr(owner, name, _original_methods[name])
+
+
+@contextmanager
+def _bulk_update(widget):
+    """Suspend repaints, signals and sorting while a widget is refilled"""
+    with QSignalBlocker(widget):
+        widget.setUpdatesEnabled(False)
+        was_sorting = isinstance(widget, QListWidget) and widget.isSortingEnabled()
+        if was_sorting:
+            widget.setSortingEnabled(False)
+        try:
+            yield widget
+        finally:
+            if was_sorting:
+                widget.setSortingEnabled(True)
+            widget.setUpdatesEnabled(True)
+            if isinstance(widget, QAbstractItemView):
+                widget.viewport().update()
+
+
+def _selected_text(view, role=Qt.ItemDataRole.DisplayRole):
+    """Return the text of the selected row of a list view, or None
+    
+    Args:
+        view: List view to read the selection from
+        role: Item data role to read, e.g. UserRole for the name behind a label
+    """
+    selection_model = view.selectionModel()
+    if selection_model is None:
+        return None
+    indexes = selection_model.selectedIndexes()
+    return indexes[0].data(role) if indexes else None
+
+
+def _selected_texts(view, role=Qt.ItemDataRole.DisplayRole):
+    """Return the texts of all selected rows of a list view, top to bottom
+    
+    Args:
+        view: List view to read the selection from
+        role: Item data role to read
+    """
+    selection_model = view.selectionModel()
+    if selection_model is None:
+        return []
+    indexes = sorted(selection_model.selectedIndexes(), key=lambda index: index.row())
+    return [index.data(role) for index in indexes]
+
+
+# Column types that take a length, e.g. VARCHAR(255)
+_SIZED_TYPES = frozenset(("VARCHAR", "CHAR", "NVARCHAR", "NCHAR"))
+
+# Sized column types whose length is an upper bound rather than fixed
+_VARYING_TYPES = frozenset(("VARCHAR", "NVARCHAR"))
+
+# Length filled in when a sized type is picked in AddColumnDialog
+_DEFAULT_LENGTHS = {
+    'VARCHAR': '255',
+    'NVARCHAR': '255',
+    'CHAR': '1',
+    'NCHAR': '1',
+}
+
+# Column types that take a size and a precision, e.g. DECIMAL(10,2)
+_PRECISION_TYPES = frozenset(("DECIMAL", "NUMERIC", "FLOAT", "DOUBLE"))
+
+# Format specs for numeric defaults by number of decimals; larger
+# precisions are clamped to the last one
+_DECIMAL_FORMATS = tuple(f".{decimals}f" for decimals in range(31))
+
+# Full type used when a sized type is chosen without a size
+_DEFAULT_TYPE_SIZES = {
+    'VARCHAR': 'VARCHAR(255)',
+    'DOUBLE': 'DOUBLE(10,2)',
+    'DECIMAL': 'DECIMAL(10,2)',
+}
+
+
+def _build_column_sql(column):
+    """Build the definition of one column of a CREATE TABLE statement"""
+    parts = [column['name'], _DEFAULT_TYPE_SIZES.get(column['type'], column['type'])]
+    if not column['nullable']:
+        parts.append("NOT NULL")
+    if column['primary_key']:
+        parts.append("PRIMARY KEY")
+    return " ".join(parts)
+
+
+def _build_create_table_sql(table, columns):
+    """Build a CREATE TABLE statement
+    
+    Args:
+        table: Quoted table name
+        columns: Column definitions as returned by CreateTableDialog
+    """
+    column_defs = ",\n".join(_build_column_sql(column) for column in columns)
+    return f"CREATE TABLE {table} (\n{column_defs}\n);"
+
+
+def _build_mysql_alter(table, current_column, new_column):
+    """Build the statements that change a MySQL column to new_column"""
+    parts = ["ALTER TABLE", table, "MODIFY COLUMN", new_column['name'], new_column['type']]
+    if not new_column['nullable']:
+        parts.append("NOT NULL")
+    if new_column['default'] is not None:
+        parts.append(f"DEFAULT {new_column['default']}")
+    return [" ".join(parts) + ";"]
+
+
+def _build_pg_alter(table, current_column, new_column):
+    """Build the statements that change a PostgreSQL column to new_column
+    
+    PostgreSQL changes the name, type, nullability and default of a column
+    with separate clauses, so one statement is returned for each.
+    """
+    statements = []
+    if new_column['name'] != current_column['name']:
+        statements.append(
+            f"ALTER TABLE {table} RENAME COLUMN {current_column['name']} TO {new_column['name']};"
+        )
+    
+    alter_column = f"ALTER TABLE {table} ALTER COLUMN {new_column['name']}"
+    statements.append(f"{alter_column} TYPE {new_column['type']};")
+    if not new_column['nullable']:
+        statements.append(f"{alter_column} SET NOT NULL;")
+    if new_column['default'] is not None:
+        statements.append(f"{alter_column} SET DEFAULT {new_column['default']};")
+    return statements
+
+
+# Table created by _create_table in test mode instead of asking the user
+_TEST_TABLE_DEFINITION = {
+    'name': 'test_table',
+    'columns': [
+        {'name': 'id', 'type': 'INTEGER', 'primary_key': True, 'nullable': False},
+        {'name': 'name', 'type': 'TEXT', 'primary_key': False, 'nullable': True}
+    ]
+}
+
+
+# Builders of the statements that modify a column, by database type
+_ALTER_COLUMN_BUILDERS = {
+    'MySQL': _build_mysql_alter,
+    'PostgreSQL': _build_pg_alter,
+}
+
+# Types offered for the columns of a new table
+_CREATE_TABLE_TYPES = (
+    "INTEGER", "BIGINT", "SMALLINT", "TINYINT",
+    "FLOAT", "DOUBLE(10,2)", "DECIMAL(10,2)",
+    "CHAR(1)", "VARCHAR(255)", "TEXT",
+    "DATE", "TIME", "DATETIME", "TIMESTAMP",
+    "BOOLEAN", "BLOB"
+)
+
+
+class StringListModel(QAbstractListModel):
+    """Read-only list model over a Python list of strings
+    
+    Unlike QStringListModel the list is kept as given instead of being copied
+    into a QStringList, so the cached column labels can be shown as they are.
+    Each row can also carry a key, returned for UserRole, such as the column
+    name behind a "name (type)" label.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._data = []
+        self._keys = None
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows"""
+        if parent.isValid():
+            return 0
+        return len(self._data)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the string at the given index"""
+        if not index.isValid():
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._data[index.row()]
+        
+        if role == Qt.ItemDataRole.UserRole:
+            keys = self._data if self._keys is None else self._keys
+            return keys[index.row()]
+        
+        return None
+    
+    def items(self):
+        """Return the strings shown by the model"""
+        return self._data
+    
+    def set_data(self, items, keys=None):
+        """Replace the strings with a single model reset; items must not be modified afterwards
+        
+        Args:
+            items: Strings to show
+            keys: Value returned for UserRole per row, defaults to the strings
+        """
+        self.beginResetModel()
+        self._data = items
+        self._keys = keys
+        self.endResetModel()
 
 
 class DatabaseTab(QWidget):
@@ -72,7 +295,8 @@ class TablesTab(QWidget):
 class ColumnsTab(QWidget):
     """Tab for columns management"""
     table_selector: QComboBox
-    columns_list: QListWidget
+    columns_list: QListView
+    columns_model: StringListModel
     add_column_button: QPushButton
     modify_column_button: QPushButton
     drop_column_button: QPushButton
@@ -80,7 +304,8 @@ class ColumnsTab(QWidget):
 class IndexesTab(QWidget):
     """Tab for indexes management"""
     table_selector: QComboBox
-    indexes_list: QListWidget
+    indexes_list: QListView
+    indexes_model: StringListModel
     create_index_button: QPushButton
     drop_index_button: QPushButton
 
@@ -98,6 +323,11 @@ class DatabaseManagerDialog(QDialog):
     # Class variable to control test mode
     _test_mode = False
     
+    # Positions of the tabs whose lists are loaded lazily
+    DATABASES_TAB_INDEX = 0
+    COLUMNS_TAB_INDEX = 2
+    INDEXES_TAB_INDEX = 3
+    
     # Tab widgets with proper type annotations
     database_tab: DatabaseTab
     tables_tab: TablesTab
@@ -114,18 +344,156 @@ class DatabaseManagerDialog(QDialog):
         super().__init__(parent)
         
         self.connection = connection
+        self._db_type = connection.params.get('type')
         self._debug_mode = debug_mode  # Add debug mode flag
+        
+        # Metadata fetched from the server, keyed by (kind, database)
+        self._db_cache = {}
+        
+        # Row of each name in the database selector and the table selectors,
+        # built when they are filled
+        self._db_index = {}
+        self._table_index = {}
+        
+        # Columns/indexes tabs whose list must be reloaded when next shown
+        self._stale_tabs = set()
+        
+        # Database selected while the databases tab was shown, whose tables
+        # are loaded once another tab is opened
+        self._pending_tables_db = None
+        
+        # (database, table) currently shown in the columns and indexes lists
+        self._last_columns_table = None
+        self._last_indexes_table = None
+        
+        # Table and column dialogs, created on first use and reset when reused
+        self._create_table_dialog = None
+        self._column_dialog = None
+        
+        # Whether the system database notice was shown for the current selection
+        self.system_db_warning_shown = False
+        
+        # Whether the dialog was shown before, so showing it again reloads
+        # metadata that may have changed in the meantime
+        self._shown_before = False
+        
         self.setWindowTitle("Database Manager")
         self.resize(800, 600)
         
         self._create_ui()
-        self._populate_data()
-        self._connect_signals()
+        self._load_data()
         
         # Don't show the dialog in test mode
         if self._test_mode:
             self.setVisible(False)
     
+    def _load_data(self):
+        """Fill the widgets and connect their signals once the metadata is available
+        
+        The initial database and table lists are fetched on a pool thread so
+        opening the dialog does not freeze the UI on a slow server. The tabs
+        stay disabled until then, so nothing else uses the connection while
+        the fetch is running.
+        """
+        if _TEST_MODE or self._test_mode:
+            self._on_initial_metadata_loaded()
+            return
+        
+        self.tabs.setEnabled(False)
+        run_in_background(
+            self._prefetch_initial_metadata,
+            on_finished=self._on_initial_metadata_loaded,
+            on_error=self._on_initial_metadata_loaded
+        )
+    
+    def showEvent(self, event):
+        """Reload the metadata when a reused dialog is shown again"""
+        if self._shown_before:
+            self.reload_metadata()
+        self._shown_before = True
+        super().showEvent(event)
+    
+    def _prefetch_initial_metadata(self):
+        """Warm the metadata cache. Runs on a pool thread and must not touch widgets."""
+        self._get_databases_cached()
+        
+        current_db = self.connection.get_database_name()
+        if current_db != "(No database selected)":
+            self._get_tables_cached(current_db)
+    
+    def _on_initial_metadata_loaded(self, _result=None):
+        """Populate the widgets from the warmed cache
+        
+        Also called when the prefetch failed; the populate methods then fetch
+        again and report the error as usual.
+        """
+        self.tabs.setEnabled(True)
+        self._populate_data()
+        self._connect_signals()
+    
+    def _run_ddl(self, on_done, error_message, fn, *args, **kwargs):
+        """Execute a DDL call on a pool thread and refresh the widgets afterwards
+        
+        The tabs stay disabled while the statement runs, so nothing else uses
+        the connection in the meantime. In test mode the call runs directly.
+        
+        Args:
+            on_done: Called without arguments on the UI thread after success
+            error_message: Start of the message shown if the call fails
+            fn: Connection method that executes the statement
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        def on_finished(_result):
+            self.tabs.setEnabled(True)
+            on_done()
+        
+        def on_error(error):
+            self.tabs.setEnabled(True)
+            if not self._test_mode:
+                QMessageBox.critical(self, "Error", f"{error_message}: {str(error)}")
+        
+        if _TEST_MODE or self._test_mode:
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                on_error(e)
+            else:
+                on_finished(result)
+            return
+        
+        self.tabs.setEnabled(False)
+        run_in_background(fn, *args, on_finished=on_finished, on_error=on_error, **kwargs)
+    
+    def _confirm_drop(self, text, on_confirmed):
+        """Ask the user to confirm a drop and call on_confirmed if they agree
+        
+        The question is shown with QMessageBox.open() instead of a blocking
+        QMessageBox.question(), so no nested event loop runs while it is up.
+        In test mode the drop is confirmed without asking.
+        
+        Args:
+            text: Question shown to the user
+            on_confirmed: Called without arguments when the user answers Yes
+        """
+        if self._test_mode:
+            on_confirmed()
+            return
+        
+        box = QMessageBox(
+            QMessageBox.Icon.Question, "Confirm Drop", text,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self
+        )
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        
+        def on_finished(_result):
+            if box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Yes:
+                on_confirmed()
+        
+        box.finished.connect(on_finished)
+        box.open()
+    
     def _create_ui(self):
         """Create the UI components"""
         layout = QVBoxLayout(self)
@@ -143,7 +511,7 @@ class DatabaseManagerDialog(QDialog):
         self.add_record_tab = self._create_add_record_tab()
         
         # Add tabs to the tab widget
-        is_mongodb = self.connection.params.get('type') == 'MongoDB'
+        is_mongodb = self._db_type == 'MongoDB'
         self.tabs.addTab(self.database_tab, "Databases")
         self.tabs.addTab(self.tables_tab, "Collections" if is_mongodb else "Tables")
         self.tabs.addTab(self.columns_tab, "Fields" if is_mongodb else "Columns")
@@ -152,6 +520,22 @@ class DatabaseManagerDialog(QDialog):
         
         layout.addWidget(self.tabs)
         
+        # Errors from loading metadata are shown here instead of in a modal box
+        self._error_label = QLabel()
+        self._error_label.setWordWrap(True)
+        self._error_label.setStyleSheet("color: #b00020;")
+        self._error_label.setVisible(False)
+        layout.addWidget(self._error_label)
+        
+        # Results of repeatable actions are shown here so they need no click
+        self._status_label = QLabel()
+        self._status_label.setVisible(False)
+        layout.addWidget(self._status_label)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_MESSAGE_TIMEOUT_MS)
+        self._status_timer.timeout.connect(self._clear_status)
+        
         # Add dialog buttons
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
@@ -192,7 +576,7 @@ class DatabaseManagerDialog(QDialog):
         tab = TablesTab()
         layout = QVBoxLayout(tab)
 
-        is_mongodb = self.connection.params.get('type') == 'MongoDB'
+        is_mongodb = self._db_type == 'MongoDB'
         entity_label = "Collection" if is_mongodb else "Table"
 
         # Database selector
@@ -237,7 +621,7 @@ class DatabaseManagerDialog(QDialog):
         
         # Columns list
         layout.addWidget(QLabel("Columns:"))
-        columns_list = QListWidget()
+        columns_list, columns_model = self._create_string_list_view()
         layout.addWidget(columns_list)
         
         # Buttons
@@ -253,12 +637,27 @@ class DatabaseManagerDialog(QDialog):
         # Store references to the widgets
         tab.table_selector = table_selector
         tab.columns_list = columns_list
+        tab.columns_model = columns_model
         tab.add_column_button = add_column_button
         tab.modify_column_button = modify_column_button
         tab.drop_column_button = drop_column_button
         
         return tab
     
+    def _create_string_list_view(self):
+        """Create a list view backed by a string model
+        
+        Only the visible rows are laid out and painted, and the whole list is
+        replaced with one model reset, which keeps tables with many columns
+        or indexes responsive.
+        """
+        view = QListView()
+        model = StringListModel(view)
+        view.setModel(model)
+        view.setUniformItemSizes(True)
+        view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        return view, model
+    
     def _create_indexes_tab(self):
         """Create the indexes management tab"""
         tab = IndexesTab()
@@ -273,7 +672,9 @@ class DatabaseManagerDialog(QDialog):
         
         # Indexes list
         layout.addWidget(QLabel("Indexes:"))
-        indexes_list = QListWidget()
+        indexes_list, indexes_model = self._create_string_list_view()
+        # Several indexes can be dropped at once
+        indexes_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         layout.addWidget(indexes_list)
         
         # Buttons
@@ -287,6 +688,7 @@ class DatabaseManagerDialog(QDialog):
         # Store references to the widgets
         tab.table_selector = table_selector
         tab.indexes_list = indexes_list
+        tab.indexes_model = indexes_model
         tab.create_index_button = create_index_button
         tab.drop_index_button = drop_index_button
         
@@ -297,7 +699,7 @@ class DatabaseManagerDialog(QDialog):
         tab = AddRecordTab()
         layout = QVBoxLayout(tab)
 
-        is_mongodb = self.connection.params.get('type') == 'MongoDB'
+        is_mongodb = self._db_type == 'MongoDB'
         entity_label = "Collection" if is_mongodb else "Table"
 
         # Table/collection selector row
@@ -357,6 +759,8 @@ class DatabaseManagerDialog(QDialog):
     
     def _populate_data(self):
         """Populate the UI with data from the database"""
+        self._clear_error()
+        
         # Populate databases list
         self._populate_databases()
         
@@ -370,7 +774,7 @@ class DatabaseManagerDialog(QDialog):
         current_db = self.connection.get_database_name()
         if current_db != "(No database selected)":
             # Make sure tables are populated
-            self._populate_tables(current_db)
+            self._refresh_tables_for_db(current_db)
             
             # If there are tables, select the first one and populate its columns
             if self.tables_tab.tables_list.count() > 0:
@@ -381,17 +785,16 @@ class DatabaseManagerDialog(QDialog):
                     selected_table = first_item.text()
                     
                     # Update the table selectors in columns and indexes tabs
-                    index = self.columns_tab.table_selector.findText(selected_table)
+                    index = self._find_row(self.columns_tab.table_selector, self._table_index, selected_table)
                     if index >= 0:
                         self.columns_tab.table_selector.setCurrentIndex(index)
                     
-                    index = self.indexes_tab.table_selector.findText(selected_table)
+                    index = self._find_row(self.indexes_tab.table_selector, self._table_index, selected_table)
                     if index >= 0:
                         self.indexes_tab.table_selector.setCurrentIndex(index)
                     
-                    # Explicitly populate columns and indexes for the selected table
-                    self._populate_columns(selected_table)
-                    self._populate_indexes(selected_table)
+                    # Load columns and indexes for the selected table once their tab is shown
+                    self._invalidate_table_details()
             
             # Populate the Add Record tab table selector
             self._populate_add_record_table_selector()
@@ -402,144 +805,248 @@ class DatabaseManagerDialog(QDialog):
             # Still populate the Add Record tab table selector (may be empty)
             self._populate_add_record_table_selector()
     
+    def _get_databases_cached(self):
+        """Return the available databases, fetching them only on a cache miss"""
+        key = ('databases', None)
+        if key not in self._db_cache:
+            self._db_cache[key] = self.connection.get_available_databases()
+        return self._db_cache[key]
+    
+    def _get_tables_cached(self, database_name):
+        """Return the tables of a database, fetching them only on a cache miss"""
+        key = ('tables', database_name)
+        if key not in self._db_cache:
+            self._db_cache[key] = self.connection.get_tables(database=database_name)
+        return self._db_cache[key]
+    
+    def _get_columns_cached(self, database_name, table_name):
+        """Return the columns of a table
+        
+        The columns of every table in the database are loaded in one pass on
+        first use, so browsing tables does not hit the server again.
+        """
+        key = ('columns', database_name)
+        if key not in self._db_cache:
+            self._db_cache[key] = self.connection.get_all_columns(database=database_name)
+        
+        columns = self._db_cache[key].get(table_name)
+        if columns is None:
+            # Not part of the bulk result (e.g. a table without columns)
+            columns = self.connection.get_columns(table_name, database=database_name)
+        return columns
+    
+    def _get_indexes_cached(self, database_name, table_name):
+        """Return the indexes of a table
+        
+        Like the columns, the indexes of every table in the database are
+        loaded with a single query on first use.
+        """
+        key = ('indexes', database_name)
+        if key not in self._db_cache:
+            self._db_cache[key] = self.connection.get_all_indexes(database=database_name)
+        return self._db_cache[key].get(table_name, [])
+    
+    def _get_column_labels_cached(self, database_name, table_name):
+        """Return the 'name (type)' labels shown for the columns of a table
+        
+        The labels are built once per table and kept with the cached columns,
+        so selecting the table again hands the same list to the model.
+        """
+        labels_by_table = self._db_cache.setdefault(('column_labels', database_name), {})
+        labels = labels_by_table.get(table_name)
+        if labels is None:
+            columns = self._get_columns_cached(database_name, table_name)
+            labels = [f"{column['name']} ({column['type']})" for column in columns]
+            labels_by_table[table_name] = labels
+        return labels
+    
+    def _get_column_cached(self, database_name, table_name, column_name):
+        """Return the definition of a single column, or None
+        
+        The name-to-column map of a table is built once from the cached
+        columns and dropped together with them.
+        """
+        columns_by_table = self._db_cache.setdefault(('column_map', database_name), {})
+        columns = columns_by_table.get(table_name)
+        if columns is None:
+            columns = {column['name']: column for column in self._get_columns_cached(database_name, table_name)}
+            columns_by_table[table_name] = columns
+        return columns.get(column_name)
+    
+    def _invalidate_db_cache(self, database_name=None, kind=None):
+        """Drop cached metadata after a structural change
+        
+        Args:
+            database_name: Database whose tables changed, or None when the
+                list of databases itself changed
+            kind: 'tables', 'columns' or 'indexes' to drop only that entry
+                of the database, None for all of them. The column labels and
+                maps are dropped together with the columns, and so are the
+                indexes, which change when an indexed column is dropped.
+        """
+        if database_name is None:
+            self._db_cache.pop(('databases', None), None)
+            return
+            
+        for cached_kind in (kind,) if kind else ('tables', 'columns', 'indexes'):
+            self._db_cache.pop((cached_kind, database_name), None)
+            if cached_kind == 'columns':
+                self._db_cache.pop(('column_labels', database_name), None)
+                self._db_cache.pop(('column_map', database_name), None)
+                self._db_cache.pop(('indexes', database_name), None)
+    
+    def reload_metadata(self):
+        """Drop all cached metadata and fill the lists again
+        
+        Databases and tables can be created or dropped outside the dialog,
+        e.g. from the query editor, so this runs whenever the dialog is shown
+        again and when the main window refreshes its views. While a fetch or
+        DDL statement is running only the cache is dropped; its completion
+        fills the lists.
+        """
+        self._db_cache.clear()
+        self._last_columns_table = None
+        self._last_indexes_table = None
+        if not self.tabs.isEnabled():
+            return
+        
+        self._clear_error()
+        self._populate_databases()
+        self._populate_db_selector()
+        self._invalidate_table_details()
+    
     def _populate_databases(self):
         """Populate the databases list"""
-        self.database_tab.databases_list.clear()
+        databases_list = self.database_tab.databases_list
+        databases = []
         
         try:
-            databases = self.connection.get_available_databases()
+            databases = self._get_databases_cached()
             
             # Filter out system databases if the option is disabled
             if not self.connection.connection_manager.get_show_system_databases():
                 databases = [db for db in databases if not self.connection.is_system_database(db)]
-                
-            for db in databases:
-                self.database_tab.databases_list.addItem(db)
-                
-            # Select the current database in the list if one is selected
-            current_db = self.connection.get_database_name()
-            if current_db != "(No database selected)":
-                items = self.database_tab.databases_list.findItems(current_db, Qt.MatchFlag.MatchExactly)
-                if items:
-                    self.database_tab.databases_list.setCurrentItem(items[0])
         except Exception as e:
-            if not self._test_mode:
-                QMessageBox.warning(self, "Error", f"Failed to retrieve databases: {str(e)}")
+            self._report_error(f"Failed to retrieve databases: {str(e)}")
+        
+        databases = list(databases)
+        row_by_name = {name: i for i, name in enumerate(databases)}
+        with _bulk_update(databases_list):
+            databases_list.clear()
+            databases_list.addItems(databases)
+            
+        # Select the current database in the list if one is selected
+        current_db = self.connection.get_database_name()
+        if current_db != "(No database selected)":
+            row = row_by_name.get(current_db, -1)
+            if row >= 0:
+                databases_list.setCurrentRow(row)
     
     def _populate_db_selector(self):
         """Populate the database selector in the tables tab"""
-        self.tables_tab.db_selector.clear()
+        db_selector = self.tables_tab.db_selector
+        databases = []
         
         try:
-            databases = self.connection.get_available_databases()
+            databases = self._get_databases_cached()
             
             # Filter out system databases if the option is disabled
             if not self.connection.connection_manager.get_show_system_databases():
                 databases = [db for db in databases if not self.connection.is_system_database(db)]
-                
-            self.tables_tab.db_selector.addItems(databases)
+        except Exception as e:
+            self._report_error(f"Failed to retrieve databases: {str(e)}")
+        
+        # Signals stay blocked so refilling does not trigger _on_tables_db_changed
+        # for every intermediate selection
+        databases = list(databases)
+        self._db_index = {name: i for i, name in enumerate(databases)}
+        with _bulk_update(db_selector):
+            db_selector.clear()
+            db_selector.addItems(databases)
             
-            # Set the current database if one is selected
+            # Set the current database if one is selected. It might not be in
+            # the list if it's a system database that has been filtered out.
             current_db = self.connection.get_database_name()
             if current_db != "(No database selected)":
-                # Only select the current database if it's in the list (might be filtered out if it's a system database)
-                index = self.tables_tab.db_selector.findText(current_db)
+                index = self._db_index.get(current_db, -1)
                 if index >= 0:
-                    # Temporarily disconnect the signal to avoid triggering _on_tables_db_changed
-                    self.tables_tab.db_selector.blockSignals(True)
-                    self.tables_tab.db_selector.setCurrentIndex(index)
-                    self.tables_tab.db_selector.blockSignals(False)
-                    
-                    # Manually populate the tables for the selected database
-                    self._populate_tables(current_db)
-                    self._populate_table_selectors(current_db)
-        except Exception as e:
-            if not self._test_mode:
-                QMessageBox.warning(self, "Error", f"Failed to retrieve databases: {str(e)}")
-    
-    def _populate_tables(self, database_name=None):
-        """Populate the tables list for the selected database"""
-        self.tables_tab.tables_list.clear()
+                    db_selector.setCurrentIndex(index)
         
+        # Manually populate the tables for the selected database
+        self._refresh_tables_for_db(db_selector.currentText())
+    
+    def _refresh_tables_for_db(self, database_name):
+        """Show the tables of a database in every widget that lists them
+        
+        The table list is fetched once and handed to both populate methods,
+        so a failed fetch is neither retried nor reported twice.
+        """
+        self._pending_tables_db = None
+        tables = self._fetch_tables(database_name)
+        self._populate_tables(database_name, tables=tables)
+        self._populate_table_selectors(database_name, tables=tables)
+    
+    def _fetch_tables(self, database_name):
+        """Get the tables of a database for display, reporting failures"""
         if not database_name:
-            return
+            return []
         
         try:
-            # Save current database
-            current_db = self.connection.get_database_name()
-            
-            # Switch to the selected database temporarily
-            if current_db != database_name:
-                self.connection.use_database(database_name)
-            
-            # Get tables
-            tables = self.connection.get_tables()
-            
-            for table in tables:
-                self.tables_tab.tables_list.addItem(table)
-            
-            # Switch back to the original database if needed
-            if current_db != database_name:
-                if current_db != "(No database selected)":
-                    self.connection.use_database(current_db)
-                else:
-                    self.connection.deselect_database()
+            return self._get_tables_cached(database_name)
         except Exception as e:
-            if not self._test_mode:
-                QMessageBox.warning(self, "Error", f"Failed to retrieve tables: {str(e)}")
+            self._report_error(f"Failed to retrieve tables: {str(e)}")
+            return []
     
-    def _populate_table_selectors(self, database_name=None):
-        """Populate the table selectors in columns and indexes tabs"""
-        # Block signals to prevent triggering _populate_columns with empty table names
-        self.columns_tab.table_selector.blockSignals(True)
-        self.indexes_tab.table_selector.blockSignals(True)
+    def _populate_tables(self, database_name=None, tables=None):
+        """Populate the tables list for the selected database
         
-        # Clear the selectors
-        self.columns_tab.table_selector.clear()
-        self.indexes_tab.table_selector.clear()
+        Args:
+            database_name: Database whose tables are listed
+            tables: Table names already fetched by the caller, if any
+        """
+        if tables is None:
+            tables = self._fetch_tables(database_name)
         
-        if not database_name:
-            # Unblock signals before returning
-            self.columns_tab.table_selector.blockSignals(False)
-            self.indexes_tab.table_selector.blockSignals(False)
-            return
-        
-        try:
-            # Save current database
-            current_db = self.connection.get_database_name()
-            
-            # Switch to the selected database temporarily
-            if current_db != database_name:
-                self.connection.use_database(database_name)
-            
-            # Get tables
-            tables = self.connection.get_tables()
-            for table in tables:
-                self.columns_tab.table_selector.addItem(table)
-                self.indexes_tab.table_selector.addItem(table)
-            
-            # Switch back to the original database if needed
-            if current_db != database_name:
-                if current_db != "(No database selected)":
-                    self.connection.use_database(current_db)
-                else:
-                    self.connection.deselect_database()
-                
-            # Unblock signals after populating
-            self.columns_tab.table_selector.blockSignals(False)
-            self.indexes_tab.table_selector.blockSignals(False)
+        with _bulk_update(self.tables_tab.tables_list):
+            self.tables_tab.tables_list.clear()
+            self.tables_tab.tables_list.addItems(tables)
+    
+    def _populate_table_selectors(self, database_name=None, tables=None):
+        """Populate the table selectors in columns and indexes tabs
+        
+        Args:
+            database_name: Database whose tables are listed
+            tables: Table names already fetched by the caller, if any
+        """
+        if tables is None:
+            tables = self._fetch_tables(database_name)
+        self._table_index = {name: i for i, name in enumerate(tables)}
+        
+        # Signals stay blocked to prevent triggering _populate_columns with empty table names
+        for selector in (self.columns_tab.table_selector, self.indexes_tab.table_selector):
+            with _bulk_update(selector):
+                selector.clear()
+                selector.addItems(tables)
             
             # If we have tables, select the first one
             if tables:
-                self.columns_tab.table_selector.setCurrentIndex(0)
-                self.indexes_tab.table_selector.setCurrentIndex(0)
-        except Exception as e:
-            # Unblock signals even if there's an error
-            self.columns_tab.table_selector.blockSignals(False)
-            self.indexes_tab.table_selector.blockSignals(False)
-            
-            if not self._test_mode:
-                QMessageBox.warning(self, "Error", f"Failed to retrieve tables: {str(e)}")
+                selector.setCurrentIndex(0)
+        
+        # The lists still show the previous table's columns and indexes
+        self._invalidate_table_details()
+    
+    def _find_row(self, combo, row_by_name, name):
+        """Return the row of name in a combo box, or -1
+        
+        Uses the name-to-row map built when the combo box was filled and only
+        scans the items if the combo box has been changed since then.
+        """
+        row = row_by_name.get(name, -1)
+        if row >= 0 and combo.itemText(row) == name:
+            return row
+        if row < 0 and combo.count() == len(row_by_name):
+            return -1
+        return combo.findText(name)
     
     def _update_tab_states(self):
         """Update the enabled state of tabs based on selections"""
@@ -580,7 +1087,7 @@ class DatabaseManagerDialog(QDialog):
         
         # Update columns tab
         has_table_selected_for_columns = self.columns_tab.table_selector.currentText() != ""
-        has_column_selected = len(self.columns_tab.columns_list.selectedItems()) > 0
+        has_column_selected = _selected_text(self.columns_tab.columns_list) is not None
         
         # Only enable buttons if user has appropriate permissions and not a system database
         can_alter_table = has_table_selected_for_columns and not is_system_db
@@ -592,7 +1099,7 @@ class DatabaseManagerDialog(QDialog):
         
         # Update indexes tab
         has_table_selected_for_indexes = self.indexes_tab.table_selector.currentText() != ""
-        has_index_selected = len(self.indexes_tab.indexes_list.selectedItems()) > 0
+        has_index_selected = _selected_text(self.indexes_tab.indexes_list) is not None
         
         # Only enable buttons if user has appropriate permissions and not a system database
         can_create_index = has_table_selected_for_indexes and not is_system_db
@@ -604,7 +1111,7 @@ class DatabaseManagerDialog(QDialog):
         # If this is a system database, show a warning label
         if is_system_db:
             # Check if we already have a warning label
-            if not hasattr(self, 'system_db_warning_shown') or not self.system_db_warning_shown:
+            if not self.system_db_warning_shown:
                 QMessageBox.information(
                     self, 
                     "System Database", 
@@ -615,119 +1122,105 @@ class DatabaseManagerDialog(QDialog):
             # Reset the warning flag when switching to a non-system database
             self.system_db_warning_shown = False
     
-    def _populate_columns(self, table_name):
-        """Populate the columns list for the selected table"""
-        self.columns_tab.columns_list.clear()
+    def _populate_columns(self, table_name, force=False):
+        """Populate the columns list for the selected table
         
-        # Skip if table name is empty
-        if not table_name:
+        Args:
+            table_name: Table whose columns are shown
+            force: Reload even if the list already shows this table, e.g.
+                after its columns were changed
+        """
+        self._stale_tabs.discard(self.COLUMNS_TAB_INDEX)
+        
+        # Get the current database from the tables tab
+        database_name = self.tables_tab.db_selector.currentText()
+        shown_table = (database_name, table_name)
+        if not force and shown_table == self._last_columns_table:
             return
-            
-        try:
-            # Get the current database from the tables tab
-            database_name = self.tables_tab.db_selector.currentText()
-            if not database_name:
-                return
-                
-            # Save current database
-            current_db = self.connection.get_database_name()
-            
-            # Try to get columns without switching databases first
+        
+        self._last_columns_table = None
+        items = []
+        names = None
+        
+        # Skip if table or database name is empty
+        if table_name and database_name:
             try:
-                # Get columns using current connection
-                columns = self.connection.get_columns(table_name)
-                for column in columns:
-                    # Format the column type display to clearly show size/precision
-                    column_type = str(column['type'])
-                    self.columns_tab.columns_list.addItem(f"{column['name']} ({column_type})")
-                return
-            except Exception as first_error:
-                # If that fails, try the original approach with database switching
-                # Only log detailed errors in debug mode
-                if hasattr(self, '_debug_mode') and self._debug_mode:
-                    print(f"First attempt to get columns failed for table '{table_name}': {first_error}")
-                
-                # Only try to switch database if we're not already in the right one
-                if current_db != database_name:
-                    try:
-                        self.connection.use_database(database_name)
-                        
-                        # Get columns
-                        columns = self.connection.get_columns(table_name)
-                        for column in columns:
-                            # Format the column type display to clearly show size/precision
-                            column_type = str(column['type'])
-                            self.columns_tab.columns_list.addItem(f"{column['name']} ({column_type})")
-                            
-                        # Switch back to the original database if needed
-                        if current_db != "(No database selected)":
-                            self.connection.use_database(current_db)
-                    except Exception as e:
-                        # If switching databases fails, show the error
-                        if not self._test_mode:
-                            QMessageBox.warning(self, "Error", f"Failed to retrieve columns for table '{table_name}': {str(e)}")
-                else:
-                    # We're already in the right database but still failed
-                    if not self._test_mode:
-                        QMessageBox.warning(self, "Error", f"Failed to retrieve columns for table '{table_name}': {str(first_error)}")
-        except Exception as e:
-            if not self._test_mode:
-                QMessageBox.warning(self, "Error", f"Failed to retrieve columns for table '{table_name}': {str(e)}")
+                # The type is shown next to the name to make size/precision clear,
+                # the bare name is kept as the row's key
+                items = self._get_column_labels_cached(database_name, table_name)
+                names = [column['name'] for column in self._get_columns_cached(database_name, table_name)]
+                self._last_columns_table = shown_table
+            except Exception as e:
+                self._report_error(f"Failed to retrieve columns for table '{table_name}': {str(e)}")
+        
+        self.columns_tab.columns_model.set_data(items, names)
     
-    def _populate_indexes(self, table_name):
-        """Populate the indexes list for the selected table"""
-        self.indexes_tab.indexes_list.clear()
+    def _populate_indexes(self, table_name, force=False):
+        """Populate the indexes list for the selected table
         
-        # Skip if table name is empty
-        if not table_name:
+        Args:
+            table_name: Table whose indexes are shown
+            force: Reload even if the list already shows this table, e.g.
+                after an index was created or dropped
+        """
+        self._stale_tabs.discard(self.INDEXES_TAB_INDEX)
+        
+        # Get the current database from the tables tab
+        database_name = self.tables_tab.db_selector.currentText()
+        shown_table = (database_name, table_name)
+        if not force and shown_table == self._last_indexes_table:
             return
-            
-        try:
-            # Get the current database from the tables tab
-            database_name = self.tables_tab.db_selector.currentText()
-            if not database_name:
-                return
-                
-            # Save current database
-            current_db = self.connection.get_database_name()
-            
-            # Try to get indexes without switching databases first
+        
+        self._last_indexes_table = None
+        items = []
+        
+        # Skip if table or database name is empty
+        if table_name and database_name:
             try:
-                # Get indexes using current connection
-                indexes = self.connection.get_indexes(table_name)
-                for index in indexes:
-                    self.indexes_tab.indexes_list.addItem(index['name'])
-                return
-            except Exception as first_error:
-                # If that fails, try the original approach with database switching
-                # Only log detailed errors in debug mode
-                if hasattr(self, '_debug_mode') and self._debug_mode:
-                    print(f"First attempt to get indexes failed for table '{table_name}': {first_error}")
-                
-                # Only try to switch database if we're not already in the right one
-                if current_db != database_name:
-                    try:
-                        self.connection.use_database(database_name)
-                        
-                        # Get indexes
-                        indexes = self.connection.get_indexes(table_name)
-                        for index in indexes:
-                            self.indexes_tab.indexes_list.addItem(index['name'])
-                            
-                        # Switch back to the original database if needed
-                        if current_db != "(No database selected)":
-                            self.connection.use_database(current_db)
-                    except Exception as e:
-                        # If switching databases fails, show the error
-                        if not self._test_mode:
-                            QMessageBox.warning(self, "Error", f"Failed to retrieve indexes for table '{table_name}': {str(e)}")
-                else:
-                    # We're already in the right database but still failed
-                    if not self._test_mode:
-                        QMessageBox.warning(self, "Error", f"Failed to retrieve indexes for table '{table_name}': {str(first_error)}")
-        except Exception as e:
-            if not self._test_mode:
-                QMessageBox.warning(self, "Error", f"Failed to retrieve indexes for table '{table_name}': {str(e)}")
+                indexes = self._get_indexes_cached(database_name, table_name)
+                items = [index['name'] for index in indexes]
+                self._last_indexes_table = shown_table
+            except Exception as e:
+                self._report_error(f"Failed to retrieve indexes for table '{table_name}': {str(e)}")
+        
+        self.indexes_tab.indexes_model.set_data(items)
+    
+    def _report_error(self, message):
+        """Show an error below the tabs without interrupting the caller"""
+        self._error_label.setText(message)
+        self._error_label.setVisible(True)
+    
+    def _clear_error(self):
+        """Hide the error shown by _report_error"""
+        self._error_label.clear()
+        self._error_label.setVisible(False)
+    
+    def _show_status(self, message):
+        """Show a message below the tabs that hides itself after a while"""
+        self._status_label.setText(message)
+        self._status_label.setVisible(True)
+        self._status_timer.start()
+    
+    def _clear_status(self):
+        """Hide the message shown by _show_status"""
+        self._status_label.clear()
+        self._status_label.setVisible(False)
+    
+    def _create_debounce_timer(self, slot):
+        """Create a single-shot timer that calls slot once changes settle"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(TABLE_SELECTION_DEBOUNCE_MS)
+        timer.timeout.connect(slot)
+        return timer
+    
+    def _populate_selected_columns(self):
+        """Populate the columns list for the table chosen in the columns tab"""
+        self._populate_columns(self.columns_tab.table_selector.currentText())
+    
+    def _populate_selected_indexes(self):
+        """Populate the indexes list for the table chosen in the indexes tab"""
+        self._populate_indexes(self.indexes_tab.table_selector.currentText())
     
     def _connect_signals(self):
         """Connect signals to slots"""
@@ -743,15 +1236,18 @@ class DatabaseManagerDialog(QDialog):
         self.tables_tab.drop_table_button.clicked.connect(self._drop_table)
         self.tables_tab.tables_list.itemSelectionChanged.connect(self._on_table_selection_changed)
         self.tables_tab.tables_list.itemDoubleClicked.connect(self._on_table_double_clicked)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Columns tab
-        self.columns_tab.table_selector.currentTextChanged.connect(self._populate_columns)
+        self._columns_debounce = self._create_debounce_timer(self._populate_selected_columns)
+        self.columns_tab.table_selector.currentTextChanged.connect(self._columns_debounce.start)
         self.columns_tab.add_column_button.clicked.connect(self._add_column)
         self.columns_tab.modify_column_button.clicked.connect(self._modify_column)
         self.columns_tab.drop_column_button.clicked.connect(self._drop_column)
         
         # Indexes tab
-        self.indexes_tab.table_selector.currentTextChanged.connect(self._populate_indexes)
+        self._indexes_debounce = self._create_debounce_timer(self._populate_selected_indexes)
+        self.indexes_tab.table_selector.currentTextChanged.connect(self._indexes_debounce.start)
         self.indexes_tab.create_index_button.clicked.connect(self._create_index)
         self.indexes_tab.drop_index_button.clicked.connect(self._drop_index)
 
@@ -759,7 +1255,7 @@ class DatabaseManagerDialog(QDialog):
         self.add_record_tab.table_selector.currentTextChanged.connect(self._on_add_record_table_changed)
         self.add_record_tab.submit_button.clicked.connect(self._submit_new_record)
         self.add_record_tab.clear_button.clicked.connect(self._clear_add_record_form)
-        is_mongodb = self.connection.params.get('type') == 'MongoDB'
+        is_mongodb = self._db_type == 'MongoDB'
         if is_mongodb:
             self.add_record_tab.add_field_button.clicked.connect(self._add_mongo_field_row)
 
@@ -779,21 +1275,20 @@ class DatabaseManagerDialog(QDialog):
             db_name, ok = QInputDialog.getText(self, "Create Database", "Database name:")
             
         if ok and db_name:
-            try:
-                is_mongodb = self.connection.params.get('type') == 'MongoDB'
-                if is_mongodb:
-                    self.connection.create_database(db_name)
-                else:
-                    self.connection.execute_non_query(f"CREATE DATABASE {db_name};")
+            def on_created():
+                self._invalidate_db_cache()
                 
                 # Refresh the databases list
                 self._populate_databases()
                 
                 if not self._test_mode:
                     QMessageBox.information(self, "Success", f"Database '{db_name}' created successfully.")
-            except Exception as e:
-                if not self._test_mode:
-                    QMessageBox.critical(self, "Error", f"Failed to create database: {str(e)}")
+            
+            if self._db_type == 'MongoDB':
+                self._run_ddl(on_created, "Failed to create database", self.connection.create_database, db_name)
+            else:
+                self._run_ddl(on_created, "Failed to create database",
+                              self.connection.execute_ddl, 'create_database', db_name)
     
     def _drop_database(self):
         """Drop the selected database"""
@@ -823,36 +1318,32 @@ class DatabaseManagerDialog(QDialog):
             return
         
         # Confirm the drop operation
-        if self._test_mode:
-            reply = QMessageBox.StandardButton.Yes
-        else:
-            reply = QMessageBox.question(
-                self, "Confirm Drop",
-                f"Are you sure you want to drop the database '{db_name}'?\nThis action cannot be undone!",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
+        self._confirm_drop(
+            f"Are you sure you want to drop the database '{db_name}'?\nThis action cannot be undone!",
+            lambda: self._do_drop_database(db_name)
+        )
+    
+    def _do_drop_database(self, db_name):
+        """Drop a database once the user has confirmed it"""
+        def on_dropped():
+            self._invalidate_db_cache()
+            self._invalidate_db_cache(db_name)
+            
+            # Refresh the databases list
+            self._populate_databases()
+            
+            if not self._test_mode:
+                QMessageBox.information(self, "Success", f"Database '{db_name}' dropped successfully.")
         
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                is_mongodb = self.connection.params.get('type') == 'MongoDB'
-                if is_mongodb:
-                    self.connection.drop_database(db_name)
-                else:
-                    self.connection.execute_non_query(f"DROP DATABASE {db_name};")
-                
-                # Refresh the databases list
-                self._populate_databases()
-                
-                if not self._test_mode:
-                    QMessageBox.information(self, "Success", f"Database '{db_name}' dropped successfully.")
-            except Exception as e:
-                if not self._test_mode:
-                    QMessageBox.critical(self, "Error", f"Failed to drop database: {str(e)}")
+        if self._db_type == 'MongoDB':
+            self._run_ddl(on_dropped, "Failed to drop database", self.connection.drop_database, db_name)
+        else:
+            self._run_ddl(on_dropped, "Failed to drop database",
+                          self.connection.execute_ddl, 'drop_database', db_name)
     
     def _create_table(self):
         """Create a new table or MongoDB collection"""
-        is_mongodb = self.connection.params.get('type') == 'MongoDB'
+        is_mongodb = self._db_type == 'MongoDB'
 
         if is_mongodb:
             self._create_mongodb_collection()
@@ -873,142 +1364,42 @@ class DatabaseManagerDialog(QDialog):
             )
             return
         
-        dialog = CreateTableDialog(self)
-        
-        # In test mode, we'll simulate the dialog result
         if self._test_mode:
-            # Create a mock table definition
-            table_def = {
-                'name': 'test_table',
-                'columns': [
-                    {'name': 'id', 'type': 'INTEGER', 'primary_key': True, 'nullable': False},
-                    {'name': 'name', 'type': 'TEXT', 'primary_key': False, 'nullable': True}
-                ]
-            }
-            
-            # Build the CREATE TABLE statement
-            sql = f"CREATE TABLE {table_def['name']} (\n"
-            
-            # Add column definitions
-            column_defs = []
-            for col in table_def['columns']:
-                # Handle types that require length/precision
-                col_type = col['type']
-                if col_type == 'VARCHAR' and '(' not in col_type:
-                    col_type = 'VARCHAR(255)'  # Default to 255 if no length specified
-                elif col_type == 'DOUBLE' and '(' not in col_type:
-                    col_type = 'DOUBLE(10,2)'  # Default precision for DOUBLE
-                elif col_type == 'DECIMAL' and '(' not in col_type:
-                    col_type = 'DECIMAL(10,2)'  # Default precision for DECIMAL
-                
-                col_def = f"{col['name']} {col_type}"
-                
-                if not col['nullable']:
-                    col_def += " NOT NULL"
-                
-                if col['primary_key']:
-                    col_def += " PRIMARY KEY"
-                
-                column_defs.append(col_def)
-            
-            sql += ",\n".join(column_defs)
-            sql += "\n);"
-            
-            # Save current database
-            current_db = self.connection.get_database_name()
-            
-            # Switch to the selected database temporarily
-            if current_db != database_name:
-                self.connection.use_database(database_name)
-            
-            # Execute the CREATE TABLE statement
-            self.connection.execute_non_query(sql)
+            # In test mode, we'll simulate the dialog result
+            table_def = _TEST_TABLE_DEFINITION
+        else:
+            if self._create_table_dialog is None:
+                self._create_table_dialog = CreateTableDialog(self)
+            else:
+                self._create_table_dialog.reset_fields()
+            dialog = self._create_table_dialog
+            if not dialog.exec():
+                return
+            table_def = dialog.get_table_definition()
+        
+        def on_created():
+            self._invalidate_db_cache(database_name)
             
             # Ensure the database selector shows the correct database
-            index = self.tables_tab.db_selector.findText(database_name)
+            index = self._find_row(self.tables_tab.db_selector, self._db_index, database_name)
             if index >= 0:
                 self.tables_tab.db_selector.setCurrentIndex(index)
             
             # Refresh the tables list
-            self._populate_tables(database_name)
-            self._populate_table_selectors(database_name)
-            
-            # Switch back to the original database if needed
-            if current_db != database_name and current_db != "(No database selected)":
-                self.connection.use_database(current_db)
-                
-            # Force the UI to update
-            self.tables_tab.tables_list.update()
+            self._refresh_tables_for_db(database_name)
             
-            return
-        
-        # Normal mode - show the dialog
-        if dialog.exec():
-            try:
-                # Get the table definition
-                table_def = dialog.get_table_definition()
-                
-                # Build the CREATE TABLE statement
-                sql = f"CREATE TABLE {table_def['name']} (\n"
-                
-                # Add column definitions
-                column_defs = []
-                for col in table_def['columns']:
-                    # Handle types that require length/precision
-                    col_type = col['type']
-                    if col_type == 'VARCHAR' and '(' not in col_type:
-                        col_type = 'VARCHAR(255)'  # Default to 255 if no length specified
-                    elif col_type == 'DOUBLE' and '(' not in col_type:
-                        col_type = 'DOUBLE(10,2)'  # Default precision for DOUBLE
-                    elif col_type == 'DECIMAL' and '(' not in col_type:
-                        col_type = 'DECIMAL(10,2)'  # Default precision for DECIMAL
-                    
-                    col_def = f"{col['name']} {col_type}"
-                    
-                    if not col['nullable']:
-                        col_def += " NOT NULL"
-                    
-                    if col['primary_key']:
-                        col_def += " PRIMARY KEY"
-                    
-                    column_defs.append(col_def)
-                
-                sql += ",\n".join(column_defs)
-                sql += "\n);"
-                
-                # Save current database
-                current_db = self.connection.get_database_name()
-                
-                # Switch to the selected database temporarily
-                if current_db != database_name:
-                    self.connection.use_database(database_name)
-                
-                # Execute the CREATE TABLE statement
-                self.connection.execute_non_query(sql)
-                
-                # Ensure the database selector shows the correct database
-                index = self.tables_tab.db_selector.findText(database_name)
-                if index >= 0:
-                    self.tables_tab.db_selector.setCurrentIndex(index)
-                
-                # Refresh the tables list
-                self._populate_tables(database_name)
-                self._populate_table_selectors(database_name)
-                
-                # Switch back to the original database if needed
-                if current_db != database_name and current_db != "(No database selected)":
-                    self.connection.use_database(current_db)
-                
-                # Force the UI to update
-                self.tables_tab.tables_list.update()
-                
+            if not self._test_mode:
                 QMessageBox.information(self, "Success", f"Table '{table_def['name']}' created successfully.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to create table: {str(e)}")
+        
+        # Build and execute the CREATE TABLE statement in the selected database
+        qualified_table = self.connection.qualified_name(table_def['name'], database_name)
+        sql = _build_create_table_sql(qualified_table, table_def['columns'])
+        self._run_ddl(on_created, "Failed to create table",
+                      self.connection.execute_non_query, sql, database=database_name)
     
     def _drop_table(self):
         """Drop the selected table or MongoDB collection"""
-        is_mongodb = self.connection.params.get('type') == 'MongoDB'
+        is_mongodb = self._db_type == 'MongoDB'
 
         if is_mongodb:
             self._drop_mongodb_collection()
@@ -1038,41 +1429,25 @@ class DatabaseManagerDialog(QDialog):
         table_name = selected_items[0].text()
         
         # Confirm the drop operation
-        if self._test_mode:
-            reply = QMessageBox.StandardButton.Yes
-        else:
-            reply = QMessageBox.question(
-                self, "Confirm Drop",
-                f"Are you sure you want to drop the table '{table_name}'?\nThis action cannot be undone!",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
+        self._confirm_drop(
+            f"Are you sure you want to drop the table '{table_name}'?\nThis action cannot be undone!",
+            lambda: self._do_drop_table(database_name, table_name)
+        )
+
+    def _do_drop_table(self, database_name, table_name):
+        """Drop a table once the user has confirmed it"""
+        def on_dropped():
+            self._invalidate_db_cache(database_name)
+            
+            # Refresh the tables list
+            self._refresh_tables_for_db(database_name)
+            
+            if not self._test_mode:
+                QMessageBox.information(self, "Success", f"Table '{table_name}' dropped successfully.")
         
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                # Save current database
-                current_db = self.connection.get_database_name()
-                
-                # Switch to the selected database temporarily
-                if current_db != database_name:
-                    self.connection.use_database(database_name)
-                
-                # Execute the DROP TABLE statement
-                self.connection.execute_non_query(f"DROP TABLE {table_name};")
-                
-                # Refresh the tables list
-                self._populate_tables(database_name)
-                self._populate_table_selectors(database_name)
-                
-                # Switch back to the original database if needed
-                if current_db != database_name and current_db != "(No database selected)":
-                    self.connection.use_database(current_db)
-                
-                if not self._test_mode:
-                    QMessageBox.information(self, "Success", f"Table '{table_name}' dropped successfully.")
-            except Exception as e:
-                if not self._test_mode:
-                    QMessageBox.critical(self, "Error", f"Failed to drop table: {str(e)}")
+        # Execute the DROP TABLE statement in the selected database
+        self._run_ddl(on_dropped, "Failed to drop table",
+                      self.connection.execute_ddl, 'drop_table', table_name, database=database_name)
 
     def _create_mongodb_collection(self):
         """Create a new MongoDB collection via an input dialog"""
@@ -1082,20 +1457,20 @@ class DatabaseManagerDialog(QDialog):
         if not ok or not collection_name.strip():
             return
         collection_name = collection_name.strip()
-        try:
-            database_name = self.tables_tab.db_selector.currentText()
-            if database_name and database_name != self.connection.get_database_name():
-                self.connection.use_database(database_name)
-            self.connection.create_collection(collection_name)
-            self._populate_tables(self.connection.get_database_name())
-            self._populate_table_selectors(self.connection.get_database_name())
+        database_name = self.tables_tab.db_selector.currentText() or None
+
+        def on_created():
+            shown_db = database_name or self.connection.get_database_name()
+            self._invalidate_db_cache(shown_db)
+            self._refresh_tables_for_db(shown_db)
             if not self._test_mode:
                 QMessageBox.information(
                     self, "Success", f"Collection '{collection_name}' created successfully."
                 )
-        except Exception as e:
-            if not self._test_mode:
-                QMessageBox.critical(self, "Error", f"Failed to create collection: {str(e)}")
+
+        # Created in the selected database without switching the session
+        self._run_ddl(on_created, "Failed to create collection",
+                      self.connection.create_collection, collection_name, database=database_name)
 
     def _drop_mongodb_collection(self):
         """Drop the selected MongoDB collection"""
@@ -1107,32 +1482,41 @@ class DatabaseManagerDialog(QDialog):
 
         collection_name = selected_items[0].text()
 
-        if self._test_mode:
-            reply = QMessageBox.StandardButton.Yes
-        else:
-            reply = QMessageBox.question(
-                self, "Confirm Drop",
-                f"Are you sure you want to drop the collection '{collection_name}'?\nThis action cannot be undone!",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
+        self._confirm_drop(
+            f"Are you sure you want to drop the collection '{collection_name}'?\nThis action cannot be undone!",
+            lambda: self._do_drop_mongodb_collection(collection_name)
+        )
 
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                database_name = self.tables_tab.db_selector.currentText()
-                if database_name and database_name != self.connection.get_database_name():
-                    self.connection.use_database(database_name)
-                self.connection.drop_collection(collection_name)
-                self._populate_tables(self.connection.get_database_name())
-                self._populate_table_selectors(self.connection.get_database_name())
-                if not self._test_mode:
-                    QMessageBox.information(
-                        self, "Success", f"Collection '{collection_name}' dropped successfully."
-                    )
-            except Exception as e:
-                if not self._test_mode:
-                    QMessageBox.critical(self, "Error", f"Failed to drop collection: {str(e)}")
+    def _do_drop_mongodb_collection(self, collection_name):
+        """Drop a MongoDB collection once the user has confirmed it"""
+        database_name = self.tables_tab.db_selector.currentText() or None
 
+        def on_dropped():
+            shown_db = database_name or self.connection.get_database_name()
+            self._invalidate_db_cache(shown_db)
+            self._refresh_tables_for_db(shown_db)
+            if not self._test_mode:
+                QMessageBox.information(
+                    self, "Success", f"Collection '{collection_name}' dropped successfully."
+                )
+
+        # Dropped from the selected database without switching the session
+        self._run_ddl(on_dropped, "Failed to drop collection",
+                      self.connection.drop_collection, collection_name, database=database_name)
+
+    def _get_column_dialog(self, title):
+        """Return the column dialog with empty fields and the given title
+        
+        The dialog is shared by adding and modifying columns and only built
+        the first time it is needed.
+        """
+        if self._column_dialog is None:
+            self._column_dialog = AddColumnDialog(self)
+        else:
+            self._column_dialog.reset_fields()
+        self._column_dialog.setWindowTitle(title)
+        return self._column_dialog
+    
     def _add_column(self):
         """Add a column to the selected table"""
         # Get the selected table
@@ -1143,6 +1527,9 @@ class DatabaseManagerDialog(QDialog):
             
         # Get the current database
         database_name = self.tables_tab.db_selector.currentText()
+        if not database_name:
+            QMessageBox.warning(self, "Warning", "No database selected.")
+            return
         
         # Check if this is a system database
         if self.connection.is_system_database(database_name):
@@ -1154,62 +1541,35 @@ class DatabaseManagerDialog(QDialog):
             return
         
         # Show the add column dialog
-        dialog = AddColumnDialog(self)
+        dialog = self._get_column_dialog("Add Column")
         if dialog.exec():
             try:
                 # Get the column definition
                 column_def = dialog.get_column_definition()
                 
                 # Build the ALTER TABLE statement
-                sql = f"ALTER TABLE {table_name} ADD COLUMN {column_def['name']} {column_def['type']}"
+                qualified_table = self.connection.qualified_name(table_name, database_name)
+                parts = ["ALTER TABLE", qualified_table, "ADD COLUMN", column_def['name'], column_def['type']]
                 
                 if not column_def['nullable']:
-                    sql += " NOT NULL"
+                    parts.append("NOT NULL")
                 
                 if column_def['default'] is not None:
-                    # For numeric types, ensure the default value is properly formatted
-                    default_value = column_def['default']
-                    
-                    # Check if it's a numeric type with a numeric default value
-                    numeric_types = ["INT", "INTEGER", "SMALLINT", "TINYINT", "BIGINT", 
-                                    "DECIMAL", "NUMERIC", "FLOAT", "DOUBLE", "REAL"]
-                    
-                    is_numeric_type = any(column_def['type'].upper().startswith(t) for t in numeric_types)
-                    
-                    # If it's a numeric type and the default isn't already quoted, don't add quotes
-                    if is_numeric_type and not (default_value.startswith("'") and default_value.endswith("'")):
-                        sql += f" DEFAULT {default_value}"
-                    else:
-                        # For other types or already quoted values, use as is
-                        sql += f" DEFAULT {default_value}"
+                    # The dialog has already quoted the default where needed
+                    parts.append(f"DEFAULT {column_def['default']}")
                 
-                sql += ";"
+                sql = " ".join(parts) + ";"
                 
-                # Get the current database from the tables tab
-                database_name = self.tables_tab.db_selector.currentText()
-                if not database_name:
-                    QMessageBox.warning(self, "Warning", "No database selected.")
-                    return
-                
-                # Save current database
-                current_db = self.connection.get_database_name()
-                
-                try:
-                    # Switch to the selected database temporarily if needed
-                    if current_db != database_name:
-                        self.connection.use_database(database_name)
-                    
-                    # Execute the ALTER TABLE statement
-                    self.connection.execute_non_query(sql)
-                    
+                def on_added():
                     # Refresh the columns list
-                    self._populate_columns(table_name)
-                finally:
-                    # Switch back to the original database if needed
-                    if current_db != database_name and current_db != "(No database selected)":
-                        self.connection.use_database(current_db)
+                    self._invalidate_db_cache(database_name, 'columns')
+                    self._populate_columns(table_name, force=True)
+                    
+                    QMessageBox.information(self, "Success", f"Column '{column_def['name']}' added successfully.")
                 
-                QMessageBox.information(self, "Success", f"Column '{column_def['name']}' added successfully.")
+                # Execute the ALTER TABLE statement in the selected database
+                self._run_ddl(on_added, "Failed to add column",
+                              self.connection.execute_non_query, sql, database=database_name)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to add column: {str(e)}")
     
@@ -1217,18 +1577,21 @@ class DatabaseManagerDialog(QDialog):
         """Modify the selected column"""
         # Get the selected table and column
         table_name = self.columns_tab.table_selector.currentText()
-        selected_items = self.columns_tab.columns_list.selectedItems()
+        column_name = _selected_text(self.columns_tab.columns_list, Qt.ItemDataRole.UserRole)
         
         if not table_name:
             QMessageBox.warning(self, "Warning", "Please select a table.")
             return
         
-        if not selected_items:
+        if column_name is None:
             QMessageBox.warning(self, "Warning", "Please select a column to modify.")
             return
             
         # Get the current database
         database_name = self.tables_tab.db_selector.currentText()
+        if not database_name:
+            QMessageBox.warning(self, "Warning", "No database selected.")
+            return
         
         # Check if this is a system database
         if self.connection.is_system_database(database_name):
@@ -1239,21 +1602,19 @@ class DatabaseManagerDialog(QDialog):
             )
             return
         
-        # Extract the column name from the list item text (format: "name (type)")
-        column_text = selected_items[0].text()
-        column_name = column_text.split(" (")[0]
-        
-        # Get the current column definition
-        columns = self.connection.get_columns(table_name)
-        current_column = next((col for col in columns if col['name'] == column_name), None)
+        # Get the current column definition from the same metadata the list shows
+        try:
+            current_column = self._get_column_cached(database_name, table_name, column_name)
+        except Exception as e:
+            self._report_error(f"Failed to retrieve columns for table '{table_name}': {str(e)}")
+            return
         
         if not current_column:
             QMessageBox.warning(self, "Warning", f"Column '{column_name}' not found.")
             return
         
         # Show the modify column dialog
-        dialog = AddColumnDialog(self)
-        dialog.setWindowTitle("Modify Column")
+        dialog = self._get_column_dialog("Modify Column")
         dialog.column_name_edit.setText(current_column['name'])
         
         # Parse the column type to extract size and precision if present
@@ -1288,11 +1649,9 @@ class DatabaseManagerDialog(QDialog):
                 # Get the new column definition
                 new_column_def = dialog.get_column_definition()
                 
-                # Build the ALTER TABLE statement
+                # Build the ALTER TABLE statements
                 # Note: The exact syntax varies by database type
-                db_type = self.connection.params['type']
-                
-                if db_type == 'SQLite':
+                if self._db_type == 'SQLite':
                     # SQLite doesn't support ALTER COLUMN directly, need to use a workaround
                     QMessageBox.warning(
                         self, "Not Supported",
@@ -1301,67 +1660,27 @@ class DatabaseManagerDialog(QDialog):
                         "copy the data, and rename the tables."
                     )
                     return
-                elif db_type == 'MySQL':
-                    sql = f"ALTER TABLE {table_name} MODIFY COLUMN {new_column_def['name']} {new_column_def['type']}"
-                elif db_type == 'PostgreSQL':
-                    # For PostgreSQL, we need separate statements for different modifications
-                    if new_column_def['name'] != current_column['name']:
-                        sql = f"ALTER TABLE {table_name} RENAME COLUMN {current_column['name']} TO {new_column_def['name']};"
-                        self.connection.execute_non_query(sql)
-                    
-                    sql = f"ALTER TABLE {table_name} ALTER COLUMN {new_column_def['name']} TYPE {new_column_def['type']}"
-                else:
-                    QMessageBox.warning(self, "Not Supported", f"Modifying columns is not supported for {db_type}.")
-                    return
-                
-                if not new_column_def['nullable']:
-                    sql += " NOT NULL"
                 
-                if new_column_def['default'] is not None:
-                    # Get the default value
-                    default_value = new_column_def['default']
-                    
-                    # Check if it's a numeric type with a numeric default value
-                    numeric_types = ["INT", "INTEGER", "SMALLINT", "TINYINT", "BIGINT", 
-                                    "DECIMAL", "NUMERIC", "FLOAT", "DOUBLE", "REAL"]
-                    
-                    is_numeric_type = any(new_column_def['type'].upper().startswith(t) for t in numeric_types)
-                    
-                    if db_type == 'PostgreSQL':
-                        # For PostgreSQL, default is a separate statement
-                        sql += ";"
-                        sql += f"ALTER TABLE {table_name} ALTER COLUMN {new_column_def['name']} SET DEFAULT {default_value}"
-                    else:
-                        # For other database types
-                        sql += f" DEFAULT {default_value}"
-                
-                sql += ";"
-                
-                # Get the current database from the tables tab
-                database_name = self.tables_tab.db_selector.currentText()
-                if not database_name:
-                    QMessageBox.warning(self, "Warning", "No database selected.")
+                builder = _ALTER_COLUMN_BUILDERS.get(self._db_type)
+                if builder is None:
+                    QMessageBox.warning(self, "Not Supported", f"Modifying columns is not supported for {self._db_type}.")
                     return
                 
-                # Save current database
-                current_db = self.connection.get_database_name()
+                qualified_table = self.connection.qualified_name(table_name, database_name)
+                statements = builder(qualified_table, current_column, new_column_def)
                 
-                try:
-                    # Switch to the selected database temporarily if needed
-                    if current_db != database_name:
-                        self.connection.use_database(database_name)
-                    
-                    # Execute the ALTER TABLE statement
-                    self.connection.execute_non_query(sql)
-                    
+                def on_modified():
                     # Refresh the columns list
-                    self._populate_columns(table_name)
-                finally:
-                    # Switch back to the original database if needed
-                    if current_db != database_name and current_db != "(No database selected)":
-                        self.connection.use_database(current_db)
+                    self._invalidate_db_cache(database_name, 'columns')
+                    self._populate_columns(table_name, force=True)
+                    
+                    QMessageBox.information(self, "Success", f"Column '{new_column_def['name']}' modified successfully.")
                 
-                QMessageBox.information(self, "Success", f"Column '{new_column_def['name']}' modified successfully.")
+                # Execute the ALTER TABLE statements in the selected database as
+                # one transaction, so a failing clause does not leave the column
+                # half modified
+                self._run_ddl(on_modified, "Failed to modify column",
+                              self.connection.execute_batch, statements, database=database_name)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to modify column: {str(e)}")
     
@@ -1369,18 +1688,21 @@ class DatabaseManagerDialog(QDialog):
         """Drop the selected column"""
         # Get the selected table and column
         table_name = self.columns_tab.table_selector.currentText()
-        selected_items = self.columns_tab.columns_list.selectedItems()
+        column_name = _selected_text(self.columns_tab.columns_list, Qt.ItemDataRole.UserRole)
         
         if not table_name:
             QMessageBox.warning(self, "Warning", "Please select a table.")
             return
         
-        if not selected_items:
+        if column_name is None:
             QMessageBox.warning(self, "Warning", "Please select a column to drop.")
             return
             
         # Get the current database
         database_name = self.tables_tab.db_selector.currentText()
+        if not database_name:
+            QMessageBox.warning(self, "Warning", "No database selected.")
+            return
         
         # Check if this is a system database
         if self.connection.is_system_database(database_name):
@@ -1391,63 +1713,44 @@ class DatabaseManagerDialog(QDialog):
             )
             return
         
-        # Extract the column name from the list item text (format: "name (type)")
-        column_text = selected_items[0].text()
-        column_name = column_text.split(" (")[0]
-        
         # Confirm the drop operation
-        reply = QMessageBox.question(
-            self, "Confirm Drop",
+        self._confirm_drop(
             f"Are you sure you want to drop the column '{column_name}' from table '{table_name}'?\n"
             "This action cannot be undone!",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            lambda: self._do_drop_column(database_name, table_name, column_name)
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                # Check if the database type supports dropping columns
-                db_type = self.connection.params['type']
-                
-                if db_type == 'SQLite':
-                    # SQLite doesn't support DROP COLUMN directly in older versions
-                    sqlite_version = self.connection.execute_query("SELECT sqlite_version();").iloc[0, 0]
-                    if sqlite_version < "3.35.0":
-                        QMessageBox.warning(
-                            self, "Not Supported",
-                            f"Dropping columns is not supported in SQLite version {sqlite_version}. "
-                            "You would need to create a new table without the column, "
-                            "copy the data, and rename the tables."
-                        )
-                        return
-                
-                # Get the current database from the tables tab
-                database_name = self.tables_tab.db_selector.currentText()
-                if not database_name:
-                    QMessageBox.warning(self, "Warning", "No database selected.")
-                    return
-                
-                # Save current database
-                current_db = self.connection.get_database_name()
-                
-                try:
-                    # Switch to the selected database temporarily if needed
-                    if current_db != database_name:
-                        self.connection.use_database(database_name)
-                    
-                    # Execute the ALTER TABLE statement
-                    self.connection.execute_non_query(f"ALTER TABLE {table_name} DROP COLUMN {column_name};")
-                    
-                    # Refresh the columns list
-                    self._populate_columns(table_name)
-                finally:
-                    # Switch back to the original database if needed
-                    if current_db != database_name and current_db != "(No database selected)":
-                        self.connection.use_database(current_db)
+    
+    def _do_drop_column(self, database_name, table_name, column_name):
+        """Drop a column once the user has confirmed it"""
+        try:
+            # Check if the database type supports dropping columns. SQLite
+            # doesn't support DROP COLUMN in older versions; the connection
+            # goes through Python's sqlite3 module, so the library version
+            # is known without asking the database.
+            if self._db_type == 'SQLite' and sqlite3.sqlite_version_info < SQLITE_DROP_COLUMN_VERSION:
+                QMessageBox.warning(
+                    self, "Not Supported",
+                    f"Dropping columns is not supported in SQLite version {sqlite3.sqlite_version}. "
+                    "You would need to create a new table without the column, "
+                    "copy the data, and rename the tables."
+                )
+                return
+            
+            def on_dropped():
+                # Refresh the columns list
+                self._invalidate_db_cache(database_name, 'columns')
+                self._populate_columns(table_name, force=True)
                 
                 QMessageBox.information(self, "Success", f"Column '{column_name}' dropped successfully.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to drop column: {str(e)}")
+            
+            # Execute the ALTER TABLE statement in the selected database
+            qualified_table = self.connection.qualified_name(table_name, database_name)
+            self._run_ddl(on_dropped, "Failed to drop column",
+                          self.connection.execute_non_query,
+                          f"ALTER TABLE {qualified_table} DROP COLUMN {column_name};",
+                          database=database_name)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to drop column: {str(e)}")
     
     def _create_index(self):
         """Create a new index"""
@@ -1472,50 +1775,41 @@ class DatabaseManagerDialog(QDialog):
             )
             return
             
-        # Save current database
-        current_db = self.connection.get_database_name()
+        # Show the create index dialog for the tables of the selected database
+        # Tables and columns come from the metadata cache of this dialog
+        dialog = CreateIndexDialog(self.connection, self, database_name=database_name,
+                                   get_tables=self._get_tables_cached,
+                                   get_columns=self._get_columns_cached)
         
-        try:
-            # Switch to the selected database temporarily if needed
-            if current_db != database_name:
-                self.connection.use_database(database_name)
-            
-            # Show the create index dialog
-            dialog = CreateIndexDialog(self.connection, self)
-            
-            # Set the selected table
-            dialog.table_combo.setCurrentText(table_name)
-            
-            # Store the database name and current_db for later use
-            dialog.database_name = database_name
-            dialog.original_db = current_db
-            
-            if dialog.exec():
-                try:
-                    # Get the index definition
-                    index_def = dialog.get_index_definition()
-                    
-                    # Build the CREATE INDEX statement
-                    if index_def['unique']:
-                        sql = f"CREATE UNIQUE INDEX {index_def['name']} ON {index_def['table']} "
-                    else:
-                        sql = f"CREATE INDEX {index_def['name']} ON {index_def['table']} "
-                    
-                    sql += f"({', '.join(index_def['columns'])});"
-                    
-                    # Execute the CREATE INDEX statement
-                    self.connection.execute_non_query(sql)
-                    
+        # Set the selected table
+        dialog.table_combo.setCurrentText(table_name)
+        
+        if dialog.exec():
+            try:
+                # Get the index definition
+                index_def = dialog.get_index_definition()
+                qualified_table = self.connection.qualified_name(index_def['table'], database_name)
+                
+                # Build the CREATE INDEX statement
+                if index_def['unique']:
+                    sql = f"CREATE UNIQUE INDEX {index_def['name']} ON {qualified_table} "
+                else:
+                    sql = f"CREATE INDEX {index_def['name']} ON {qualified_table} "
+                
+                sql += f"({', '.join(index_def['columns'])});"
+                
+                def on_created():
                     # Refresh the indexes list
-                    self._populate_indexes(table_name)
+                    self._invalidate_db_cache(database_name, 'indexes')
+                    self._populate_indexes(table_name, force=True)
                     
                     QMessageBox.information(self, "Success", f"Index '{index_def['name']}' created successfully.")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to create index: {str(e)}")
-        finally:
-            # Switch back to the original database if needed
-            if current_db != database_name and current_db != "(No database selected)":
-                self.connection.use_database(current_db)
+                
+                # Execute the CREATE INDEX statement in the selected database
+                self._run_ddl(on_created, "Failed to create index",
+                              self.connection.execute_non_query, sql, database=database_name)
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to create index: {str(e)}")
     
     def _on_database_selection_changed(self):
         """Handle database selection change in the database tab"""
@@ -1530,7 +1824,7 @@ class DatabaseManagerDialog(QDialog):
                 return
                 
             # Update the database selector in the tables tab
-            index = self.tables_tab.db_selector.findText(selected_db)
+            index = self._find_row(self.tables_tab.db_selector, self._db_index, selected_db)
             if index >= 0:
                 self.tables_tab.db_selector.setCurrentIndex(index)
         
@@ -1547,7 +1841,7 @@ class DatabaseManagerDialog(QDialog):
             return
             
         # Update the database selector in the tables tab
-        index = self.tables_tab.db_selector.findText(selected_db)
+        index = self._find_row(self.tables_tab.db_selector, self._db_index, selected_db)
         if index >= 0:
             self.tables_tab.db_selector.setCurrentIndex(index)
         
@@ -1561,24 +1855,31 @@ class DatabaseManagerDialog(QDialog):
             is_system_db = self.connection.is_system_database(database_name)
             if is_system_db and not self._show_system_databases:
                 # Clear tables list if a system database is selected but they're hidden
-                self.tables_tab.tables_list.clear()
-                self.columns_tab.table_selector.clear()
-                self.indexes_tab.table_selector.clear()
+                self._clear_table_widgets()
                 return
                 
-            # Populate tables for the selected database
-            self._populate_tables(database_name)
-            
-            # Update table selectors in columns and indexes tabs
-            self._populate_table_selectors(database_name)
+            if self.tabs.currentIndex() == self.DATABASES_TAB_INDEX:
+                # Stepping through the databases list; the tables are only
+                # fetched once a tab that shows them is opened
+                self._pending_tables_db = database_name
+            else:
+                # Populate the tables list and the table selectors in the
+                # columns and indexes tabs for the selected database
+                self._refresh_tables_for_db(database_name)
         else:
             # Clear tables list if no database is selected
-            self.tables_tab.tables_list.clear()
-            self.columns_tab.table_selector.clear()
-            self.indexes_tab.table_selector.clear()
+            self._clear_table_widgets()
         
         self._update_tab_states()
     
+    def _clear_table_widgets(self):
+        """Empty the tables list and table selectors along with their name map"""
+        self._pending_tables_db = None
+        self.tables_tab.tables_list.clear()
+        self._table_index = {}
+        self.columns_tab.table_selector.clear()
+        self.indexes_tab.table_selector.clear()
+    
     def _on_table_selection_changed(self):
         """Handle table selection change in the tables tab"""
         selected_items = self.tables_tab.tables_list.selectedItems()
@@ -1586,34 +1887,35 @@ class DatabaseManagerDialog(QDialog):
             selected_table = selected_items[0].text()
             
             # Update the table selectors in the columns and indexes tabs
-            index = self.columns_tab.table_selector.findText(selected_table)
-            if index >= 0:
-                # Block signals to prevent triggering multiple updates
-                self.columns_tab.table_selector.blockSignals(True)
-                self.columns_tab.table_selector.setCurrentIndex(index)
-                self.columns_tab.table_selector.blockSignals(False)
-                
-                # Explicitly populate columns for the selected table
-                self._populate_columns(selected_table)
+            self._select_table_silently(self.columns_tab.table_selector, selected_table)
+            self._select_table_silently(self.indexes_tab.table_selector, selected_table)
             
-            index = self.indexes_tab.table_selector.findText(selected_table)
-            if index >= 0:
-                # Block signals to prevent triggering multiple updates
-                self.indexes_tab.table_selector.blockSignals(True)
-                self.indexes_tab.table_selector.setCurrentIndex(index)
-                self.indexes_tab.table_selector.blockSignals(False)
-                
-                # Explicitly populate indexes for the selected table
-                self._populate_indexes(selected_table)
+            # The columns and indexes are loaded when their tab is shown
+            self._invalidate_table_details()
         
         self._update_tab_states()
     
+    def _select_table_silently(self, selector, table_name):
+        """Select a table in a table selector without triggering its reload
+        
+        Returns:
+            True if the table is in the selector
+        """
+        index = self._find_row(selector, self._table_index, table_name)
+        if index < 0:
+            return False
+        
+        # Blocked so the caller decides when the list is reloaded
+        with QSignalBlocker(selector):
+            selector.setCurrentIndex(index)
+        return True
+    
     def _on_table_double_clicked(self, item):
         """Handle table double-click in the tables tab"""
         selected_table = item.text()
         
         # Update the table selector in the columns tab
-        index = self.columns_tab.table_selector.findText(selected_table)
+        index = self._find_row(self.columns_tab.table_selector, self._table_index, selected_table)
         if index >= 0:
             self.columns_tab.table_selector.setCurrentIndex(index)
         
@@ -1622,6 +1924,10 @@ class DatabaseManagerDialog(QDialog):
     
     def _on_tab_changed(self, index):
         """Handle tab change"""
+        # Load the tables of a database picked on the databases tab
+        if index != self.DATABASES_TAB_INDEX and self._pending_tables_db is not None:
+            self._refresh_tables_for_db(self._pending_tables_db)
+        
         if index == 1:  # Tables tab
             # If a database is selected in the database tab, update the tables tab
             selected_items = self.database_tab.databases_list.selectedItems()
@@ -1629,13 +1935,14 @@ class DatabaseManagerDialog(QDialog):
                 selected_db = selected_items[0].text()
                 
                 # Update the database selector in the tables tab
-                db_index = self.tables_tab.db_selector.findText(selected_db)
+                db_index = self._find_row(self.tables_tab.db_selector, self._db_index, selected_db)
                 if db_index >= 0:
                     self.tables_tab.db_selector.setCurrentIndex(db_index)
                     
-                    # Make sure tables are populated
+                    # Make sure tables are populated, filling the table
+                    # selectors from the same fetch
                     if self.tables_tab.tables_list.count() == 0:
-                        self._populate_tables(selected_db)
+                        self._refresh_tables_for_db(selected_db)
         
         elif index == 2:  # Columns tab
             # If a table is selected in the tables tab, update the columns tab
@@ -1643,16 +1950,12 @@ class DatabaseManagerDialog(QDialog):
             if selected_items:
                 selected_table = selected_items[0].text()
                 
-                # Update the table selector in the columns tab
-                table_index = self.columns_tab.table_selector.findText(selected_table)
-                if table_index >= 0:
-                    # Block signals to prevent triggering multiple updates
-                    self.columns_tab.table_selector.blockSignals(True)
-                    self.columns_tab.table_selector.setCurrentIndex(table_index)
-                    self.columns_tab.table_selector.blockSignals(False)
-                    
-                    # Explicitly populate columns for the selected table
-                    self._populate_columns(selected_table)
+                # Update the table selector in the columns tab. The list only
+                # needs reloading if that switched to another table.
+                selector = self.columns_tab.table_selector
+                if (selector.currentText() != selected_table
+                        and self._select_table_silently(selector, selected_table)):
+                    self._stale_tabs.add(self.COLUMNS_TAB_INDEX)
         
         elif index == 3:  # Indexes tab
             # If a table is selected in the tables tab, update the indexes tab
@@ -1660,33 +1963,51 @@ class DatabaseManagerDialog(QDialog):
             if selected_items:
                 selected_table = selected_items[0].text()
                 
-                # Update the table selector in the indexes tab
-                table_index = self.indexes_tab.table_selector.findText(selected_table)
-                if table_index >= 0:
-                    # Block signals to prevent triggering multiple updates
-                    self.indexes_tab.table_selector.blockSignals(True)
-                    self.indexes_tab.table_selector.setCurrentIndex(table_index)
-                    self.indexes_tab.table_selector.blockSignals(False)
-                    
-                    # Explicitly populate indexes for the selected table
-                    self._populate_indexes(selected_table)
+                # Update the table selector in the indexes tab. The list only
+                # needs reloading if that switched to another table.
+                selector = self.indexes_tab.table_selector
+                if (selector.currentText() != selected_table
+                        and self._select_table_silently(selector, selected_table)):
+                    self._stale_tabs.add(self.INDEXES_TAB_INDEX)
+        
+        # Populate the list of the tab being shown if it is out of date
+        self._load_stale_tab(index)
+    
+    def _invalidate_table_details(self):
+        """Mark the columns and indexes lists as out of date
+        
+        The list of the visible tab is reloaded right away, the other one the
+        next time its tab is shown, so selecting a table does not query
+        columns and indexes that the user may never look at.
+        """
+        self._stale_tabs.update((self.COLUMNS_TAB_INDEX, self.INDEXES_TAB_INDEX))
+        self._load_stale_tab(self.tabs.currentIndex())
+    
+    def _load_stale_tab(self, index):
+        """Populate the columns or indexes list of a tab if it is out of date"""
+        if index not in self._stale_tabs:
+            return
+        
+        if index == self.COLUMNS_TAB_INDEX:
+            self._populate_selected_columns()
+        else:
+            self._populate_selected_indexes()
     
     def _drop_index(self):
-        """Drop the selected index"""
-        # Get the selected table and index
+        """Drop the selected indexes"""
+        # Get the selected table and indexes
         table_name = self.indexes_tab.table_selector.currentText()
-        selected_items = self.indexes_tab.indexes_list.selectedItems()
+        index_names = _selected_texts(self.indexes_tab.indexes_list)
         
-        if not table_name:
-            QMessageBox.warning(self, "Warning", "Please select a table.")
-            return
-        
-        if not selected_items:
-            QMessageBox.warning(self, "Warning", "Please select an index to drop.")
+        if not table_name or not index_names:
+            QMessageBox.warning(self, "Warning", "Please select a table and an index to drop.")
             return
             
         # Get the current database
         database_name = self.tables_tab.db_selector.currentText()
+        if not database_name:
+            QMessageBox.warning(self, "Warning", "No database selected.")
+            return
         
         # Check if this is a system database
         if self.connection.is_system_database(database_name):
@@ -1697,72 +2018,68 @@ class DatabaseManagerDialog(QDialog):
             )
             return
         
-        index_name = selected_items[0].text()
-        
-        # Confirm the drop operation
-        reply = QMessageBox.question(
-            self, "Confirm Drop",
-            f"Are you sure you want to drop the index '{index_name}'?\nThis action cannot be undone!",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+        # One confirmation covers all selected indexes
+        if len(index_names) == 1:
+            target = f"the index '{index_names[0]}'"
+        else:
+            target = f"the {len(index_names)} indexes " + ", ".join(f"'{name}'" for name in index_names)
+        self._confirm_drop(
+            f"Are you sure you want to drop {target}?\nThis action cannot be undone!",
+            lambda: self._do_drop_index(database_name, table_name, index_names)
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                # Execute the DROP INDEX statement
-                # Note: The exact syntax varies by database type
-                db_type = self.connection.params['type']
+
+    def _do_drop_index(self, database_name, table_name, index_names):
+        """Drop indexes once the user has confirmed it"""
+        try:
+            # Build the DROP INDEX statements
+            # Note: The exact syntax varies by database type. Index names
+            # are quoted, so names that are reserved words still work.
+            db_type = self._db_type
+            quoted_indexes = [self.connection.quote_ident(name) for name in index_names]
+            
+            if db_type == 'SQLite':
+                # SQLite drops one index per statement
+                statements = [f"DROP INDEX {quoted};" for quoted in quoted_indexes]
+            elif db_type == 'MySQL':
+                drops = ", ".join(f"DROP INDEX {quoted}" for quoted in quoted_indexes)
+                statements = [f"ALTER TABLE {self.connection.qualified_name(table_name, database_name)} {drops};"]
+            elif db_type == 'PostgreSQL':
+                statements = [f"DROP INDEX {', '.join(quoted_indexes)};"]
+            else:
+                QMessageBox.warning(self, "Not Supported", f"Dropping indexes is not supported for {db_type}.")
+                return
+            
+            def on_dropped():
+                # Refresh the indexes list
+                self._invalidate_db_cache(database_name, 'indexes')
+                self._populate_indexes(table_name, force=True)
                 
-                if db_type == 'SQLite':
-                    sql = f"DROP INDEX {index_name};"
-                elif db_type == 'MySQL':
-                    sql = f"DROP INDEX {index_name} ON {table_name};"
-                elif db_type == 'PostgreSQL':
-                    sql = f"DROP INDEX {index_name};"
+                if len(index_names) == 1:
+                    message = f"Index '{index_names[0]}' dropped successfully."
                 else:
-                    QMessageBox.warning(self, "Not Supported", f"Dropping indexes is not supported for {db_type}.")
-                    return
-                
-                # Get the current database from the tables tab
-                database_name = self.tables_tab.db_selector.currentText()
-                if not database_name:
-                    QMessageBox.warning(self, "Warning", "No database selected.")
-                    return
-                
-                # Save current database
-                current_db = self.connection.get_database_name()
-                
-                try:
-                    # Switch to the selected database temporarily if needed
-                    if current_db != database_name:
-                        self.connection.use_database(database_name)
-                    
-                    # Execute the DROP INDEX statement
-                    self.connection.execute_non_query(sql)
-                    
-                    # Refresh the indexes list
-                    self._populate_indexes(table_name)
-                finally:
-                    # Switch back to the original database if needed
-                    if current_db != database_name and current_db != "(No database selected)":
-                        self.connection.use_database(current_db)
-                
-                QMessageBox.information(self, "Success", f"Index '{index_name}' dropped successfully.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to drop index: {str(e)}")
+                    message = f"{len(index_names)} indexes dropped successfully."
+                self._show_status(message)
+            
+            # Execute the statements in the selected database, in a single
+            # transaction when there is more than one
+            if len(statements) == 1:
+                self._run_ddl(on_dropped, "Failed to drop index",
+                              self.connection.execute_non_query, statements[0], database=database_name)
+            else:
+                self._run_ddl(on_dropped, "Failed to drop indexes",
+                              self.connection.execute_batch, statements, database=database_name)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to drop index: {str(e)}")
 
     def _populate_add_record_table_selector(self):
         """Populate the table/collection selector in the Add Record tab"""
-        self.add_record_tab.table_selector.blockSignals(True)
-        self.add_record_tab.table_selector.clear()
-        try:
-            tables = self.connection.get_tables()
-            self.add_record_tab.table_selector.addItems(tables)
-        except Exception as e:
-            if not self._test_mode:
-                QMessageBox.warning(self, "Error", f"Failed to retrieve tables: {str(e)}")
-        finally:
-            self.add_record_tab.table_selector.blockSignals(False)
+        with QSignalBlocker(self.add_record_tab.table_selector):
+            self.add_record_tab.table_selector.clear()
+            try:
+                tables = self.connection.get_tables()
+                self.add_record_tab.table_selector.addItems(tables)
+            except Exception as e:
+                self._report_error(f"Failed to retrieve tables: {str(e)}")
 
         current_table = self.add_record_tab.table_selector.currentText()
         if current_table:
@@ -1770,7 +2087,7 @@ class DatabaseManagerDialog(QDialog):
 
     def _on_add_record_table_changed(self, table_name: str):
         """Rebuild the fields form when the selected table/collection changes"""
-        is_mongodb = self.connection.params.get('type') == 'MongoDB'
+        is_mongodb = self._db_type == 'MongoDB'
         fields_container = self.add_record_tab.fields_container
         layout = fields_container.layout()
 
@@ -1791,8 +2108,7 @@ class DatabaseManagerDialog(QDialog):
             try:
                 columns = self.connection.get_columns(table_name)
             except Exception as e:
-                if not self._test_mode:
-                    QMessageBox.warning(self, "Error", f"Failed to retrieve columns: {str(e)}")
+                self._report_error(f"Failed to retrieve columns: {str(e)}")
                 return
 
             for col in columns:
@@ -1873,7 +2189,7 @@ class DatabaseManagerDialog(QDialog):
                 QMessageBox.warning(self, "Warning", "Please select a table/collection first.")
             return
 
-        is_mongodb = self.connection.params.get('type') == 'MongoDB'
+        is_mongodb = self._db_type == 'MongoDB'
 
         try:
             if is_mongodb:
@@ -1987,6 +2303,31 @@ class DatabaseManagerDialog(QDialog):
         self._clear_add_record_form()
 
 
+class ColumnTypeDelegate(QStyledItemDelegate):
+    """Edits a column type cell with a combo box of the known types
+    
+    The type is stored as the item text; the combo box only exists while the
+    cell is being edited instead of living in every row.
+    """
+    
+    def createEditor(self, parent, option, index):
+        """Create the combo box used to edit the cell"""
+        editor = QComboBox(parent)
+        editor.addItems(_CREATE_TABLE_TYPES)
+        
+        # Store the choice as soon as it is made
+        editor.activated.connect(lambda _: self.commitData.emit(editor))
+        return editor
+    
+    def setEditorData(self, editor, index):
+        """Select the cell's type in the combo box"""
+        editor.setCurrentText(index.data())
+    
+    def setModelData(self, editor, model, index):
+        """Write the selected type back to the cell"""
+        model.setData(index, editor.currentText())
+
+
 class CreateTableDialog(QDialog):
     """Dialog for creating a new table"""
     
@@ -2032,6 +2373,7 @@ class CreateTableDialog(QDialog):
         header = self.columns_table.horizontalHeader()
         if header:
             header.setStretchLastSection(True)
+        self.columns_table.setItemDelegateForColumn(1, ColumnTypeDelegate(self.columns_table))
         layout.addWidget(self.columns_table)
         
         # Column buttons
@@ -2057,32 +2399,41 @@ class CreateTableDialog(QDialog):
     
     def _add_column(self):
         """Add a new column to the table"""
-        row_count = self.columns_table.rowCount()
-        self.columns_table.setRowCount(row_count + 1)
-        
-        # Add column name cell
-        self.columns_table.setItem(row_count, 0, QTableWidgetItem(""))
-        
-        # Add column type cell with common SQL types
-        type_combo = QComboBox()
-        type_combo.addItems([
-            "INTEGER", "BIGINT", "SMALLINT", "TINYINT",
-            "FLOAT", "DOUBLE(10,2)", "DECIMAL(10,2)",
-            "CHAR(1)", "VARCHAR(255)", "TEXT",
-            "DATE", "TIME", "DATETIME", "TIMESTAMP",
-            "BOOLEAN", "BLOB"
-        ])
-        self.columns_table.setCellWidget(row_count, 1, type_combo)
-        
-        # Add primary key checkbox
-        pk_checkbox = QCheckBox()
-        pk_checkbox.setChecked(False)
-        self.columns_table.setCellWidget(row_count, 2, pk_checkbox)
-        
-        # Add nullable checkbox
-        nullable_checkbox = QCheckBox()
-        nullable_checkbox.setChecked(True)
-        self.columns_table.setCellWidget(row_count, 3, nullable_checkbox)
+        self.add_columns([{}])
+    
+    def add_columns(self, columns):
+        """Append rows for several columns with one resize of the table
+        
+        Args:
+            columns: Column definitions as returned by get_table_definition.
+                Missing keys get the values of a new row: no name, the
+                first type, not a primary key and nullable.
+        """
+        # One repaint for all rows and their cells
+        with _bulk_update(self.columns_table):
+            first_row = self.columns_table.rowCount()
+            self.columns_table.setRowCount(first_row + len(columns))
+            
+            for row, column in enumerate(columns, first_row):
+                # Column name cell
+                self.columns_table.setItem(row, 0, QTableWidgetItem(column.get('name', "")))
+                
+                # Column type cell, edited through the ColumnTypeDelegate
+                self.columns_table.setItem(row, 1, QTableWidgetItem(column.get('type', _CREATE_TABLE_TYPES[0])))
+                
+                # Primary key and nullable check cells
+                self.columns_table.setItem(row, 2, self._check_item(column.get('primary_key', False)))
+                self.columns_table.setItem(row, 3, self._check_item(column.get('nullable', True)))
+    
+    @staticmethod
+    def _check_item(checked):
+        """Return a non-editable cell holding only a check box"""
+        item = QTableWidgetItem()
+        item.setFlags(
+            Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+        )
+        item.setCheckState(Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked)
+        return item
     
     def _remove_column(self):
         """Remove the selected column from the table"""
@@ -2094,6 +2445,11 @@ class CreateTableDialog(QDialog):
         row = selected_rows[0].row()
         self.columns_table.removeRow(row)
     
+    def reset_fields(self):
+        """Clear the table name and columns so the dialog can be shown again"""
+        self.table_name_edit.clear()
+        self.columns_table.setRowCount(0)
+    
     def get_table_definition(self):
         """Get the table definition from the dialog"""
         table_def = {
@@ -2109,26 +2465,26 @@ class CreateTableDialog(QDialog):
                 continue
             
             # Get column type
-            type_combo = self.columns_table.cellWidget(row, 1)
-            if not type_combo:
+            type_item = self.columns_table.item(row, 1)
+            if not type_item:
                 continue
             
             # Get primary key flag
-            pk_checkbox = self.columns_table.cellWidget(row, 2)
-            if not pk_checkbox:
+            pk_item = self.columns_table.item(row, 2)
+            if not pk_item:
                 continue
             
             # Get nullable flag
-            nullable_checkbox = self.columns_table.cellWidget(row, 3)
-            if not nullable_checkbox:
+            nullable_item = self.columns_table.item(row, 3)
+            if not nullable_item:
                 continue
             
             # Add column definition
             table_def['columns'].append({
                 'name': name_item.text(),
-                'type': cast(QComboBox, type_combo).currentText(),
-                'primary_key': cast(QCheckBox, pk_checkbox).isChecked(),
-                'nullable': cast(QCheckBox, nullable_checkbox).isChecked()
+                'type': type_item.text(),
+                'primary_key': pk_item.checkState() == Qt.CheckState.Checked,
+                'nullable': nullable_item.checkState() == Qt.CheckState.Checked
             })
         
         return table_def
@@ -2222,23 +2578,16 @@ class AddColumnDialog(QDialog):
     
     def _on_column_type_changed(self, column_type):
         """Handle column type changes to show/hide size and precision fields"""
-        # Types that need size specification
-        size_types = ["VARCHAR", "CHAR", "NVARCHAR", "NCHAR"]
-        # Types that need both size and precision
-        precision_types = ["DECIMAL", "NUMERIC", "FLOAT", "DOUBLE"]
-        
-        if column_type in size_types:
+        if column_type in _SIZED_TYPES:
             self.size_edit.setVisible(True)
             self.precision_edit.setVisible(False)
             self.size_edit.setPlaceholderText("Length (1-255)")
             
             # Set reasonable defaults for string types
-            if not self.size_edit.text() and column_type in ["VARCHAR", "NVARCHAR"]:
-                self.size_edit.setText("255")  # Common default for VARCHAR
-            elif not self.size_edit.text() and column_type in ["CHAR", "NCHAR"]:
-                self.size_edit.setText("1")    # Common default for CHAR
+            if not self.size_edit.text():
+                self.size_edit.setText(_DEFAULT_LENGTHS[column_type])
                 
-        elif column_type in precision_types:
+        elif column_type in _PRECISION_TYPES:
             self.size_edit.setVisible(True)
             self.precision_edit.setVisible(True)
             
@@ -2264,6 +2613,18 @@ class AddColumnDialog(QDialog):
         else:
             self.size_edit.setVisible(False)
             self.precision_edit.setVisible(False)
+    
+    def reset_fields(self):
+        """Restore the initial field values so the dialog can be shown again"""
+        self.column_name_edit.clear()
+        self.size_edit.clear()
+        self.precision_edit.clear()
+        self.nullable_checkbox.setChecked(True)
+        self.default_value_edit.clear()
+        
+        with QSignalBlocker(self.column_type_combo):
+            self.column_type_combo.setCurrentIndex(0)
+        self._on_column_type_changed(self.column_type_combo.currentText())
             
     def accept(self):
         """Override accept to validate input before closing the dialog"""
@@ -2274,10 +2635,8 @@ class AddColumnDialog(QDialog):
             
         # Validate size/precision for types that require it
         column_type = self.column_type_combo.currentText()
-        size_types = ["VARCHAR", "CHAR", "NVARCHAR", "NCHAR"]
-        precision_types = ["DECIMAL", "NUMERIC", "FLOAT", "DOUBLE"]
         
-        if column_type in size_types and self.size_edit.isVisible():
+        if column_type in _SIZED_TYPES and self.size_edit.isVisible():
             try:
                 size = int(self.size_edit.text())
                 if size <= 0:
@@ -2285,7 +2644,7 @@ class AddColumnDialog(QDialog):
                     return
                     
                 # Specific validation for different types
-                if column_type in ["VARCHAR", "NVARCHAR"] and size > 65535:
+                if column_type in _VARYING_TYPES and size > 65535:
                     QMessageBox.warning(self, "Validation Error", "Maximum VARCHAR length is 65535.")
                     return
             except ValueError:
@@ -2293,7 +2652,7 @@ class AddColumnDialog(QDialog):
                     QMessageBox.warning(self, "Validation Error", "Size must be a valid number.")
                     return
                 
-        elif column_type in precision_types and self.size_edit.isVisible():
+        elif column_type in _PRECISION_TYPES and self.size_edit.isVisible():
             try:
                 if self.size_edit.text():
                     digits = int(self.size_edit.text())
@@ -2329,33 +2688,30 @@ class AddColumnDialog(QDialog):
         # Get the base type
         column_type = self.column_type_combo.currentText()
         
-        # Add size/precision if applicable
-        size_types = ["VARCHAR", "CHAR", "NVARCHAR", "NCHAR"]
-        precision_types = ["DECIMAL", "NUMERIC", "FLOAT", "DOUBLE"]
-        
-        # Track if we're using a numeric type with precision for default value formatting
-        is_precise_numeric = False
-        precision_value = "0"
+        # Decimals of a numeric type with precision, used to format the default
+        decimals = None
         
-        if column_type in size_types and self.size_edit.text():
+        # Add size/precision if applicable
+        if column_type in _SIZED_TYPES and self.size_edit.text():
             column_type = f"{column_type}({self.size_edit.text()})"
-        elif column_type in precision_types:
+        elif column_type in _PRECISION_TYPES:
             size = self.size_edit.text() or "10"  # Default size if not specified
             precision = self.precision_edit.text() or "0"  # Default precision if not specified
-            precision_value = precision
             if self.size_edit.text() or self.precision_edit.text():
                 column_type = f"{column_type}({size},{precision})"
-                is_precise_numeric = True
+                try:
+                    decimals = min(max(int(precision), 0), len(_DECIMAL_FORMATS) - 1)
+                except ValueError:
+                    # Leave the default as entered
+                    pass
         
         # Format default value appropriately for the data type
         if default_value is not None:
             # For numeric types with precision, ensure default value matches the format
-            if is_precise_numeric and column_type in precision_types:
+            if decimals is not None:
                 try:
-                    # Try to format the number with the specified precision
-                    num_value = float(default_value)
                     # Format as string with the correct number of decimal places
-                    default_value = f"{num_value:.{precision_value}f}"
+                    default_value = format(float(default_value), _DECIMAL_FORMATS[decimals])
                 except ValueError:
                     # If it's not a valid number, leave it as is
                     pass
@@ -2384,12 +2740,33 @@ class CreateIndexDialog(QDialog):
         """Set test mode to prevent UI operations during tests"""
         cls._test_mode = enabled
     
-    def __init__(self, connection, parent=None):
+    def __init__(self, connection, parent=None, database_name=None,
+                 get_tables=None, get_columns=None):
+        """
+        Initialize the dialog
+        
+        Args:
+            connection: Connection to read the tables and columns from
+            parent: Parent widget
+            database_name: Database whose tables are offered, defaults to the
+                connection's current database
+            get_tables: Callable taking the database name and returning its
+                tables, defaults to asking the connection
+            get_columns: Callable taking the database and table names and
+                returning the columns, defaults to asking the connection
+        """
         super().__init__(parent)
         
         self.connection = connection
-        self.database_name: Optional[str] = None  # Initialize database_name attribute
-        self.original_db: Optional[str] = None    # Initialize original_db attribute
+        self.database_name = database_name
+        self._get_tables = get_tables or (
+            lambda database: connection.get_tables(database=database))
+        self._get_columns = get_columns or (
+            lambda database, table: connection.get_columns(table, database=database))
+        
+        # Column names per table, so switching back to a table does not
+        # query the schema again
+        self._column_names = {}
         
         self.setWindowTitle("Create Index")
         self.resize(400, 300)
@@ -2443,43 +2820,33 @@ class CreateIndexDialog(QDialog):
     
     def _populate_tables(self):
         """Populate the tables combo box"""
-        self.table_combo.clear()
-        
+        tables = []
         try:
-            # If we have a specific database set, make sure we're using it
-            if hasattr(self, 'database_name'):
-                # We're already in the correct database context because
-                # the parent dialog switched to it before creating this dialog
-                tables = self.connection.get_tables()
-            else:
-                # Just use whatever database is currently selected
-                tables = self.connection.get_tables()
-                
+            tables = self._get_tables(self.database_name)
+        except Exception:
+            logger.debug("Error populating tables", exc_info=True)
+        
+        # Signals stay blocked while refilling, so the columns are loaded
+        # once for the table that ends up selected
+        with _bulk_update(self.table_combo):
+            self.table_combo.clear()
             self.table_combo.addItems(tables)
-        except Exception as e:
-            print(f"Error populating tables: {e}")
+        self._populate_columns(self.table_combo.currentText())
     
     def _populate_columns(self, table_name):
         """Populate the columns list for the selected table"""
-        self.columns_list.clear()
-        
-        if not table_name:
-            return
-        
-        try:
-            # If we have a specific database set, make sure we're using it
-            if hasattr(self, 'database_name'):
-                # We're already in the correct database context because
-                # the parent dialog switched to it before creating this dialog
-                columns = self.connection.get_columns(table_name)
-            else:
-                # Just use whatever database is currently selected
-                columns = self.connection.get_columns(table_name)
-                
-            for column in columns:
-                self.columns_list.addItem(column['name'])
-        except Exception as e:
-            print(f"Error populating columns: {e}")
+        names = self._column_names.get(table_name, [])
+        if table_name and table_name not in self._column_names:
+            try:
+                columns = self._get_columns(self.database_name, table_name)
+                names = [column['name'] for column in columns]
+                self._column_names[table_name] = names
+            except Exception:
+                logger.debug("Error populating columns", exc_info=True)
+        
+        with _bulk_update(self.columns_list):
+            self.columns_list.clear()
+            self.columns_list.addItems(names)
     
     def get_index_definition(self):
         """Get the index definition from the dialog"""
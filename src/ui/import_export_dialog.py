@@ -2,16 +2,41 @@
 Dialog for database import and export operations
 """
 
+import io
 import os
+import pathlib
+import shutil
 import subprocess
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
     QPushButton, QFileDialog, QListWidget, QCheckBox,
     QRadioButton, QButtonGroup, QGroupBox, QMessageBox,
-    QProgressDialog, QInputDialog
+    QProgressDialog, QInputDialog, QSpinBox
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QSignalBlocker
+
+from src.core.connection_manager import DEFAULT_ROWS_PER_INSERT, EXPORT_BUFFER_SIZE, open_excel_writer
+from src.ui.worker import run_in_background
+
+# Tables read at the same time during a multi-table CSV export
+EXPORT_WORKERS = 4
+
+# Row of the format combo box for each export file extension
+_FORMAT_INDEX_BY_EXTENSION = {'sql': 0, 'csv': 1, 'xlsx': 2, 'xls': 2}
+
+# Size up to which a table's CSV is kept in memory before the export
+# spills it to a temporary file
+EXPORT_SPOOL_SIZE = 16 * 1024 * 1024
+
+
+class ExportCancelled(Exception):
+    """Raised on the export thread when the user cancels the export"""
+
 
 class ImportExportDialog(QDialog):
     """Dialog for importing and exporting database data"""
@@ -31,8 +56,13 @@ class ImportExportDialog(QDialog):
         self.mode = mode
         self.selected_tables = []
         self.file_path = ""
+        # Output file the user already agreed to replace in _browse_file
+        self._confirmed_path = None
         self.is_mongodb = connection.params.get('type') == 'MongoDB'
         
+        # Tables offered for export, fetched once for the list and the export
+        self._all_tables = list(connection.get_tables()) if mode == "export" else []
+        
         self._create_ui()
     
     def _create_ui(self):
@@ -82,9 +112,12 @@ class ImportExportDialog(QDialog):
             self.tables_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
             self.tables_list.setEnabled(False)
             
-            # Populate the table list
-            for table in self.connection.get_tables():
-                self.tables_list.addItem(table)
+            # Populate the table list in one batch, without a repaint or
+            # selection signal per table
+            with QSignalBlocker(self.tables_list):
+                self.tables_list.setUpdatesEnabled(False)
+                self.tables_list.addItems(self._all_tables)
+                self.tables_list.setUpdatesEnabled(True)
             
             export_options_layout.addWidget(self.tables_list)
             
@@ -118,8 +151,23 @@ class ImportExportDialog(QDialog):
             self.format_combo.addItem("CSV", "csv")
             self.format_combo.addItem("Excel", "xlsx")
             self.format_combo.currentIndexChanged.connect(self._update_file_extension)
+            self.format_combo.currentIndexChanged.connect(self._update_format_options)
             format_layout.addWidget(self.format_combo)
             
+            # Only SQLite dumps are generated by DBridge itself; the other
+            # types use mysqldump and pg_dump
+            self.rows_per_insert_label = QLabel("Rows per INSERT:")
+            format_layout.addWidget(self.rows_per_insert_label)
+            self.rows_per_insert_spin = QSpinBox()
+            self.rows_per_insert_spin.setRange(1, 100000)
+            self.rows_per_insert_spin.setValue(DEFAULT_ROWS_PER_INSERT)
+            format_layout.addWidget(self.rows_per_insert_spin)
+            
+            # SQL dumps and single CSV files can be gzipped as they are written
+            self.compress_checkbox = QCheckBox("Gzip compress")
+            format_layout.addWidget(self.compress_checkbox)
+            self._update_format_options(self.format_combo.currentIndex())
+            
             format_layout.addStretch()
             layout.addLayout(format_layout)
         
@@ -146,28 +194,29 @@ class ImportExportDialog(QDialog):
         """Enable/disable table selection based on radio button state"""
         self.tables_list.setEnabled(self.selected_tables_radio.isChecked())
         
+    def _update_format_options(self, index):
+        """Show the options that apply to the selected format"""
+        show_rows_per_insert = (
+            self.format_combo.itemData(index) == "sql" and self.connection.params.get('type') == 'SQLite'
+        )
+        self.rows_per_insert_label.setVisible(show_rows_per_insert)
+        self.rows_per_insert_spin.setVisible(show_rows_per_insert)
+        self.compress_checkbox.setVisible(self.format_combo.itemData(index) in ("sql", "csv"))
+    
     def _update_file_extension(self, index):
         """Update the file path when the format changes"""
         if not self.file_path:
             return
-            
-        # Get the new format
-        format_data = self.format_combo.itemData(index)
-        
-        # Only update if we have a file path already
-        if self.file_path:
-            # Get the directory and base filename without extension
-            directory = os.path.dirname(self.file_path)
-            filename = os.path.basename(self.file_path)
-            base_name = os.path.splitext(filename)[0]
-            
-            # Create new filename with the new extension
-            new_filename = f"{base_name}.{format_data}"
-            new_path = os.path.join(directory, new_filename)
-            
-            # Update the file path
-            self.file_path = new_path
-            self.file_path_label.setText(new_path)
+        
+        # The item data of a format is its file extension
+        extension = f".{self.format_combo.itemData(index)}"
+        if self.file_path.lower().endswith(extension):
+            return
+        
+        # Replace the extension, keeping the directory and base name
+        new_path = os.fspath(pathlib.Path(self.file_path).with_suffix(extension))
+        self.file_path = new_path
+        self.file_path_label.setText(new_path)
     
     def _browse_file(self):
         """Open file dialog to select a file or directory"""
@@ -184,22 +233,10 @@ class ImportExportDialog(QDialog):
             
             if self.is_mongodb:
                 extension = "json"
-                filter_text = "JSON Files (*.json)"
             else:
-                # Get the current format
-                format_index = self.format_combo.currentIndex()
-                format_data = self.format_combo.itemData(format_index)
-                
-                # Set default extension based on format
-                if format_data == "sql":
-                    extension = "sql"
-                    filter_text = "SQL Files (*.sql)"
-                elif format_data == "csv":
-                    extension = "csv"
-                    filter_text = "CSV Files (*.csv)"
-                elif format_data == "xlsx":
-                    extension = "xlsx"
-                    filter_text = "Excel Files (*.xlsx)"
+                # The item data of the current format is its extension
+                format_data = self.format_combo.currentData()
+                extension = format_data
             
             # Now, get a filename
             filename, ok = QInputDialog.getText(
@@ -219,18 +256,13 @@ class ImportExportDialog(QDialog):
             # Construct full file path
             file_path = os.path.join(directory, filename)
             
-            # Check if file exists and confirm overwrite
-            if os.path.exists(file_path):
-                confirm = QMessageBox.question(
-                    self,
-                    "File Exists",
-                    f"The file '{filename}' already exists. Do you want to replace it?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
-                )
-                
-                if confirm != QMessageBox.StandardButton.Yes:
-                    return
+            # Check the file the export will actually write, e.g. the zip of
+            # a multi-table CSV export, and confirm overwrite once here
+            output_path = file_path
+            if not self.is_mongodb:
+                output_path = self._export_output_path(file_path, format_data, self._export_tables())
+            if not self._confirm_overwrite(output_path):
+                return
         else:
             # For import, use the standard file open dialog
             if self.is_mongodb:
@@ -254,13 +286,55 @@ class ImportExportDialog(QDialog):
             
             # Update format combo based on file extension for non-MongoDB export
             if self.mode == "export" and not self.is_mongodb:
-                extension = file_path.split('.')[-1].lower()
-                if extension == "sql":
-                    self.format_combo.setCurrentIndex(0)
-                elif extension == "csv":
-                    self.format_combo.setCurrentIndex(1)
-                elif extension in ["xlsx", "xls"]:
-                    self.format_combo.setCurrentIndex(2)
+                index = _FORMAT_INDEX_BY_EXTENSION.get(file_path.rpartition('.')[2].lower())
+                if index is not None:
+                    self.format_combo.setCurrentIndex(index)
+    
+    def _export_tables(self):
+        """Return the selected tables, or None when exporting all of them"""
+        if not self.selected_tables_radio.isChecked():
+            return None
+        return [item.text() for item in self.tables_list.selectedItems()]
+    
+    def _export_output_path(self, file_path, format_data, tables):
+        """Return the file an export to file_path writes
+        
+        Several tables exported as CSV go into a zip archive next to it, and
+        compressed exports get a .gz suffix.
+        
+        Args:
+            file_path: Path chosen by the user
+            format_data: "sql", "csv" or "xlsx"
+            tables: Tables to export, None for all of them
+        """
+        if tables is None:
+            tables = self._all_tables
+        if format_data == "csv" and len(tables) > 1:
+            return os.path.splitext(file_path)[0] + ".zip"
+        if format_data in ("sql", "csv") and self.compress_checkbox.isChecked() \
+                and not file_path.lower().endswith(".gz"):
+            return file_path + ".gz"
+        return file_path
+    
+    def _confirm_overwrite(self, file_path):
+        """Ask before replacing an existing file
+        
+        Returns:
+            True if the file does not exist or the user agreed to replace it
+        """
+        if os.path.exists(file_path):
+            confirm = QMessageBox.question(
+                self,
+                "File Exists",
+                f"The file '{os.path.basename(file_path)}' already exists. Do you want to replace it?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            
+            if confirm != QMessageBox.StandardButton.Yes:
+                return False
+        self._confirmed_path = file_path
+        return True
     
     def _handle_export(self):
         """Handle the export operation"""
@@ -268,150 +342,238 @@ class ImportExportDialog(QDialog):
             QMessageBox.warning(self, "Export Error", "Please select a file to export to.")
             return
         
-        try:
-            if self.is_mongodb:
-                # Get selected collections if applicable
-                collections = None
-                if self.selected_tables_radio.isChecked():
-                    collections = [item.text() for item in self.tables_list.selectedItems()]
-                    if not collections:
-                        QMessageBox.warning(self, "Export Error", "Please select at least one collection to export.")
-                        return
-                
-                progress = QProgressDialog("Exporting database as JSON...", "Cancel", 0, 100, self)
-                progress.setWindowModality(Qt.WindowModality.WindowModal)
-                progress.setValue(10)
-                
-                self.connection.export_to_json(self.file_path, collections)
-                
-                progress.setValue(100)
-                QMessageBox.information(self, "Export Complete", f"Database exported successfully to {self.file_path}")
-                self.accept()
-                return
-
+        entity = "collection" if self.is_mongodb else "table"
+        
+        # Get selected tables if applicable
+        tables = self._export_tables()
+        if tables is not None and not tables:
+            QMessageBox.warning(self, "Export Error", f"Please select at least one {entity} to export.")
+            return
+        
+        file_path = self.file_path
+        rows_per_insert = DEFAULT_ROWS_PER_INSERT
+        compress = False
+        if self.is_mongodb:
+            format_data = "json"
+            label = "Exporting database as JSON..."
+        else:
             # Get selected format
             format_data = self.format_combo.currentData()
-            
-            # Get selected tables if applicable
-            tables = None
-            if self.selected_tables_radio.isChecked():
-                tables = [item.text() for item in self.tables_list.selectedItems()]
-                if not tables:
-                    QMessageBox.warning(self, "Export Error", "Please select at least one table to export.")
-                    return
-            
-            # Show progress dialog
-            progress = QProgressDialog("Exporting database...", "Cancel", 0, 100, self)
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.setValue(10)
-            
-            # Perform export based on format
             if format_data == "sql":
-                # SQL export
-                db_type = self.connection.params['type']
-                progress.setLabelText(f"Exporting database as SQL ({db_type})...")
-                # File existence is already checked in _browse_file
-                self.connection.export_database_to_sql(self.file_path, tables)
+                label = f"Exporting database as SQL ({self.connection.params['type']})..."
+                rows_per_insert = self.rows_per_insert_spin.value()
             else:
-                # CSV or Excel export
+                label = "Exporting database..."
                 if tables is None:
                     # Export all tables
-                    tables = self.connection.get_tables()
-                
-                if len(tables) == 1:
-                    # Single table export
-                    table = tables[0]
-                    progress.setLabelText(f"Fetching data from {table}...")
-                    data = self.connection.execute_query(f"SELECT * FROM {table}")
-                    
-                    progress.setValue(50)
-                    progress.setLabelText(f"Writing {format_data.upper()} file...")
-                    
-                    # File existence is already checked in _browse_file
-                    if format_data == "csv":
-                        data.to_csv(self.file_path, index=False)
-                    else:  # xlsx
-                        data.to_excel(self.file_path, index=False)
-                else:
-                    # Multiple tables export
-                    import pandas as pd
-                    
-                    if format_data == "csv":
-                        # For CSV, we'll create a zip file containing multiple CSVs
-                        import zipfile
-                        import os
-                        
-                        # Change extension to .zip
-                        directory = os.path.dirname(self.file_path)
-                        filename = os.path.basename(self.file_path)
-                        base_name = os.path.splitext(filename)[0]
-                        zip_path = os.path.join(directory, f"{base_name}.zip")
-                        
-                        # Check if zip file exists and confirm overwrite
-                        if os.path.exists(zip_path):
-                            confirm = QMessageBox.question(
-                                self,
-                                "File Exists",
-                                f"The file '{os.path.basename(zip_path)}' already exists. Do you want to replace it?",
-                                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                QMessageBox.StandardButton.No
-                            )
-                            
-                            if confirm != QMessageBox.StandardButton.Yes:
-                                return
-                        
-                        with zipfile.ZipFile(zip_path, 'w') as zipf:
-                            total_tables = len(tables)
-                            for i, table in enumerate(tables):
-                                # Update progress
-                                progress_value = 10 + int(80 * (i / total_tables))
-                                progress.setValue(progress_value)
-                                progress.setLabelText(f"Exporting table: {table} ({i+1}/{total_tables})")
-                                
-                                data = self.connection.execute_query(f"SELECT * FROM {table}")
-                                
-                                # Create a temporary CSV file
-                                temp_csv = os.path.join(os.path.dirname(self.file_path), f"{table}.csv")
-                                data.to_csv(temp_csv, index=False)
-                                
-                                # Add to zip and remove temp file
-                                zipf.write(temp_csv, f"{table}.csv")
-                                os.remove(temp_csv)
-                        
-                        self.file_path = zip_path
-                    else:  # xlsx
-                        # For Excel, we'll create a workbook with multiple sheets
-                        # File existence is already checked in _browse_file
-                        with pd.ExcelWriter(self.file_path) as writer:
-                            total_tables = len(tables)
-                            for i, table in enumerate(tables):
-                                # Update progress
-                                progress_value = 10 + int(80 * (i / total_tables))
-                                progress.setValue(progress_value)
-                                progress.setLabelText(f"Exporting table: {table} ({i+1}/{total_tables})")
-                                
-                                data = self.connection.execute_query(f"SELECT * FROM {table}")
-                                data.to_excel(writer, sheet_name=table[:31], index=False)  # Excel limits sheet names to 31 chars
+                    tables = self._all_tables
             
-            progress.setValue(100)
+            file_path = self._export_output_path(file_path, format_data, tables)
+            compress = (format_data in ("sql", "csv") and self.compress_checkbox.isChecked()
+                        and not file_path.lower().endswith(".zip"))
             
-            QMessageBox.information(self, "Export Complete", f"Database exported successfully to {self.file_path}")
+            # Only ask again if the scope or format changed the output file
+            # since it was confirmed in _browse_file
+            if file_path != self._confirmed_path and not self._confirm_overwrite(file_path):
+                return
+        
+        # Show progress dialog. Cancel is honoured between the tables of a
+        # multi-table CSV or Excel export; the other exports run to the end.
+        progress = QProgressDialog(label, "Cancel", 0, 100, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        if format_data not in ("csv", "xlsx") or len(tables) == 1:
+            progress.setCancelButton(None)
+        progress.setValue(10)
+        cancelled = threading.Event()
+        progress.canceled.connect(cancelled.set)
+        self.export_button.setEnabled(False)
+        
+        def discard_export():
+            # Don't leave a partly written file behind
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        
+        def on_progress(value, text):
+            if not cancelled.is_set():
+                progress.setValue(value)
+                progress.setLabelText(text)
+        
+        def on_finished(_):
+            if cancelled.is_set():
+                # Cancelled after the last table was already written
+                progress.close()
+                self.export_button.setEnabled(True)
+                discard_export()
+                return
+            progress.setValue(100)
+            self.export_button.setEnabled(True)
+            self.file_path = file_path
+            QMessageBox.information(self, "Export Complete", f"Database exported successfully to {file_path}")
             self.accept()
-        except subprocess.CalledProcessError as e:
+        
+        def on_error(error):
+            progress.close()
+            self.export_button.setEnabled(True)
+            if isinstance(error, ExportCancelled):
+                discard_export()
+                return
+            self._show_export_error(error)
+        
+        run_in_background(
+            self._write_export, format_data, tables, file_path, rows_per_insert, compress, cancelled,
+            on_finished=on_finished, on_error=on_error, on_progress=on_progress
+        )
+    
+    def _write_export(self, format_data, tables, file_path, rows_per_insert, compress, cancelled, progress):
+        """Write the export to file_path
+        
+        Runs on a pool thread, so it must not touch any widgets.
+        
+        Args:
+            format_data: "json", "sql", "csv" or "xlsx"
+            tables: Tables to export, None for all of them with JSON and SQL
+            file_path: Path of the output file
+            rows_per_insert: Rows per INSERT statement of a SQL dump
+            compress: Gzip a SQL dump or single CSV file
+            cancelled: threading.Event set when the user cancels
+            progress: Callable taking a percentage and a message
+            
+        Raises:
+            ExportCancelled: If the user cancelled between two tables
+        """
+        if format_data == "json":
+            self.connection.export_to_json(file_path, tables)
+        elif format_data == "sql":
+            # File existence is already checked in _browse_file
+            self.connection.export_database_to_sql(
+                file_path, tables, rows_per_insert=rows_per_insert, compress=compress
+            )
+        elif len(tables) == 1:
+            # Single table export, streamed from the database into the file
+            # without loading the whole table
+            table = tables[0]
+            progress(10, f"Exporting table: {table}...")
+            
+            # File existence is already checked in _browse_file
+            if format_data == "csv":
+                self.connection.export_table_to_csv(table, file_path, compress=compress)
+            else:  # xlsx
+                self.connection.export_table_to_excel(table, file_path)
+        elif format_data == "csv":
+            # The archive is written through a large buffer. Fast
+            # compression keeps it small for little extra CPU.
+            with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as zip_file, \
+                    zipfile.ZipFile(zip_file, 'w', compression=zipfile.ZIP_DEFLATED,
+                                    compresslevel=1) as zipf:
+                self._write_csv_archive(zipf, tables, cancelled, progress)
+        else:  # xlsx
+            # For Excel, we'll create a workbook with multiple sheets
+            # File existence is already checked in _browse_file
+            with open_excel_writer(file_path) as writer:
+                for table in self._iter_export_tables(tables, cancelled, progress):
+                    # Each table is read in chunks into its own sheet
+                    self.connection.write_table_to_sheet(writer, table)
+    
+    def _write_csv_archive(self, zipf, tables, cancelled, progress):
+        """Write each table as a CSV entry of an open zip archive
+        
+        The tables are read in parallel on EXPORT_WORKERS threads. Each one is
+        spooled, and this thread adds the finished tables to the archive as
+        they complete, so only one thread writes to the zip file.
+        
+        Raises:
+            ExportCancelled: If the user cancelled before all tables were added
+        """
+        total_tables = len(tables)
+        shares = self._progress_shares(tables)
+        done = 10
+        executor = ThreadPoolExecutor(max_workers=min(EXPORT_WORKERS, total_tables))
+        futures = {executor.submit(self._spool_table_csv, table): table for table in tables}
+        unconsumed = set(futures)
+        try:
+            for i, future in enumerate(as_completed(futures)):
+                if cancelled.is_set():
+                    raise ExportCancelled()
+                table = futures[future]
+                progress(int(done), f"Exporting table: {table} ({i+1}/{total_tables})")
+                done += shares[table]
+                
+                unconsumed.discard(future)
+                with future.result() as spool, \
+                        zipf.open(f"{table}.csv", 'w', force_zip64=True) as entry:
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, entry, EXPORT_BUFFER_SIZE)
+        except BaseException:
+            # Don't start the tables that are still queued or wait for the
+            # running ones, and close every spool that won't be added
+            executor.shutdown(wait=False, cancel_futures=True)
+            for future in unconsumed:
+                future.add_done_callback(self._close_spool)
+            raise
+        executor.shutdown()
+    
+    @staticmethod
+    def _close_spool(future):
+        """Close the spool of a finished _spool_table_csv call"""
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+    
+    def _spool_table_csv(self, table):
+        """Write a table as CSV into a spooled temporary file and return it"""
+        spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+        try:
+            f = io.TextIOWrapper(spool, encoding='utf-8', newline='')
+            self.connection.write_table_csv(table, f)
+            f.detach()
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+    
+    def _iter_export_tables(self, tables, cancelled, progress):
+        """Yield the tables to export, reporting progress before each one
+        
+        Raises:
+            ExportCancelled: If the user cancelled since the previous table
+        """
+        total_tables = len(tables)
+        shares = self._progress_shares(tables)
+        done = 10
+        for i, table in enumerate(tables):
+            if cancelled.is_set():
+                raise ExportCancelled()
+            progress(int(done), f"Exporting table: {table} ({i+1}/{total_tables})")
+            done += shares[table]
+            yield table
+    
+    def _progress_shares(self, tables):
+        """Split 80% of the progress bar between the tables to export
+        
+        Each table gets a share proportional to its row count, which all come
+        from one statistics query. A table without a count weighs one row, so
+        without any counts every table gets an equal step.
+        """
+        counts = self.connection.get_table_row_counts(tables)
+        weights = {table: counts.get(table) or 1 for table in tables}
+        total = sum(weights.values())
+        return {table: 80 * weight / total for table, weight in weights.items()}
+    
+    def _show_export_error(self, error):
+        """Report a failed export to the user"""
+        if isinstance(error, subprocess.CalledProcessError):
             # Handle command-line tool errors
-            error_msg = f"Export failed with error code {e.returncode}.\n\n"
+            error_msg = f"Export failed with error code {error.returncode}.\n\n"
             
-            if hasattr(e, 'stderr') and e.stderr:
-                error_details = e.stderr.decode('utf-8', errors='replace')
+            if hasattr(error, 'stderr') and error.stderr:
+                error_details = error.stderr.decode('utf-8', errors='replace')
                 error_msg += f"Error details:\n{error_details}"
             else:
                 error_msg += "No additional error details available."
-            
-            QMessageBox.critical(self, "Export Error", error_msg)
-        except Exception as e:
+        else:
             # Handle other errors
-            error_msg = f"Failed to export database: {str(e)}"
-            QMessageBox.critical(self, "Export Error", error_msg)
+            error_msg = f"Failed to export database: {str(error)}"
+        
+        QMessageBox.critical(self, "Export Error", error_msg)
     
     def _handle_import(self):
         """Handle the import operation"""
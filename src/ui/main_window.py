@@ -2,6 +2,8 @@
 Main window for the DBridge application
 """
 
+import os
+
 from PyQt6.QtWidgets import (
     QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QTreeView, QTableView, QTextEdit, QPushButton,
@@ -9,17 +11,18 @@ from PyQt6.QtWidgets import (
     QDockWidget, QMenu, QMenuBar, QInputDialog, QListWidget, QDialog,
     QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QSignalBlocker
 from PyQt6.QtGui import QAction, QFont, QIcon, QPixmap, QActionGroup
 
-from src.ui.connection_dialog import ConnectionDialog
-from src.ui.connection_tab import ConnectionTab
-from src.ui.import_export_dialog import ImportExportDialog
-from src.ui.database_manager import DatabaseManagerDialog
+# The dialogs and ConnectionTab are imported where they are first used, so
+# their modules are only loaded once the window is up and one is needed
 from src.ui.theme_manager import ThemeManager, LIGHT_DEFAULT, LIGHT_BLUE, DARK_DEFAULT, DARK_BLUE
 from src.core.connection_manager import ConnectionManager
 from src import __version__
 
+# Connection types that ask for the password when it was not saved
+_PASSWORD_DB_TYPES = frozenset(('MySQL', 'PostgreSQL'))
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
@@ -29,6 +32,12 @@ class MainWindow(QMainWindow):
         self.connection_manager = ConnectionManager()
         self.theme_manager = ThemeManager()
         
+        # Scaled logo pixmaps by whether they are for a dark theme
+        self._logo_cache = {}
+        
+        # Open connection tabs by connection name
+        self._tab_by_conn = {}
+        
         self.setWindowTitle(f"DBridge Beta {__version__}")
         self.setMinimumSize(1000, 700)
         
@@ -67,6 +76,7 @@ class MainWindow(QMainWindow):
         
         # Connections submenu
         self.connections_menu = QMenu("Saved Connections", self)
+        self.connections_menu.triggered.connect(self._saved_connection_triggered)
         file_menu.addMenu(self.connections_menu)
         
         file_menu.addSeparator()
@@ -115,37 +125,20 @@ class MainWindow(QMainWindow):
             # Create action group for themes to make them exclusive
             theme_group = QActionGroup(self)
             theme_group.setExclusive(True)
-            
-            # Add theme actions
-            light_default_action = QAction(LIGHT_DEFAULT, self)
-            light_default_action.setCheckable(True)
-            light_default_action.setChecked(self.theme_manager.get_current_theme() == LIGHT_DEFAULT)
-            light_default_action.triggered.connect(lambda: self._change_theme(LIGHT_DEFAULT))
-            theme_group.addAction(light_default_action)
-            theme_menu.addAction(light_default_action)
-            
-            light_blue_action = QAction(LIGHT_BLUE, self)
-            light_blue_action.setCheckable(True)
-            light_blue_action.setChecked(self.theme_manager.get_current_theme() == LIGHT_BLUE)
-            light_blue_action.triggered.connect(lambda: self._change_theme(LIGHT_BLUE))
-            theme_group.addAction(light_blue_action)
-            theme_menu.addAction(light_blue_action)
-            
-            theme_menu.addSeparator()
-            
-            dark_default_action = QAction(DARK_DEFAULT, self)
-            dark_default_action.setCheckable(True)
-            dark_default_action.setChecked(self.theme_manager.get_current_theme() == DARK_DEFAULT)
-            dark_default_action.triggered.connect(lambda: self._change_theme(DARK_DEFAULT))
-            theme_group.addAction(dark_default_action)
-            theme_menu.addAction(dark_default_action)
-            
-            dark_blue_action = QAction(DARK_BLUE, self)
-            dark_blue_action.setCheckable(True)
-            dark_blue_action.setChecked(self.theme_manager.get_current_theme() == DARK_BLUE)
-            dark_blue_action.triggered.connect(lambda: self._change_theme(DARK_BLUE))
-            theme_group.addAction(dark_blue_action)
-            theme_menu.addAction(dark_blue_action)
+            theme_group.triggered.connect(self._theme_triggered)
+            
+            # Add theme actions, light and dark themes separated
+            current_theme = self.theme_manager.get_current_theme()
+            for theme in (LIGHT_DEFAULT, LIGHT_BLUE, None, DARK_DEFAULT, DARK_BLUE):
+                if theme is None:
+                    theme_menu.addSeparator()
+                    continue
+                theme_action = QAction(theme, self)
+                theme_action.setCheckable(True)
+                theme_action.setChecked(theme == current_theme)
+                theme_action.setData(theme)
+                theme_group.addAction(theme_action)
+                theme_menu.addAction(theme_action)
         
         # Query menu
         query_menu = menu_bar.addMenu("&Query")
@@ -231,19 +224,71 @@ class MainWindow(QMainWindow):
         self.connection_tabs.currentChanged.connect(self._tab_changed)
         
         # Add a welcome tab
-        welcome_widget = self._create_welcome_widget()
-        self.connection_tabs.addTab(welcome_widget, "Welcome")
+        self._welcome_widget = self._create_welcome_widget()
+        self.connection_tabs.addTab(self._welcome_widget, "Welcome")
         
         # Initially disable the database browser action since we start with the welcome tab
         self.show_db_browser_action.setEnabled(False)
         
         self.setCentralWidget(self.connection_tabs)
     
+    def _connection_tab(self, index=None):
+        """Get the connection tab at the given index, by default the current one
+        
+        Every tab but the welcome tab is a ConnectionTab, so its methods are
+        called directly instead of being looked up by name.
+        
+        Returns:
+            The ConnectionTab, or None for the welcome tab or an invalid index
+        """
+        if index is None:
+            index = self.connection_tabs.currentIndex()
+        tab = self.connection_tabs.widget(index)
+        if tab is None or tab is self._welcome_widget:
+            return None
+        return tab
+    
     def _is_dark_theme(self):
         """Check if the current theme is a dark theme"""
         current_theme = self.theme_manager.get_current_theme()
         return current_theme in [DARK_DEFAULT, DARK_BLUE]
     
+    def _get_logo_pixmap(self, dark):
+        """Get the logo for a dark or light theme, scaled to the button width
+        
+        The logo files are looked up and scaled once for each kind of theme.
+        A null pixmap is returned if no logo could be found.
+        """
+        logo_pixmap = self._logo_cache.get(dark)
+        if logo_pixmap is not None:
+            return logo_pixmap
+        
+        # Prefer the logo made for the theme, then try the other one
+        filenames = ("DBridge-w.png", "DBridge.png") if dark else ("DBridge.png", "DBridge-w.png")
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        possible_paths = [
+            path
+            for filename in filenames
+            for path in (
+                filename,  # Current directory
+                os.path.join(module_dir, f"../../{filename}"),  # Project root
+                os.path.join(module_dir, f"../resources/{filename}")  # Resources folder
+            )
+        ]
+        
+        logo_pixmap = QPixmap()
+        for path in possible_paths:
+            candidate = QPixmap(path)
+            if not candidate.isNull():
+                # Scale the logo to match the width of the button (150px width, keeping aspect ratio)
+                logo_pixmap = candidate.scaledToWidth(150, Qt.TransformationMode.SmoothTransformation)
+                break
+        else:
+            print("Warning: Could not load logo from any of the expected locations")
+        
+        self._logo_cache[dark] = logo_pixmap
+        return logo_pixmap
+    
     def _create_welcome_widget(self):
         """Create a welcome widget for the initial tab"""
         welcome_widget = QWidget()
@@ -289,55 +334,10 @@ class MainWindow(QMainWindow):
         logo_button_layout.setSpacing(0)  # No spacing between elements
         
         # Add DBridge logo above the new connection button
-        logo_label = QLabel()
-        # Try to load the logo from different possible locations
-        import os
-        
-        # Choose the appropriate logo based on the theme
-        logo_filename = "DBridge-w.png" if self._is_dark_theme() else "DBridge.png"
-        
-        possible_paths = [
-            logo_filename,  # Current directory
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), f"../../{logo_filename}"),  # Project root
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), f"../resources/{logo_filename}")  # Resources folder
-        ]
-        
-        logo_loaded = False
-        for path in possible_paths:
-            logo_pixmap = QPixmap(path)
-            if not logo_pixmap.isNull():
-                # Scale the logo to match the width of the button (150px width, keeping aspect ratio)
-                logo_pixmap = logo_pixmap.scaledToWidth(150, Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(logo_pixmap)
-                logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                logo_button_layout.addWidget(logo_label)
-                logo_loaded = True
-                print(f"Loaded logo from: {path}")
-                break
-        
-        # If the preferred logo isn't found, try the alternative logo
-        if not logo_loaded:
-            alt_logo_filename = "DBridge.png" if self._is_dark_theme() else "DBridge-w.png"
-            alt_possible_paths = [
-                alt_logo_filename,  # Current directory
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), f"../../{alt_logo_filename}"),  # Project root
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), f"../resources/{alt_logo_filename}")  # Resources folder
-            ]
-            
-            for path in alt_possible_paths:
-                logo_pixmap = QPixmap(path)
-                if not logo_pixmap.isNull():
-                    # Scale the logo to match the width of the button (150px width, keeping aspect ratio)
-                    logo_pixmap = logo_pixmap.scaledToWidth(150, Qt.TransformationMode.SmoothTransformation)
-                    logo_label.setPixmap(logo_pixmap)
-                    logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    logo_button_layout.addWidget(logo_label)
-                    logo_loaded = True
-                    print(f"Loaded alternative logo from: {path}")
-                    break
-        
-        if not logo_loaded:
-            print(f"Warning: Could not load logo from any of the expected locations")
+        self._welcome_logo_label = QLabel()
+        self._welcome_logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        logo_button_layout.addWidget(self._welcome_logo_label)
+        self._update_welcome_logo()
         
         # New connection button
         new_conn_button = QPushButton("New Connection")
@@ -350,26 +350,23 @@ class MainWindow(QMainWindow):
         
         connections_layout.addWidget(new_conn_widget)
         
-        # Saved connections section
-        if self.connection_manager.get_connection_names():
-            # List of saved connections
-            saved_conn_widget = QWidget()
-            saved_conn_layout = QVBoxLayout(saved_conn_widget)
-            saved_conn_layout.setContentsMargins(0, 0, 0, 0)
-            
-            saved_label = QLabel("Saved Connections:")
-            saved_conn_layout.addWidget(saved_label)
-            
-            conn_list = QListWidget()
-            conn_list.setMinimumHeight(100)  # Set a minimum height for the list
-            for name in self.connection_manager.get_connection_names():
-                conn_list.addItem(name)
-            conn_list.itemDoubleClicked.connect(
-                lambda item: self._connect_to_saved(item.text())
-            )
-            saved_conn_layout.addWidget(conn_list)
-            
-            connections_layout.addWidget(saved_conn_widget)
+        # Saved connections section, hidden while there are none
+        self._welcome_saved_widget = QWidget()
+        saved_conn_layout = QVBoxLayout(self._welcome_saved_widget)
+        saved_conn_layout.setContentsMargins(0, 0, 0, 0)
+        
+        saved_label = QLabel("Saved Connections:")
+        saved_conn_layout.addWidget(saved_label)
+        
+        # List of saved connections
+        self._welcome_conn_list = QListWidget()
+        self._welcome_conn_list.setMinimumHeight(100)  # Set a minimum height for the list
+        self._welcome_conn_list.setUniformItemSizes(True)
+        self._welcome_conn_list.itemDoubleClicked.connect(self._saved_connection_item_activated)
+        saved_conn_layout.addWidget(self._welcome_conn_list)
+        
+        connections_layout.addWidget(self._welcome_saved_widget)
+        self._refresh_welcome_connections()
         
         options_layout.addWidget(connections_container)
         
@@ -380,29 +377,60 @@ class MainWindow(QMainWindow):
         
         return welcome_widget
     
+    def _update_welcome_logo(self):
+        """Show the logo for the current theme on the welcome tab"""
+        logo_pixmap = self._get_logo_pixmap(self._is_dark_theme())
+        self._welcome_logo_label.setPixmap(logo_pixmap)
+        self._welcome_logo_label.setVisible(not logo_pixmap.isNull())
+    
+    def _refresh_welcome_connections(self):
+        """Update the saved connections listed on the welcome tab in place"""
+        names = self.connection_manager.get_connection_names()
+        # Refill the list in one batch, without a repaint or signal per item
+        with QSignalBlocker(self._welcome_conn_list):
+            self._welcome_conn_list.setUpdatesEnabled(False)
+            self._welcome_conn_list.clear()
+            self._welcome_conn_list.addItems(names)
+            self._welcome_conn_list.setUpdatesEnabled(True)
+        self._welcome_saved_widget.setVisible(bool(names))
+    
     def _populate_connections_menu(self):
         """Populate the connections menu with saved connections"""
         if self.connections_menu is None:
             return
             
         self.connections_menu.clear()
+        names = self.connection_manager.get_connection_names()
         
         # Add all saved connections
-        for name in self.connection_manager.get_connection_names():
+        for name in names:
             action = QAction(name, self)
-            action.triggered.connect(lambda checked, n=name: self._connect_to_saved(n))
+            # Opened by _saved_connection_triggered
+            action.setData(name)
             self.connections_menu.addAction(action)
         
         # Add separator and manage connections action if there are connections
-        if self.connection_manager.get_connection_names():
+        if names:
             self.connections_menu.addSeparator()
         
         manage_action = QAction("Manage Connections...", self)
         manage_action.triggered.connect(self._manage_connections)
         self.connections_menu.addAction(manage_action)
     
+    def _saved_connection_triggered(self, action):
+        """Open the saved connection of an action in the connections menu"""
+        connection_name = action.data()
+        # The Manage Connections action carries no name
+        if connection_name is not None:
+            self._connect_to_saved(connection_name)
+    
+    def _saved_connection_item_activated(self, item):
+        """Open the saved connection double-clicked in the welcome tab's list"""
+        self._connect_to_saved(item.text())
+    
     def _new_connection(self):
         """Open the connection dialog to create a new database connection"""
+        from src.ui.connection_dialog import ConnectionDialog
         dialog = ConnectionDialog(self)
         if dialog.exec():
             connection_params = dialog.get_connection_params()
@@ -417,9 +445,7 @@ class MainWindow(QMainWindow):
                 self._populate_connections_menu()
                 
                 # Update the welcome tab to show the new connection
-                welcome_widget = self._create_welcome_widget()
-                self.connection_tabs.removeTab(0)
-                self.connection_tabs.insertTab(0, welcome_widget, "Welcome")
+                self._refresh_welcome_connections()
                 
                 # Update status bar
                 self.status_bar.showMessage(f"Connected to {connection_params['name']}", 3000)
@@ -430,24 +456,18 @@ class MainWindow(QMainWindow):
         """Connect to a saved connection"""
         try:
             # Check if this connection is already open in a tab
-            for i in range(self.connection_tabs.count()):
-                tab = self.connection_tabs.widget(i)
-                if tab is not None and hasattr(tab, 'get_connection_name'):
-                    # Use getattr to get the method, which will satisfy Pylance
-                    get_name_method = getattr(tab, 'get_connection_name')
-                    if get_name_method() == connection_name:
-                        # Connection already open, just switch to that tab
-                        self.connection_tabs.setCurrentIndex(i)
-                        return
+            existing_tab = self._tab_by_conn.get(connection_name)
+            if existing_tab is not None:
+                # Connection already open, just switch to that tab
+                self.connection_tabs.setCurrentWidget(existing_tab)
+                return
             
             # Get the connection parameters
             if connection_name in self.connection_manager.connection_params:
-                conn_params = self.connection_manager.connection_params[connection_name].copy()
+                saved_params = self.connection_manager.connection_params[connection_name]
                 
                 # Check if this is a connection type that needs a password
-                needs_password = False
-                if conn_params['type'] in ['MySQL', 'PostgreSQL'] and ('password' not in conn_params or not conn_params['password']):
-                    needs_password = True
+                needs_password = saved_params['type'] in _PASSWORD_DB_TYPES and not saved_params.get('password')
                 
                 # Prompt for password if needed
                 if needs_password:
@@ -455,14 +475,15 @@ class MainWindow(QMainWindow):
                     password, ok = QInputDialog.getText(
                         self, 
                         f"Password for {connection_name}", 
-                        f"Enter password for {conn_params['user']}@{conn_params['host']}:",
+                        f"Enter password for {saved_params['user']}@{saved_params['host']}:",
                         QLineEdit.EchoMode.Password
                     )
                     if not ok:
                         # User cancelled
                         return
                     
-                    # Update the password
+                    # Update the password on a copy, the saved parameters keep none
+                    conn_params = saved_params.copy()
                     conn_params['password'] = password
                     
                     # Create the connection with the updated parameters
@@ -485,17 +506,28 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Connection Error", str(e))
     
     def _add_connection_tab(self, connection):
-        """Add a new tab for the given connection"""
-        # Create a new connection tab
-        connection_tab = ConnectionTab(connection)
-        connection_tab.connection_closed.connect(self._handle_connection_closed)
-        
-        # Add the tab
-        tab_index = self.connection_tabs.addTab(connection_tab, connection.params['name'])
-        
-        # Switch to the new tab
-        self.connection_tabs.setCurrentIndex(tab_index)
-        
+        """Add a new tab for the given connection and switch to it"""
+        # The new tab becomes current straight away, so there is nothing to
+        # gain from building it later. Pause painting instead, so the tab
+        # widget is drawn once with the finished tab rather than while the
+        # tab is built, added and switched to.
+        self.connection_tabs.setUpdatesEnabled(False)
+        try:
+            from src.ui.connection_tab import ConnectionTab
+
+            # Create a new connection tab
+            connection_tab = ConnectionTab(connection)
+            connection_tab.connection_closed.connect(self._handle_connection_closed)
+
+            # Add the tab
+            tab_index = self.connection_tabs.addTab(connection_tab, connection.params['name'])
+            self._tab_by_conn[connection.params['name']] = connection_tab
+
+            # Switch to the new tab
+            self.connection_tabs.setCurrentIndex(tab_index)
+        finally:
+            self.connection_tabs.setUpdatesEnabled(True)
+
         # Update the connection label
         self.connection_label.setText(f"Connected: {connection.params['name']}")
         
@@ -509,17 +541,18 @@ class MainWindow(QMainWindow):
             return
         
         # Get the tab widget
-        tab = self.connection_tabs.widget(index)
+        tab = self._connection_tab(index)
         
         # Check if the user has permission to disconnect
         # For now, we'll always allow disconnecting as it's a UI operation
         # and doesn't affect the database server
         
         # Close the connection
-        if tab is not None and hasattr(tab, 'close_connection'):
-            # Use getattr to get the method, which will satisfy Pylance
-            close_method = getattr(tab, 'close_connection')
-            close_method()
+        if tab is not None:
+            # Forget the tab first, so _handle_connection_closed leaves its
+            # removal to this method
+            self._tab_by_conn.pop(tab.get_connection_name(), None)
+            tab.close_connection()
         
         # Remove the tab
         self.connection_tabs.removeTab(index)
@@ -529,15 +562,10 @@ class MainWindow(QMainWindow):
     
     def _handle_connection_closed(self, connection_name):
         """Handle when a connection is closed from within a tab"""
-        # Find and remove the tab for this connection
-        for i in range(self.connection_tabs.count()):
-            tab = self.connection_tabs.widget(i)
-            if tab is not None and hasattr(tab, 'get_connection_name'):
-                # Use getattr to get the method, which will satisfy Pylance
-                get_name_method = getattr(tab, 'get_connection_name')
-                if get_name_method() == connection_name:
-                    self.connection_tabs.removeTab(i)
-                    break
+        # Remove the tab for this connection
+        tab = self._tab_by_conn.pop(connection_name, None)
+        if tab is not None:
+            self.connection_tabs.removeTab(self.connection_tabs.indexOf(tab))
         
         # Update the connection label and run query button state
         self._update_connection_label()
@@ -547,44 +575,30 @@ class MainWindow(QMainWindow):
         self._update_connection_label()
         
         # Update the database browser visibility action state
-        if index >= 0:
-            current_tab = self.connection_tabs.widget(index)
-            if current_tab is not None and hasattr(current_tab, 'is_database_browser_visible'):
-                # Use getattr to get the method, which will satisfy Pylance
-                is_visible_method = getattr(current_tab, 'is_database_browser_visible')
-                visible = is_visible_method()
-                self.show_db_browser_action.setText("Hide Database Browser" if visible else "Show Database Browser")
-                self.show_db_browser_action.setChecked(visible)
-                self.show_db_browser_action.setEnabled(True)
-            else:
-                self.show_db_browser_action.setEnabled(False)
+        current_tab = self._connection_tab(index)
+        if current_tab is not None:
+            visible = current_tab.is_database_browser_visible()
+            self.show_db_browser_action.setText("Hide Database Browser" if visible else "Show Database Browser")
+            self.show_db_browser_action.setChecked(visible)
+            self.show_db_browser_action.setEnabled(True)
+        else:
+            self.show_db_browser_action.setEnabled(False)
         
         # Update the run query button state
         self._update_run_query_button_state()
 
         # Update import action label based on connection type
-        if index >= 0:
-            current_tab = self.connection_tabs.widget(index)
-            if current_tab is not None and hasattr(current_tab, 'connection'):
-                connection = getattr(current_tab, 'connection')
-                if connection is not None and connection.params.get('type') == 'MongoDB':
-                    self.import_sql_action.setText("Import JSON File...")
-                else:
-                    self.import_sql_action.setText("Import SQL File...")
-            else:
-                self.import_sql_action.setText("Import SQL File...")
+        connection = current_tab.connection if current_tab is not None else None
+        if connection is not None and connection.params.get('type') == 'MongoDB':
+            self.import_sql_action.setText("Import JSON File...")
+        else:
+            self.import_sql_action.setText("Import SQL File...")
     
     def _update_connection_label(self):
         """Update the connection label based on the current tab"""
-        current_index = self.connection_tabs.currentIndex()
-        if current_index >= 0:
-            current_tab = self.connection_tabs.widget(current_index)
-            if current_tab is not None and hasattr(current_tab, 'get_connection_name'):
-                # Use getattr to get the method, which will satisfy Pylance
-                get_name_method = getattr(current_tab, 'get_connection_name')
-                self.connection_label.setText(f"Connected: {get_name_method()}")
-            else:
-                self.connection_label.setText("Not connected")
+        current_tab = self._connection_tab()
+        if current_tab is not None:
+            self.connection_label.setText(f"Connected: {current_tab.get_connection_name()}")
         else:
             self.connection_label.setText("Not connected")
         
@@ -593,14 +607,8 @@ class MainWindow(QMainWindow):
     
     def _update_run_query_button_state(self):
         """Update the state of the run query button based on the current tab"""
-        current_index = self.connection_tabs.currentIndex()
-        is_connected = False
-        
-        if current_index >= 0:
-            current_tab = self.connection_tabs.widget(current_index)
-            # Check if this is a connection tab (has run_query method)
-            if current_tab is not None and hasattr(current_tab, 'run_query'):
-                is_connected = True
+        # Queries can be run in any connection tab
+        is_connected = self._connection_tab() is not None
         
         # Update both the toolbar button and menu action
         self.run_action.setEnabled(is_connected)
@@ -608,17 +616,13 @@ class MainWindow(QMainWindow):
     
     def _run_query(self):
         """Execute the current query in the active connection tab"""
-        current_index = self.connection_tabs.currentIndex()
-        if current_index >= 0:
-            current_tab = self.connection_tabs.widget(current_index)
-            if current_tab is not None and hasattr(current_tab, 'run_query'):
-                # Use getattr to get the run_query method, which will satisfy Pylance
-                run_query_method = getattr(current_tab, 'run_query')
-                success, message = run_query_method()
-                if success:
-                    self.status_bar.showMessage(message, 3000)
-            else:
-                QMessageBox.warning(self, "Not Connected", "Please connect to a database first")
+        current_tab = self._connection_tab()
+        if current_tab is not None:
+            success, message = current_tab.run_query()
+            if success:
+                self.status_bar.showMessage(message, 3000)
+        else:
+            QMessageBox.warning(self, "Not Connected", "Please connect to a database first")
     
     def _manage_connections(self):
         """Open the connection management dialog"""
@@ -638,7 +642,10 @@ class MainWindow(QMainWindow):
         # Connection selection
         layout.addWidget(QLabel("Select a connection:"))
         connection_list = QListWidget()
+        connection_list.setUniformItemSizes(True)
+        connection_list.setUpdatesEnabled(False)
         connection_list.addItems(connection_names)
+        connection_list.setUpdatesEnabled(True)
         layout.addWidget(connection_list)
         
         # Buttons
@@ -678,15 +685,10 @@ class MainWindow(QMainWindow):
             )
             
             if confirm == QMessageBox.StandardButton.Yes:
-                # Close any open tabs for this connection
-                for i in range(self.connection_tabs.count()):
-                    tab = self.connection_tabs.widget(i)
-                    if tab is not None and hasattr(tab, 'get_connection_name'):
-                        # Use getattr to get the method, which will satisfy Pylance
-                        get_name_method = getattr(tab, 'get_connection_name')
-                        if get_name_method() == connection_name:
-                            self.connection_tabs.removeTab(i)
-                            break
+                # Close any open tab for this connection
+                tab = self._tab_by_conn.pop(connection_name, None)
+                if tab is not None:
+                    self.connection_tabs.removeTab(self.connection_tabs.indexOf(tab))
                 
                 # Remove the connection
                 self.connection_manager.remove_connection(connection_name)
@@ -695,9 +697,7 @@ class MainWindow(QMainWindow):
                 self._populate_connections_menu()
                 
                 # Update the welcome tab
-                welcome_widget = self._create_welcome_widget()
-                self.connection_tabs.removeTab(0)
-                self.connection_tabs.insertTab(0, welcome_widget, "Welcome")
+                self._refresh_welcome_connections()
                 
                 # Update the connection label
                 self._update_connection_label()
@@ -738,28 +738,22 @@ class MainWindow(QMainWindow):
             self._populate_connections_menu()
             
             # Update the welcome tab to reflect the changes
-            welcome_widget = self._create_welcome_widget()
-            self.connection_tabs.removeTab(0)
-            self.connection_tabs.insertTab(0, welcome_widget, "Welcome")
-            
-            # If the connection is currently open, close and reopen it
-            for i in range(self.connection_tabs.count()):
-                tab = self.connection_tabs.widget(i)
-                if tab is not None and hasattr(tab, 'get_connection_name'):
-                    # Use getattr to get the method, which will satisfy Pylance
-                    get_name_method = getattr(tab, 'get_connection_name')
-                    if get_name_method() == connection_name:
-                        # Close the connection
-                        self.connection_manager.close_connection(connection_name)
-                        # Remove the tab
-                        self.connection_tabs.removeTab(i)
-                    # Show a message to the user
-                    QMessageBox.information(
-                        self, 
-                        "Connection Updated", 
-                        f"The connection '{connection_name}' has been updated. You'll need to reconnect to apply the changes."
-                    )
-                    break
+            self._refresh_welcome_connections()
+            
+            # If the connection is currently open, close it so it is
+            # reopened with the new parameters
+            tab = self._tab_by_conn.pop(connection_name, None)
+            if tab is not None:
+                # Close the connection
+                self.connection_manager.close_connection(connection_name)
+                # Remove the tab
+                self.connection_tabs.removeTab(self.connection_tabs.indexOf(tab))
+                # Show a message to the user
+                QMessageBox.information(
+                    self, 
+                    "Connection Updated", 
+                    f"The connection '{connection_name}' has been updated. You'll need to reconnect to apply the changes."
+                )
     
     def _open_database_manager(self):
         """Open the database manager dialog"""
@@ -792,6 +786,7 @@ class MainWindow(QMainWindow):
             
         # Create a new dialog or reuse the existing one
         if current_tab.database_manager_dialog is None:
+            from src.ui.database_manager import DatabaseManagerDialog
             current_tab.database_manager_dialog = DatabaseManagerDialog(connection, self)
             
         # Show the dialog
@@ -835,6 +830,7 @@ class MainWindow(QMainWindow):
         # Open the import dialog
         # Get the connection using getattr to satisfy Pylance
         connection = getattr(current_tab, 'connection')
+        from src.ui.import_export_dialog import ImportExportDialog
         dialog = ImportExportDialog(connection, "import", self)
         if dialog.exec():
             # Refresh the database browser after import
@@ -858,6 +854,7 @@ class MainWindow(QMainWindow):
         # Open the export dialog
         # Get the connection using getattr to satisfy Pylance
         connection = getattr(current_tab, 'connection')
+        from src.ui.import_export_dialog import ImportExportDialog
         dialog = ImportExportDialog(connection, "export", self)
         dialog.exec()
     
@@ -889,17 +886,12 @@ class MainWindow(QMainWindow):
     
     def _toggle_database_browser(self):
         """Toggle the visibility of the database browser in the current connection tab"""
-        current_index = self.connection_tabs.currentIndex()
-        if current_index >= 0:
-            current_tab = self.connection_tabs.widget(current_index)
-            if current_tab is not None and hasattr(current_tab, 'toggle_database_browser'):
-                # Use getattr to get the method, which will satisfy Pylance
-                toggle_method = getattr(current_tab, 'toggle_database_browser')
-                visible = toggle_method()
-                self.show_db_browser_action.setText("Hide Database Browser" if visible else "Show Database Browser")
-                self.show_db_browser_action.setChecked(visible)
-            elif current_index > 0:  # Not the welcome tab
-                QMessageBox.information(self, "Database Browser", "Database browser not available in this tab.")
+        # The welcome tab has no database browser
+        current_tab = self._connection_tab()
+        if current_tab is not None:
+            visible = current_tab.toggle_database_browser()
+            self.show_db_browser_action.setText("Hide Database Browser" if visible else "Show Database Browser")
+            self.show_db_browser_action.setChecked(visible)
     
     # _tab_changed method has been merged with the one at line 442
     
@@ -949,8 +941,7 @@ class MainWindow(QMainWindow):
             # Also refresh any open database manager dialogs
             if hasattr(tab, 'database_manager_dialog') and tab.database_manager_dialog is not None:
                 if tab.database_manager_dialog.isVisible():
-                    tab.database_manager_dialog._populate_databases()
-                    tab.database_manager_dialog._populate_db_selector()
+                    tab.database_manager_dialog.reload_metadata()
     
     def _refresh_database_views(self):
         """Refresh all open database views to reflect the system database setting"""
@@ -985,8 +976,11 @@ class MainWindow(QMainWindow):
             # Also refresh any open database manager dialogs
             if hasattr(tab, 'database_manager_dialog') and tab.database_manager_dialog is not None:
                 if tab.database_manager_dialog.isVisible():
-                    tab.database_manager_dialog._populate_databases()
-                    tab.database_manager_dialog._populate_db_selector()
+                    tab.database_manager_dialog.reload_metadata()
+    
+    def _theme_triggered(self, action):
+        """Change to the theme of an action in the theme menu"""
+        self._change_theme(action.data())
     
     def _change_theme(self, theme_name):
         """Change the application theme"""
@@ -994,11 +988,8 @@ class MainWindow(QMainWindow):
             # Show a message in the status bar
             self.status_bar.showMessage(f"Theme changed to {theme_name}", 3000)
             
-            # Refresh the welcome tab to update the logo
-            if self.connection_tabs.count() > 0 and self.connection_tabs.tabText(0) == "Welcome":
-                welcome_widget = self._create_welcome_widget()
-                self.connection_tabs.removeTab(0)
-                self.connection_tabs.insertTab(0, welcome_widget, "Welcome")
+            # Switch the welcome tab to the logo for the new theme
+            self._update_welcome_logo()
     
     def closeEvent(self, event):
         """Handle application close event"""
@@ -15,6 +15,7 @@ import json
 import pandas as pd
 
 from src.ui.row_detail_dialog import RowDetailDialog
+from src.core.connection_manager import write_dataframe_csv
 
 class ResultsTableModel(QAbstractTableModel):
     """Table model for displaying SQL query results"""
@@ -400,12 +401,12 @@ class ResultsView(QWidget):
             data = self.table_model._data
             
             if file_path.endswith('.csv'):
-                data.to_csv(file_path, index=False)
+                write_dataframe_csv(data, file_path)
             elif file_path.endswith('.xlsx'):
                 data.to_excel(file_path, index=False)
             else:
                 if '.' not in file_path:
                     file_path += '.csv'
-                data.to_csv(file_path, index=False)
+                write_dataframe_csv(data, file_path)
         except Exception as e:
             print(f"Export error: {e}")
@@ -0,0 +1,90 @@
+"""
+Helpers for running blocking database work off the UI thread
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Workers that have been started but whose result has not been delivered yet.
+# Holding a reference keeps their signal objects alive until the queued
+# finished/error signal reaches the UI thread.
+_active_workers = set()
+
+
+class WorkerSignals(QObject):
+    """Signals used by Worker to report back to the UI thread"""
+
+    # Emitted with the return value of the callable
+    finished = pyqtSignal(object)
+
+    # Emitted with the exception raised by the callable
+    error = pyqtSignal(object)
+
+    # Emitted with a percentage and a message while the callable runs
+    progress = pyqtSignal(int, str)
+
+
+class Worker(QRunnable):
+    """QRunnable that calls a function on a pool thread and reports the outcome"""
+
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Initialize the worker
+
+        Args:
+            fn: Callable to run on the pool thread
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+        """
+        super().__init__()
+
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Run the callable and emit its result or exception"""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+def run_in_background(fn, *args, on_finished=None, on_error=None, on_progress=None, pool=None, **kwargs):
+    """Run fn(*args, **kwargs) on a thread pool
+
+    The callbacks are invoked on the UI thread once the call completes, so they
+    may safely touch widgets. The callable itself must not.
+
+    Args:
+        fn: Callable to run on the pool thread
+        on_finished: Called with the return value on success
+        on_error: Called with the exception if fn raises
+        on_progress: Called with a percentage and a message on the UI thread.
+            When given, fn receives a progress(percent, message) keyword
+            argument to report with.
+        pool: QThreadPool to use, defaults to the global instance
+
+    Returns:
+        The started Worker
+    """
+    worker = Worker(fn, *args, **kwargs)
+    _active_workers.add(worker)
+
+    if on_progress is not None:
+        worker.kwargs['progress'] = worker.signals.progress.emit
+        worker.signals.progress.connect(on_progress)
+
+    # Connected first so the reference is released before the callbacks run
+    worker.signals.finished.connect(lambda _: _active_workers.discard(worker))
+    worker.signals.error.connect(lambda _: _active_workers.discard(worker))
+
+    if on_finished is not None:
+        worker.signals.finished.connect(on_finished)
+    if on_error is not None:
+        worker.signals.error.connect(on_error)
+
+    (pool or QThreadPool.globalInstance()).start(worker)
+    return worker
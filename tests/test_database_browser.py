@@ -6,8 +6,8 @@ import unittest
 import os
 from unittest.mock import patch, MagicMock
 
-from PyQt6.QtWidgets import QApplication, QMenu
-from PyQt6.QtCore import Qt, QModelIndex, QPoint
+from PyQt6.QtWidgets import QApplication, QMenu, QMessageBox
+from PyQt6.QtCore import Qt, QModelIndex, QPoint, QThreadPool
 from PyQt6.QtGui import QStandardItem, QAction
 
 # Add the src directory to the path so we can import our modules
@@ -524,5 +524,76 @@ class TestDatabaseBrowserMongoDB(unittest.TestCase):
         self.assertIsNotNone(self.browser.query_template_loaded)
 
 
+class TestDatabaseBrowserExport(unittest.TestCase):
+    """Test cases for exporting a single table from the DatabaseBrowser"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        import tempfile
+        import pandas as pd
+        
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.browser = DatabaseBrowser()
+        
+        self.mock_connection = MagicMock()
+        self.mock_connection.params = {'type': 'SQLite'}
+        self.mock_connection.execute_query.return_value = pd.DataFrame({'id': [1, 2], 'name': ['a', 'b']})
+        self.mock_connection.export_table_to_csv.side_effect = self._write_csv
+        self.browser.tree_model.connection = self.mock_connection
+    
+    def tearDown(self):
+        """Clean up the temporary export directory"""
+        self.temp_dir.cleanup()
+    
+    def _write_csv(self, table_name, file_path):
+        with open(file_path, 'w') as f:
+            f.write('id,name\n1,a\n2,b\n')
+        return True
+    
+    def _export(self, filename):
+        with patch('src.ui.database_browser.QFileDialog.getExistingDirectory', return_value=self.temp_dir.name), \
+             patch('src.ui.database_browser.QInputDialog.getText', return_value=(filename, True)), \
+             patch('src.ui.database_browser.QMessageBox') as mock_message_box:
+            mock_message_box.StandardButton = QMessageBox.StandardButton
+            mock_message_box.question.return_value = QMessageBox.StandardButton.No
+            self.browser._export_table('users', 'csv')
+            
+            # Let the background export finish and deliver its result
+            QThreadPool.globalInstance().waitForDone()
+            app.processEvents()
+        return mock_message_box
+    
+    def test_export_new_file_does_not_prompt(self):
+        """Exporting to a new file should write it without an overwrite prompt"""
+        mock_message_box = self._export('users.csv')
+        
+        mock_message_box.question.assert_not_called()
+        mock_message_box.information.assert_called_once()
+        with open(os.path.join(self.temp_dir.name, 'users.csv')) as f:
+            self.assertEqual(f.readline().strip(), 'id,name')
+    
+    def test_export_existing_file_declined(self):
+        """Declining the overwrite prompt should leave the existing file untouched"""
+        file_path = os.path.join(self.temp_dir.name, 'users.csv')
+        with open(file_path, 'w') as f:
+            f.write('keep me')
+        
+        mock_message_box = self._export('users.csv')
+        
+        mock_message_box.question.assert_called_once()
+        self.mock_connection.export_table_to_csv.assert_not_called()
+        with open(file_path) as f:
+            self.assertEqual(f.read(), 'keep me')
+    
+    def test_failed_export_removes_reserved_file(self):
+        """A failed export should not leave an empty reserved file behind"""
+        self.mock_connection.export_table_to_csv.side_effect = Exception('boom')
+        
+        mock_message_box = self._export('users.csv')
+        
+        mock_message_box.critical.assert_called_once()
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, 'users.csv')))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
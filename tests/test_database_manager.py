@@ -5,10 +5,10 @@ Tests for the database manager interface
 import unittest
 import os
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 from typing import Dict, List, Any
 
-from PyQt6.QtWidgets import QApplication, QDialog, QTableWidgetItem, QCheckBox, QMessageBox
+from PyQt6.QtWidgets import QApplication, QDialog, QTableWidgetItem, QMessageBox
 from PyQt6.QtCore import Qt
 
 # Add the src directory to the path so we can import our modules
@@ -24,6 +24,17 @@ if app is None:
 from src.ui.database_manager import DatabaseManagerDialog, set_global_test_mode
 
 
+def _answer_drops(button=QMessageBox.StandardButton.Yes):
+    """Answer every drop confirmation with button as soon as it is opened"""
+    original_open = QMessageBox.open
+    
+    def open_and_answer(box):
+        original_open(box)
+        box.button(button).click()
+    
+    return patch.object(QMessageBox, 'open', open_and_answer)
+
+
 class TestDatabaseManagerDialog(unittest.TestCase):
     """Test cases for the DatabaseManagerDialog class"""
     
@@ -50,6 +61,14 @@ class TestDatabaseManagerDialog(unittest.TestCase):
         self.mock_connection.get_indexes.return_value = [
             {"name": "idx_id", "columns": ["id"]}
         ]
+        self.mock_connection.get_all_columns.return_value = {
+            "table1": self.mock_connection.get_columns.return_value,
+            "table2": self.mock_connection.get_columns.return_value
+        }
+        self.mock_connection.get_all_indexes.return_value = {
+            "table1": self.mock_connection.get_indexes.return_value,
+            "table2": self.mock_connection.get_indexes.return_value
+        }
         
         # Mock permission methods to return True
         self.mock_connection.can_drop_database.return_value = True
@@ -57,6 +76,10 @@ class TestDatabaseManagerDialog(unittest.TestCase):
         self.mock_connection.is_system_database.return_value = False
         self.mock_connection.is_admin.return_value = True
         
+        # Table and index names are used as given in the generated SQL
+        self.mock_connection.qualified_name.side_effect = lambda name, database=None: name
+        self.mock_connection.quote_ident.side_effect = lambda name: name
+        
         # Create the dialog with the mock connection
         self.dialog = DatabaseManagerDialog(self.mock_connection)
     
@@ -110,20 +133,20 @@ class TestDatabaseManagerDialog(unittest.TestCase):
         """Test creating a database"""
         # Mock the input dialog to return a database name
         with patch('PyQt6.QtWidgets.QInputDialog.getText', return_value=("new_database", True)):
-            # Mock the connection's execute_non_query method
-            with patch.object(self.mock_connection, 'execute_non_query') as mock_execute:
+            # Mock the connection's execute_ddl method
+            with patch.object(self.mock_connection, 'execute_ddl') as mock_execute:
                 # Call the create database method
                 self.dialog._create_database()
                 
-                # Check that execute_non_query was called with the correct SQL
-                mock_execute.assert_called_once_with("CREATE DATABASE new_database;")
+                # Check that execute_ddl was called with the correct statement
+                mock_execute.assert_called_once_with('create_database', 'new_database')
     
     def test_drop_database(self):
         """Test dropping a database"""
-        # Mock the message box to return Yes (StandardButton.Yes)
-        with patch('PyQt6.QtWidgets.QMessageBox.question', return_value=QMessageBox.StandardButton.Yes):
-            # Mock the connection's execute_non_query method
-            with patch.object(self.mock_connection, 'execute_non_query') as mock_execute:
+        # Answer Yes to the drop confirmation
+        with _answer_drops():
+            # Mock the connection's execute_ddl method
+            with patch.object(self.mock_connection, 'execute_ddl') as mock_execute:
                 # Add an item to the databases list
                 self.dialog.database_tab.databases_list.addItem("test_db")
                 
@@ -133,8 +156,8 @@ class TestDatabaseManagerDialog(unittest.TestCase):
                 # Call the drop database method
                 self.dialog._drop_database()
                 
-                # Check that execute_non_query was called with the correct SQL
-                mock_execute.assert_called_once_with("DROP DATABASE test_db;")
+                # Check that execute_ddl was called with the correct statement
+                mock_execute.assert_called_once_with('drop_database', 'test_db')
     
     def test_create_table(self):
         """Test creating a table"""
@@ -167,8 +190,10 @@ class TestDatabaseManagerDialog(unittest.TestCase):
                             self.assertIn("name TEXT", mock_execute.call_args[0][0])
                             
                             # Check that the populate methods were called with the correct database
-                            mock_populate_tables.assert_called_once_with("test_db")
-                            mock_populate_table_selectors.assert_called_once_with("test_db")
+                            mock_populate_tables.assert_called_once_with("test_db", tables=ANY)
+                            mock_populate_table_selectors.assert_called_once_with("test_db", tables=ANY)
+                            self.assertIs(mock_populate_tables.call_args.kwargs['tables'],
+                                          mock_populate_table_selectors.call_args.kwargs['tables'])
     
     def test_drop_table(self):
         """Test dropping a table"""
@@ -176,10 +201,10 @@ class TestDatabaseManagerDialog(unittest.TestCase):
         self.dialog.tables_tab.db_selector.addItem("test_db")
         self.dialog.tables_tab.db_selector.setCurrentText("test_db")
         
-        # Mock the message box to return Yes
-        with patch('PyQt6.QtWidgets.QMessageBox.question', return_value=QMessageBox.StandardButton.Yes):
-            # Mock the connection's execute_non_query method
-            with patch.object(self.mock_connection, 'execute_non_query') as mock_execute:
+        # Answer Yes to the drop confirmation
+        with _answer_drops():
+            # Mock the connection's execute_ddl method
+            with patch.object(self.mock_connection, 'execute_ddl') as mock_execute:
                 # Mock the populate methods
                 with patch.object(self.dialog, '_populate_tables') as mock_populate_tables:
                     with patch.object(self.dialog, '_populate_table_selectors') as mock_populate_table_selectors:
@@ -192,12 +217,14 @@ class TestDatabaseManagerDialog(unittest.TestCase):
                         # Call the drop table method
                         self.dialog._drop_table()
                         
-                        # Check that execute_non_query was called with the correct SQL
-                        mock_execute.assert_called_once_with("DROP TABLE table1;")
+                        # Check that execute_ddl was called with the correct statement
+                        mock_execute.assert_called_once_with('drop_table', 'table1', database='test_db')
                         
                         # Check that the populate methods were called with the correct database
-                        mock_populate_tables.assert_called_once_with("test_db")
-                        mock_populate_table_selectors.assert_called_once_with("test_db")
+                        mock_populate_tables.assert_called_once_with("test_db", tables=ANY)
+                        mock_populate_table_selectors.assert_called_once_with("test_db", tables=ANY)
+                        self.assertIs(mock_populate_tables.call_args.kwargs['tables'],
+                                      mock_populate_table_selectors.call_args.kwargs['tables'])
     
     def test_add_column(self):
         """Test adding a column to a table"""
@@ -230,8 +257,8 @@ class TestDatabaseManagerDialog(unittest.TestCase):
     
     def test_drop_column(self):
         """Test dropping a column from a table"""
-        # Mock the message box to return Yes
-        with patch('PyQt6.QtWidgets.QMessageBox.question', return_value=QMessageBox.StandardButton.Yes):
+        # Answer Yes to the drop confirmation
+        with _answer_drops():
             # Mock the connection's execute_non_query method
             with patch.object(self.mock_connection, 'execute_non_query') as mock_execute:
                 # Set up the database selector in the tables tab
@@ -241,14 +268,17 @@ class TestDatabaseManagerDialog(unittest.TestCase):
                 # Set up the table selector and columns list
                 self.dialog.columns_tab.table_selector.addItem("table1")
                 self.dialog.columns_tab.table_selector.setCurrentText("table1")
-                self.dialog.columns_tab.columns_list.addItem("id (INTEGER)")
-                self.dialog.columns_tab.columns_list.setCurrentRow(0)
+                self.dialog.columns_tab.columns_model.set_data(["id (INTEGER)"], ["id"])
+                self.dialog.columns_tab.columns_list.setCurrentIndex(
+                    self.dialog.columns_tab.columns_model.index(0)
+                )
                 
                 # Mock the get_database_name method to return the test database
                 self.mock_connection.get_database_name.return_value = "test_db"
                 
                 # Set the database type to MySQL for this test (to avoid SQLite version check)
                 self.mock_connection.params = {'type': 'MySQL'}
+                self.dialog._db_type = 'MySQL'
                 
                 # Call the drop column method
                 self.dialog._drop_column()
@@ -288,8 +318,8 @@ class TestDatabaseManagerDialog(unittest.TestCase):
     
     def test_drop_index(self):
         """Test dropping an index"""
-        # Mock the message box to return Yes
-        with patch('PyQt6.QtWidgets.QMessageBox.question', return_value=QMessageBox.StandardButton.Yes):
+        # Answer Yes to the drop confirmation
+        with _answer_drops():
             # Mock the connection's execute_non_query method
             with patch.object(self.mock_connection, 'execute_non_query') as mock_execute:
                 # Set up the database selector in the tables tab
@@ -299,14 +329,17 @@ class TestDatabaseManagerDialog(unittest.TestCase):
                 # Set up the table selector and indexes list
                 self.dialog.indexes_tab.table_selector.addItem("table1")
                 self.dialog.indexes_tab.table_selector.setCurrentText("table1")
-                self.dialog.indexes_tab.indexes_list.addItem("idx_id")
-                self.dialog.indexes_tab.indexes_list.setCurrentRow(0)
+                self.dialog.indexes_tab.indexes_model.set_data(["idx_id"])
+                self.dialog.indexes_tab.indexes_list.setCurrentIndex(
+                    self.dialog.indexes_tab.indexes_model.index(0)
+                )
                 
                 # Mock the get_database_name method to return the test database
                 self.mock_connection.get_database_name.return_value = "test_db"
                 
                 # Set the database type to SQLite for this test
                 self.mock_connection.params = {'type': 'SQLite'}
+                self.dialog._db_type = 'SQLite'
                 
                 # Call the drop index method
                 self.dialog._drop_index()
@@ -314,12 +347,54 @@ class TestDatabaseManagerDialog(unittest.TestCase):
                 # Check that execute_non_query was called with the correct SQL
                 mock_execute.assert_called_once()
                 self.assertIn("DROP INDEX idx_id", mock_execute.call_args[0][0])
+                self.mock_connection.quote_ident.assert_called_once_with("idx_id")
+                
+                # Success is reported below the tabs instead of in a message box
+                self.assertFalse(self.dialog._status_label.isHidden())
+                self.assertIn("idx_id", self.dialog._status_label.text())
+    
+    def test_drop_multiple_indexes(self):
+        """Test that the selected indexes are dropped with one statement or batch"""
+        from PyQt6.QtCore import QItemSelectionModel
+        
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog.indexes_tab.table_selector.addItem("table1")
+        self.dialog.indexes_tab.table_selector.setCurrentText("table1")
+        
+        expected = {
+            'MySQL': ('execute_non_query', "ALTER TABLE table1 DROP INDEX idx_a, DROP INDEX idx_c;"),
+            'PostgreSQL': ('execute_non_query', "DROP INDEX idx_a, idx_c;"),
+            'SQLite': ('execute_batch', ["DROP INDEX idx_a;", "DROP INDEX idx_c;"]),
+        }
+        for db_type, (method, sql) in expected.items():
+            with self.subTest(db_type=db_type):
+                self.dialog._db_type = db_type
+                self.mock_connection.reset_mock(return_value=False, side_effect=False)
+                
+                # Select the last and the first index; the list is reloaded
+                # after every drop
+                self.dialog.indexes_tab.indexes_model.set_data(["idx_a", "idx_b", "idx_c"])
+                selection_model = self.dialog.indexes_tab.indexes_list.selectionModel()
+                for row in (2, 0):
+                    selection_model.select(
+                        self.dialog.indexes_tab.indexes_model.index(row),
+                        QItemSelectionModel.SelectionFlag.Select
+                    )
+                
+                with _answer_drops():
+                    self.dialog._drop_index()
+                
+                getattr(self.mock_connection, method).assert_called_once_with(sql, database="test_db")
     
     def test_populate_db_selector(self):
         """Test populating the database selector in the tables tab"""
         # Mock the connection's get_available_databases method
         self.mock_connection.get_available_databases.return_value = ["db1", "db2", "test_db"]
         
+        # Discard the list cached when the dialog was opened
+        self.dialog._invalidate_db_cache()
+        
         # Call the populate method
         self.dialog._populate_db_selector()
         
@@ -332,6 +407,495 @@ class TestDatabaseManagerDialog(unittest.TestCase):
         # Check that the current database is selected
         self.assertEqual(self.dialog.tables_tab.db_selector.currentText(), "test_db")
     
+    def test_tables_fetched_once_per_database(self):
+        """Test that table lists are served from the dialog cache"""
+        self.mock_connection.get_tables.reset_mock()
+        
+        self.dialog._populate_tables("other_db")
+        self.dialog._populate_table_selectors("other_db")
+        
+        self.mock_connection.get_tables.assert_called_once()
+        self.assertEqual(self.dialog.tables_tab.tables_list.count(), 2)
+        self.assertEqual(self.dialog.columns_tab.table_selector.count(), 2)
+    
+    def test_tables_db_change_fetches_tables_once(self):
+        """Test that switching databases fills all table widgets from one fetch"""
+        self.mock_connection.get_tables.reset_mock()
+        
+        self.dialog._on_tables_db_changed("other_db")
+        
+        self.mock_connection.get_tables.assert_called_once_with(database="other_db")
+        self.assertEqual(self.dialog.tables_tab.tables_list.count(), 2)
+        self.assertEqual(self.dialog.columns_tab.table_selector.count(), 2)
+        self.assertEqual(self.dialog.indexes_tab.table_selector.count(), 2)
+    
+    def test_failed_table_fetch_tried_once(self):
+        """Test that a failing table fetch is neither retried nor reported twice"""
+        self.mock_connection.get_tables.reset_mock()
+        self.mock_connection.get_tables.side_effect = Exception("connection lost")
+        
+        with patch.object(self.dialog, '_report_error') as report_error:
+            self.dialog._refresh_tables_for_db("other_db")
+        
+        self.mock_connection.get_tables.assert_called_once()
+        report_error.assert_called_once()
+        self.assertEqual(self.dialog.tables_tab.tables_list.count(), 0)
+    
+    def test_tables_deferred_while_databases_tab_shown(self):
+        """Test that picking databases on the databases tab only fetches tables once another tab opens"""
+        self.dialog.tabs.setCurrentIndex(self.dialog.DATABASES_TAB_INDEX)
+        self.mock_connection.get_tables.reset_mock()
+        
+        self.dialog._on_tables_db_changed("db2")
+        self.dialog._on_tables_db_changed("other_db")
+        self.mock_connection.get_tables.assert_not_called()
+        
+        self.dialog.tabs.setCurrentIndex(1)
+        self.mock_connection.get_tables.assert_called_once_with(database="other_db")
+        self.assertEqual(self.dialog.tables_tab.tables_list.count(), 2)
+    
+    def test_populate_tables_restores_widget_state(self):
+        """Test that refilling a list leaves signals and repaints enabled"""
+        tables_list = self.dialog.tables_tab.tables_list
+        
+        self.dialog._populate_tables("test_db")
+        
+        self.assertEqual(tables_list.count(), 2)
+        self.assertFalse(tables_list.signalsBlocked())
+        self.assertTrue(tables_list.updatesEnabled())
+    
+    def test_populate_columns_fills_model(self):
+        """Test that the columns view is filled through its string model"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        
+        self.dialog._populate_columns("table1")
+        
+        self.assertEqual(
+            self.dialog.columns_tab.columns_model.items(),
+            ["id (INTEGER)", "name (TEXT)"]
+        )
+    
+    def test_initial_metadata_loaded_in_background(self):
+        """Test that the dialog fetches its initial metadata off the UI thread"""
+        from PyQt6.QtCore import QThreadPool
+        
+        self.mock_connection.get_available_databases.return_value = ["test_db"]
+        with patch('src.ui.database_manager._TEST_MODE', False):
+            dialog = DatabaseManagerDialog(self.mock_connection)
+            self.assertFalse(dialog.tabs.isEnabled())
+            
+            QThreadPool.globalInstance().waitForDone()
+            app.processEvents()
+        
+        self.assertTrue(dialog.tabs.isEnabled())
+        self.assertEqual(dialog.tables_tab.db_selector.currentText(), "test_db")
+        self.assertEqual(dialog.tables_tab.tables_list.count(), 2)
+    
+    def test_columns_loaded_once_per_database(self):
+        """Test that browsing tables reuses one bulk column query"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.mock_connection.get_all_columns.reset_mock()
+        self.mock_connection.get_columns.reset_mock()
+        
+        self.dialog._populate_columns("table1")
+        self.dialog._populate_columns("table2")
+        
+        self.mock_connection.get_all_columns.assert_called_once_with(database="test_db")
+        self.mock_connection.get_columns.assert_not_called()
+        self.assertEqual(self.dialog.columns_tab.columns_model.rowCount(), 2)
+    
+    def test_column_labels_built_once_per_table(self):
+        """Test that column labels are reused until the columns are invalidated"""
+        self.dialog._invalidate_db_cache("test_db")
+        labels = self.dialog._get_column_labels_cached("test_db", "table1")
+        
+        self.assertIs(self.dialog._get_column_labels_cached("test_db", "table1"), labels)
+        
+        self.dialog._invalidate_db_cache("test_db", 'columns')
+        self.assertIsNot(self.dialog._get_column_labels_cached("test_db", "table1"), labels)
+    
+    def test_populate_indexes_skips_table_already_shown(self):
+        """Test that the indexes are only reloaded for a new table or when forced"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog._populate_indexes("table1")
+        
+        with patch.object(self.dialog.indexes_tab.indexes_model, 'set_data') as set_data:
+            self.dialog._populate_indexes("table1")
+            set_data.assert_not_called()
+            
+            self.dialog._populate_indexes("table1", force=True)
+            self.dialog._populate_indexes("table2")
+            self.assertEqual(set_data.call_count, 2)
+    
+    def test_indexes_loaded_once_per_database(self):
+        """Test that browsing tables reuses one bulk index query until an index changes"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.mock_connection.get_all_indexes.reset_mock()
+        
+        self.dialog._populate_indexes("table1")
+        self.dialog._populate_indexes("table2")
+        
+        self.mock_connection.get_all_indexes.assert_called_once_with(database="test_db")
+        self.mock_connection.get_indexes.assert_not_called()
+        self.assertEqual(self.dialog.indexes_tab.indexes_model.items(), ["idx_id"])
+        
+        self.dialog._invalidate_db_cache("test_db", 'indexes')
+        self.dialog._populate_indexes("table2", force=True)
+        self.assertEqual(self.mock_connection.get_all_indexes.call_count, 2)
+    
+    def test_modify_column_reads_cached_columns(self):
+        """Test that modifying a column reads its definition for the selected database"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog._populate_columns("table1", force=True)
+        self.dialog.columns_tab.columns_list.setCurrentIndex(self.dialog.columns_tab.columns_model.index(0))
+        self.mock_connection.get_columns.reset_mock()
+        
+        with patch('src.ui.database_manager.AddColumnDialog.exec', return_value=False):
+            self.dialog._modify_column()
+        
+        self.mock_connection.get_columns.assert_not_called()
+    
+    def test_column_map_dropped_with_columns(self):
+        """Test that single column lookups use a map that is rebuilt after a column change"""
+        column = self.dialog._get_column_cached("test_db", "table1", "name")
+        self.assertEqual(column, {"name": "name", "type": "TEXT"})
+        self.assertIsNone(self.dialog._get_column_cached("test_db", "table1", "missing"))
+        
+        self.mock_connection.get_all_columns.return_value = {"table1": [{"name": "name", "type": "VARCHAR(20)"}]}
+        self.assertEqual(self.dialog._get_column_cached("test_db", "table1", "name")['type'], "TEXT")
+        
+        self.dialog._invalidate_db_cache("test_db", 'columns')
+        self.assertEqual(self.dialog._get_column_cached("test_db", "table1", "name")['type'], "VARCHAR(20)")
+    
+    def test_column_dialog_reused(self):
+        """Test that adding and modifying columns share one reset dialog"""
+        dialog = self.dialog._get_column_dialog("Add Column")
+        dialog.column_name_edit.setText("leftover")
+        
+        self.assertIs(self.dialog._get_column_dialog("Modify Column"), dialog)
+        self.assertEqual(dialog.windowTitle(), "Modify Column")
+        self.assertEqual(dialog.column_name_edit.text(), "")
+    
+    def test_modify_column_postgresql_single_batch(self):
+        """Test that the PostgreSQL clauses of a column change run as one batch"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog._db_type = 'PostgreSQL'
+        self.dialog._populate_columns("table1", force=True)
+        self.dialog.columns_tab.columns_list.setCurrentIndex(self.dialog.columns_tab.columns_model.index(1))
+        
+        with patch('src.ui.database_manager.AddColumnDialog.exec', return_value=True), \
+                patch('src.ui.database_manager.AddColumnDialog.get_column_definition', return_value={
+                    'name': 'full_name', 'type': 'VARCHAR(50)', 'nullable': False, 'default': None
+                }):
+            self.dialog._modify_column()
+        
+        self.mock_connection.execute_non_query.assert_not_called()
+        self.mock_connection.execute_batch.assert_called_once()
+        statements = self.mock_connection.execute_batch.call_args[0][0]
+        self.assertEqual(len(statements), 3)
+        self.assertIn("RENAME COLUMN name TO full_name", statements[0])
+        self.assertEqual(self.mock_connection.execute_batch.call_args.kwargs['database'], "test_db")
+    
+    def test_ddl_runs_in_background(self):
+        """Test that DDL is executed on a pool thread with the tabs disabled"""
+        on_done = MagicMock()
+        
+        with patch('src.ui.database_manager._TEST_MODE', False), \
+                patch('src.ui.database_manager.run_in_background') as run_in_background:
+            self.dialog._run_ddl(on_done, "Failed", self.mock_connection.execute_non_query,
+                                 "DROP TABLE t;", database="test_db")
+        
+        run_in_background.assert_called_once()
+        self.assertEqual(run_in_background.call_args[0][1], "DROP TABLE t;")
+        self.assertEqual(run_in_background.call_args.kwargs['database'], "test_db")
+        self.mock_connection.execute_non_query.assert_not_called()
+        self.assertFalse(self.dialog.tabs.isEnabled())
+        on_done.assert_not_called()
+        
+        run_in_background.call_args.kwargs['on_finished'](1)
+        self.assertTrue(self.dialog.tabs.isEnabled())
+        on_done.assert_called_once_with()
+    
+    def test_confirm_drop_does_not_block(self):
+        """Test that the drop confirmation returns at once and calls back on Yes"""
+        on_confirmed = MagicMock()
+        
+        self.dialog._confirm_drop("Drop it?", on_confirmed)
+        
+        box = self.dialog.findChild(QMessageBox)
+        self.assertIsNotNone(box)
+        on_confirmed.assert_not_called()
+        
+        box.button(QMessageBox.StandardButton.Yes).click()
+        on_confirmed.assert_called_once_with()
+    
+    def test_confirm_drop_no_does_nothing(self):
+        """Test that answering No to the drop confirmation does not drop"""
+        on_confirmed = MagicMock()
+        
+        self.dialog._confirm_drop("Drop it?", on_confirmed)
+        
+        self.dialog.findChild(QMessageBox).button(QMessageBox.StandardButton.No).click()
+        on_confirmed.assert_not_called()
+    
+    def test_global_test_mode_patches_once(self):
+        """Test that enabling test mode again keeps the installed stand-ins"""
+        installed = QMessageBox.warning
+        set_global_test_mode(True)
+        self.assertIs(QMessageBox.warning, installed)
+        
+        set_global_test_mode(False)
+        try:
+            self.assertIsNot(QMessageBox.warning, installed)
+        finally:
+            set_global_test_mode(True)
+        self.assertIs(QMessageBox.warning, installed)
+    
+    def test_select_table_silently_does_not_schedule_reload(self):
+        """Test that syncing a table selector leaves its signals unblocked afterwards"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        selector = self.dialog.columns_tab.table_selector
+        
+        self.assertTrue(self.dialog._select_table_silently(selector, "table2"))
+        self.assertEqual(selector.currentText(), "table2")
+        self.assertFalse(self.dialog._columns_debounce.isActive())
+        self.assertFalse(selector.signalsBlocked())
+        
+        self.assertFalse(self.dialog._select_table_silently(selector, "missing"))
+    
+    def test_columns_model_shows_cached_labels(self):
+        """Test that the columns model shows the cached label list without copying it"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog._populate_columns("table1", force=True)
+        
+        model = self.dialog.columns_tab.columns_model
+        self.assertIs(model.items(), self.dialog._get_column_labels_cached("test_db", "table1"))
+        self.assertEqual(model.data(model.index(1)), "name (TEXT)")
+    
+    def test_ddl_runs_in_selected_database_without_switching(self):
+        """Test that schema changes target the selected database without use_database"""
+        self.dialog.tables_tab.db_selector.addItem("other_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("other_db")
+        self.dialog.columns_tab.table_selector.setCurrentText("table1")
+        
+        with patch('src.ui.database_manager.AddColumnDialog.exec', return_value=True), \
+                patch('src.ui.database_manager.AddColumnDialog.get_column_definition', return_value={
+                    'name': 'note', 'type': 'TEXT', 'nullable': True, 'default': None
+                }):
+            self.dialog._add_column()
+        
+        self.mock_connection.use_database.assert_not_called()
+        self.mock_connection.qualified_name.assert_called_once_with("table1", "other_db")
+        self.mock_connection.execute_non_query.assert_called_once_with(
+            "ALTER TABLE table1 ADD COLUMN note TEXT;", database="other_db"
+        )
+    
+    def test_drop_column_uses_column_name_key(self):
+        """Test that the column name is read from the row key, not parsed from its label"""
+        self.mock_connection.get_all_columns.return_value = {"table1": [{"name": "total (net)", "type": "INTEGER"}]}
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog.columns_tab.table_selector.setCurrentText("table1")
+        self.dialog._db_type = 'MySQL'
+        self.dialog._populate_columns("table1", force=True)
+        self.dialog.columns_tab.columns_list.setCurrentIndex(self.dialog.columns_tab.columns_model.index(0))
+        
+        with _answer_drops():
+            self.dialog._drop_column()
+        
+        self.mock_connection.execute_non_query.assert_called_once_with(
+            "ALTER TABLE table1 DROP COLUMN total (net);", database="test_db"
+        )
+    
+    def test_drop_column_sqlite_version_checked_without_query(self):
+        """Test that the SQLite DROP COLUMN check compares versions numerically"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog.columns_tab.table_selector.setCurrentText("table1")
+        self.dialog.columns_tab.columns_model.set_data(["id (INTEGER)"], ["id"])
+        self.dialog.columns_tab.columns_list.setCurrentIndex(self.dialog.columns_tab.columns_model.index(0))
+        self.dialog._db_type = 'SQLite'
+        
+        # 3.9.0 sorts after 3.35.0 as a string but is older
+        with patch('src.ui.database_manager.sqlite3.sqlite_version_info', (3, 9, 0)):
+            self.dialog._drop_column()
+        self.mock_connection.execute_non_query.assert_not_called()
+        
+        with patch('src.ui.database_manager.sqlite3.sqlite_version_info', (3, 40, 1)), _answer_drops():
+            self.dialog._drop_column()
+        self.mock_connection.execute_non_query.assert_called_once()
+        self.mock_connection.execute_query.assert_not_called()
+    
+    def test_build_create_table_sql(self):
+        """Test that the CREATE TABLE statement fills in default type sizes"""
+        from src.ui.database_manager import _build_create_table_sql
+        
+        sql = _build_create_table_sql('"people"', [
+            {'name': 'id', 'type': 'INTEGER', 'primary_key': True, 'nullable': False},
+            {'name': 'name', 'type': 'VARCHAR', 'primary_key': False, 'nullable': True}
+        ])
+        
+        self.assertEqual(
+            sql,
+            'CREATE TABLE "people" (\nid INTEGER NOT NULL PRIMARY KEY,\nname VARCHAR(255)\n);'
+        )
+    
+    def test_build_pg_alter_uses_one_statement_per_change(self):
+        """Test that a PostgreSQL column change is split into valid statements"""
+        from src.ui.database_manager import _build_pg_alter
+        
+        statements = _build_pg_alter(
+            '"t"',
+            {'name': 'old', 'type': 'TEXT'},
+            {'name': 'new', 'type': 'VARCHAR(20)', 'nullable': False, 'default': "'x'"}
+        )
+        
+        self.assertEqual(statements, [
+            'ALTER TABLE "t" RENAME COLUMN old TO new;',
+            'ALTER TABLE "t" ALTER COLUMN new TYPE VARCHAR(20);',
+            'ALTER TABLE "t" ALTER COLUMN new SET NOT NULL;',
+            'ALTER TABLE "t" ALTER COLUMN new SET DEFAULT \'x\';'
+        ])
+    
+    def test_build_mysql_alter(self):
+        """Test that a MySQL column change is a single MODIFY COLUMN statement"""
+        from src.ui.database_manager import _build_mysql_alter
+        
+        new_column = {'name': 'n', 'type': 'INT', 'nullable': False, 'default': '0'}
+        self.assertEqual(_build_mysql_alter('`t`', new_column, new_column),
+                         ['ALTER TABLE `t` MODIFY COLUMN n INT NOT NULL DEFAULT 0;'])
+        
+        new_column = {'name': 'n', 'type': 'TEXT', 'nullable': True, 'default': None}
+        self.assertEqual(_build_mysql_alter('`t`', new_column, new_column),
+                         ['ALTER TABLE `t` MODIFY COLUMN n TEXT;'])
+    
+    def test_table_selector_changes_are_debounced(self):
+        """Test that stepping through tables loads the columns only once"""
+        from PyQt6.QtTest import QTest
+        from src.ui.database_manager import TABLE_SELECTION_DEBOUNCE_MS
+        
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        
+        with patch.object(self.dialog, '_populate_columns') as mock_populate_columns:
+            self.dialog.columns_tab.table_selector.setCurrentIndex(1)
+            self.dialog.columns_tab.table_selector.setCurrentIndex(0)
+            mock_populate_columns.assert_not_called()
+            
+            QTest.qWait(TABLE_SELECTION_DEBOUNCE_MS * 3)
+            mock_populate_columns.assert_called_once_with("table1")
+    
+    def test_table_map_cleared_with_selectors(self):
+        """Test that clearing the table selectors also empties their name map"""
+        self.dialog._populate_table_selectors("test_db")
+        self.assertTrue(self.dialog._table_index)
+        
+        self.dialog._on_tables_db_changed("")
+        
+        self.assertEqual(self.dialog._table_index, {})
+        self.assertEqual(self.dialog.columns_tab.table_selector.count(), 0)
+        self.assertFalse(self.dialog._select_table_silently(self.dialog.columns_tab.table_selector, "table1"))
+    
+    def test_find_row_uses_fill_time_map(self):
+        """Test that selector lookups use the map built when the selector was filled"""
+        selector = self.dialog.columns_tab.table_selector
+        self.dialog._populate_table_selectors("test_db")
+        
+        with patch.object(selector, 'findText') as mock_find_text:
+            self.assertEqual(self.dialog._find_row(selector, self.dialog._table_index, "table2"), 1)
+            self.assertEqual(self.dialog._find_row(selector, self.dialog._table_index, "missing"), -1)
+            mock_find_text.assert_not_called()
+        
+        # Items added behind the populate methods' back are still found
+        selector.addItem("table3")
+        self.assertEqual(self.dialog._find_row(selector, self.dialog._table_index, "table3"), 2)
+    
+    def test_drop_table_invalidates_table_cache(self):
+        """Test that dropping a table refetches the table list"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog._populate_tables("test_db")
+        self.dialog.tables_tab.tables_list.setCurrentRow(0)
+        
+        self.mock_connection.get_tables.reset_mock()
+        self.mock_connection.get_tables.return_value = ["table2"]
+        
+        with _answer_drops():
+            self.dialog._drop_table()
+        
+        self.mock_connection.get_tables.assert_called_once()
+        self.assertEqual(self.dialog.tables_tab.tables_list.count(), 1)
+    
+    def test_reopened_dialog_shows_tables_created_elsewhere(self):
+        """Test that showing the dialog again reloads the cached metadata"""
+        self.mock_connection.get_available_databases.return_value = ["test_db"]
+        self.dialog.reload_metadata()
+        self.dialog.show()
+        self.dialog.hide()
+        self.assertEqual(self.dialog.tables_tab.tables_list.count(), 2)
+        
+        # A table created outside the dialog, e.g. from the query editor
+        self.mock_connection.get_tables.return_value = ["table1", "table2", "table3"]
+        self.dialog.show()
+        self.dialog.hide()
+        
+        self.assertEqual(self.dialog.tables_tab.tables_list.count(), 3)
+        self.assertEqual(self.dialog.tables_tab.tables_list.item(2).text(), "table3")
+    
+    def test_table_details_loaded_when_tab_shown(self):
+        """Test that columns and indexes are only loaded once their tab is shown"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog._populate_tables("test_db")
+        self.dialog.tabs.setCurrentIndex(1)
+        
+        with patch.object(self.dialog, '_populate_columns') as populate_columns, \
+                patch.object(self.dialog, '_populate_indexes') as populate_indexes:
+            self.dialog.tables_tab.tables_list.setCurrentRow(0)
+            self.dialog._on_table_selection_changed()
+            populate_columns.assert_not_called()
+            populate_indexes.assert_not_called()
+            
+            self.dialog.tabs.setCurrentIndex(self.dialog.COLUMNS_TAB_INDEX)
+            populate_columns.assert_called_once_with("table1")
+            populate_indexes.assert_not_called()
+    
+    def test_switching_back_to_loaded_tab_skips_reload(self):
+        """Test that returning to the columns tab for the same table reuses its list"""
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog.tables_tab.db_selector.setCurrentText("test_db")
+        self.dialog._populate_tables("test_db")
+        self.dialog.tables_tab.tables_list.setCurrentRow(0)
+        self.dialog.tabs.setCurrentIndex(self.dialog.COLUMNS_TAB_INDEX)
+        self.dialog.tabs.setCurrentIndex(1)
+        
+        with patch.object(self.dialog, '_populate_columns') as populate_columns:
+            self.dialog.tabs.setCurrentIndex(self.dialog.COLUMNS_TAB_INDEX)
+            populate_columns.assert_not_called()
+    
+    def test_populate_error_shown_in_error_label(self):
+        """Test that a failed populate reports its error without a message box"""
+        self.dialog._db_cache.clear()
+        self.mock_connection.get_available_databases.side_effect = Exception("connection lost")
+        
+        with patch('PyQt6.QtWidgets.QMessageBox.warning') as warning:
+            self.dialog._populate_databases()
+        
+        warning.assert_not_called()
+        self.assertFalse(self.dialog._error_label.isHidden())
+        self.assertIn("connection lost", self.dialog._error_label.text())
+        
+        self.dialog._clear_error()
+        self.assertTrue(self.dialog._error_label.isHidden())
+    
     def test_on_database_selection_changed(self):
         """Test handling database selection change in the database tab"""
         # Add items to the databases list
@@ -360,8 +924,10 @@ class TestDatabaseManagerDialog(unittest.TestCase):
                 self.dialog._on_tables_db_changed("test_db")
                 
                 # Check that the populate methods were called with the correct database
-                mock_populate_tables.assert_called_once_with("test_db")
-                mock_populate_table_selectors.assert_called_once_with("test_db")
+                mock_populate_tables.assert_called_once_with("test_db", tables=ANY)
+                mock_populate_table_selectors.assert_called_once_with("test_db", tables=ANY)
+                self.assertIs(mock_populate_tables.call_args.kwargs['tables'],
+                              mock_populate_table_selectors.call_args.kwargs['tables'])
     
     def test_on_tab_changed(self):
         """Test handling tab changes"""
@@ -391,6 +957,25 @@ class TestDatabaseManagerDialog(unittest.TestCase):
         # Test switching to the indexes tab
         self.dialog._on_tab_changed(3)  # Index 3 is the indexes tab
         self.assertEqual(self.dialog.indexes_tab.table_selector.currentText(), "table1")
+    
+    def test_tab_changed_fills_empty_tables_from_one_fetch(self):
+        """Test that opening the tables tab on an empty list fills every table widget"""
+        self.dialog.database_tab.databases_list.clear()
+        self.dialog.database_tab.databases_list.addItem("test_db")
+        self.dialog.database_tab.databases_list.setCurrentRow(0)
+        self.dialog.tables_tab.db_selector.clear()
+        self.dialog.tables_tab.db_selector.addItem("test_db")
+        self.dialog._db_index = {"test_db": 0}
+        self.dialog._clear_table_widgets()
+        self.dialog._invalidate_db_cache("test_db")
+        self.mock_connection.get_tables.reset_mock()
+        
+        self.dialog._on_tab_changed(1)
+        
+        self.mock_connection.get_tables.assert_called_once_with(database="test_db")
+        self.assertEqual(self.dialog.tables_tab.tables_list.count(), 2)
+        self.assertEqual(self.dialog.columns_tab.table_selector.count(), 2)
+        self.assertEqual(self.dialog.indexes_tab.table_selector.count(), 2)
 
 
 class TestCreateTableDialog(unittest.TestCase):
@@ -434,6 +1019,54 @@ class TestCreateTableDialog(unittest.TestCase):
         # Check that a row was added
         self.assertEqual(self.dialog.columns_table.rowCount(), initial_rows + 1)
     
+    def test_added_column_defaults(self):
+        """Test that a new row is an INTEGER, nullable, non-key column without cell widgets"""
+        self.dialog._add_column()
+        self.dialog.columns_table.setItem(0, 0, QTableWidgetItem("id"))
+        
+        for column in range(1, 4):
+            self.assertIsNone(self.dialog.columns_table.cellWidget(0, column))
+        self.assertEqual(self.dialog.get_table_definition()['columns'], [
+            {'name': 'id', 'type': 'INTEGER', 'primary_key': False, 'nullable': True}
+        ])
+    
+    def test_add_columns(self):
+        """Test that several columns are added in one call and read back unchanged"""
+        columns = [
+            {'name': 'id', 'type': 'INTEGER', 'primary_key': True, 'nullable': False},
+            {'name': 'title', 'type': 'TEXT', 'primary_key': False, 'nullable': True},
+        ]
+        self.dialog._add_column()
+        
+        self.dialog.add_columns(columns)
+        
+        self.assertEqual(self.dialog.columns_table.rowCount(), 3)
+        self.assertEqual(self.dialog.get_table_definition()['columns'], columns)
+    
+    def test_type_delegate_round_trip(self):
+        """Test that the type delegate edits the type stored in the cell"""
+        self.dialog._add_column()
+        index = self.dialog.columns_table.model().index(0, 1)
+        delegate = self.dialog.columns_table.itemDelegateForColumn(1)
+        
+        editor = delegate.createEditor(self.dialog.columns_table.viewport(), None, index)
+        delegate.setEditorData(editor, index)
+        self.assertEqual(editor.currentText(), "INTEGER")
+        
+        editor.setCurrentText("TEXT")
+        delegate.setModelData(editor, self.dialog.columns_table.model(), index)
+        self.assertEqual(self.dialog.columns_table.item(0, 1).text(), "TEXT")
+    
+    def test_reset_fields(self):
+        """Test that resetting clears the table name and columns"""
+        self.dialog.table_name_edit.setText("people")
+        self.dialog._add_column()
+        
+        self.dialog.reset_fields()
+        
+        self.assertEqual(self.dialog.table_name_edit.text(), "")
+        self.assertEqual(self.dialog.columns_table.rowCount(), 0)
+    
     def test_remove_column(self):
         """Test removing a column from the table definition"""
         # Add a column first
@@ -463,15 +1096,15 @@ class TestCreateTableDialog(unittest.TestCase):
         self.dialog.columns_table.setItem(0, 0, QTableWidgetItem("id"))
         self.dialog.columns_table.setItem(0, 1, QTableWidgetItem("INTEGER"))
         
-        # Set the primary key checkbox
-        pk_checkbox = QCheckBox()
-        pk_checkbox.setChecked(True)
-        self.dialog.columns_table.setCellWidget(0, 2, pk_checkbox)
+        # Set the primary key check box
+        pk_item = self.dialog.columns_table.item(0, 2)
+        assert pk_item is not None
+        pk_item.setCheckState(Qt.CheckState.Checked)
         
-        # Set the nullable checkbox
-        nullable_checkbox = QCheckBox()
-        nullable_checkbox.setChecked(False)
-        self.dialog.columns_table.setCellWidget(0, 3, nullable_checkbox)
+        # Set the nullable check box
+        nullable_item = self.dialog.columns_table.item(0, 3)
+        assert nullable_item is not None
+        nullable_item.setCheckState(Qt.CheckState.Unchecked)
         
         # Get the table definition
         definition = self.dialog.get_table_definition()
@@ -531,6 +1164,43 @@ class TestAddColumnDialog(unittest.TestCase):
         self.assertEqual(definition['type'], "TEXT")
         self.assertTrue(definition['nullable'])
         self.assertEqual(definition['default'], "'default'")
+    
+    def test_default_lengths(self):
+        """Test that picking a sized type fills in its default length"""
+        for column_type, length in (("VARCHAR", "255"), ("CHAR", "1")):
+            with self.subTest(column_type=column_type):
+                self.dialog.reset_fields()
+                self.dialog.column_type_combo.setCurrentText(column_type)
+                self.assertEqual(self.dialog.size_edit.text(), length)
+    
+    def test_decimal_default_formatted_to_precision(self):
+        """Test that a numeric default gets the column's number of decimals"""
+        self.dialog.column_name_edit.setText("price")
+        self.dialog.column_type_combo.setCurrentText("DECIMAL")
+        self.dialog.size_edit.setText("10")
+        self.dialog.precision_edit.setText("2")
+        self.dialog.default_value_edit.setText("3.5")
+        
+        definition = self.dialog.get_column_definition()
+        
+        self.assertEqual(definition['type'], "DECIMAL(10,2)")
+        self.assertEqual(definition['default'], "3.50")
+    
+    def test_reset_fields(self):
+        """Test that resetting restores the values of a new dialog"""
+        self.dialog.column_name_edit.setText("amount")
+        self.dialog.column_type_combo.setCurrentText("DECIMAL")
+        self.dialog.nullable_checkbox.setChecked(False)
+        self.dialog.default_value_edit.setText("0")
+        
+        self.dialog.reset_fields()
+        
+        self.assertEqual(self.dialog.column_name_edit.text(), "")
+        self.assertEqual(self.dialog.column_type_combo.currentText(), "INTEGER")
+        self.assertEqual(self.dialog.size_edit.text(), "")
+        self.assertEqual(self.dialog.precision_edit.text(), "")
+        self.assertTrue(self.dialog.nullable_checkbox.isChecked())
+        self.assertEqual(self.dialog.default_value_edit.text(), "")
 
 
 class TestCreateIndexDialog(unittest.TestCase):
@@ -571,6 +1241,49 @@ class TestCreateIndexDialog(unittest.TestCase):
         self.assertTrue(hasattr(self.dialog, 'columns_list'))
         self.assertTrue(hasattr(self.dialog, 'unique_checkbox'))
     
+    def test_columns_loaded_once_when_opened(self):
+        """Test that filling the table combo loads the first table's columns once"""
+        self.mock_connection.get_columns.assert_called_once_with("table1", database=None)
+        self.assertEqual(self.dialog.columns_list.count(), 2)
+    
+    def test_columns_fetched_once_per_table(self):
+        """Test that switching back to a table reuses its columns"""
+        self.dialog.table_combo.setCurrentText("table2")
+        self.dialog.table_combo.setCurrentText("table1")
+        self.dialog.table_combo.setCurrentText("table2")
+        
+        self.assertEqual(self.mock_connection.get_columns.call_count, 2)
+        self.assertEqual(self.dialog.columns_list.count(), 2)
+    
+    def test_uses_given_schema_getters(self):
+        """Test that the dialog reads tables and columns through the given getters"""
+        from src.ui.database_manager import CreateIndexDialog
+        
+        get_tables = MagicMock(return_value=["cached_table"])
+        get_columns = MagicMock(return_value=[{"name": "id", "type": "INTEGER"}])
+        self.mock_connection.reset_mock()
+        
+        dialog = CreateIndexDialog(self.mock_connection, database_name="test_db",
+                                   get_tables=get_tables, get_columns=get_columns)
+        
+        get_tables.assert_called_once_with("test_db")
+        get_columns.assert_called_once_with("test_db", "cached_table")
+        self.mock_connection.get_tables.assert_not_called()
+        self.mock_connection.get_columns.assert_not_called()
+        self.assertEqual(dialog.columns_list.count(), 1)
+    
+    def test_failed_table_fetch_logged(self):
+        """Test that a failing table fetch is logged and leaves the combo empty"""
+        from src.ui.database_manager import CreateIndexDialog
+        
+        self.mock_connection.get_tables.side_effect = Exception("connection lost")
+        
+        with self.assertLogs('src.ui.database_manager', level='DEBUG') as logs:
+            dialog = CreateIndexDialog(self.mock_connection)
+        
+        self.assertIn("Error populating tables", logs.output[0])
+        self.assertEqual(dialog.table_combo.count(), 0)
+    
     def test_table_selection_updates_columns(self):
         """Test that selecting a table updates the columns list"""
         # Set the table selection
@@ -639,6 +1352,7 @@ class TestAddRecordTab(unittest.TestCase):
             {"name": "email", "type": "VARCHAR(255)"},
         ]
         self.mock_connection.get_indexes.return_value = []
+        self.mock_connection.get_all_indexes.return_value = {}
         self.mock_connection.can_drop_database.return_value = True
         self.mock_connection.can_create_database.return_value = True
         self.mock_connection.is_system_database.return_value = False
@@ -731,6 +1445,7 @@ class TestAddRecordTabMongoDB(unittest.TestCase):
             {"name": "name", "type": "str"},
         ]
         self.mock_connection.get_indexes.return_value = []
+        self.mock_connection.get_all_indexes.return_value = {}
         self.mock_connection.can_drop_database.return_value = True
         self.mock_connection.can_create_database.return_value = True
         self.mock_connection.is_system_database.return_value = False
@@ -743,6 +1458,19 @@ class TestAddRecordTabMongoDB(unittest.TestCase):
     def test_add_field_button_visible_for_mongodb(self):
         self.assertTrue(self.dialog.add_record_tab.add_field_button.isVisible())
 
+    def test_drop_collection_in_selected_database(self):
+        """Dropping a collection should not switch the connection's database"""
+        self.dialog.tables_tab.db_selector.addItem("otherdb")
+        self.dialog.tables_tab.db_selector.setCurrentText("otherdb")
+        self.dialog.tables_tab.tables_list.addItem("users")
+        self.dialog.tables_tab.tables_list.setCurrentRow(0)
+
+        with _answer_drops():
+            self.dialog._drop_table()
+
+        self.mock_connection.drop_collection.assert_called_once_with("users", database="otherdb")
+        self.mock_connection.use_database.assert_not_called()
+
     def test_add_mongo_field_row_adds_row(self):
         self.dialog._on_add_record_table_changed("users")
         layout_before = self.dialog.add_record_tab.fields_container.layout().count()
@@ -0,0 +1,180 @@
+"""
+Tests for the import/export dialog
+"""
+
+import unittest
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from unittest.mock import patch, MagicMock
+
+from PyQt6.QtWidgets import QApplication, QMessageBox, QProgressDialog, QPushButton
+from PyQt6.QtCore import QThreadPool
+
+# Add the src directory to the path so we can import our modules
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Create a QApplication instance for the tests
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from src.ui.import_export_dialog import ImportExportDialog, ExportCancelled
+
+
+class TestImportExportDialog(unittest.TestCase):
+    """Test cases for exporting with the ImportExportDialog class"""
+
+    def setUp(self):
+        """Create a dialog for a connection with three tables"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.mock_connection = MagicMock()
+        self.mock_connection.params = {'type': 'SQLite'}
+        self.mock_connection.get_tables.return_value = ["t1", "t2", "t3"]
+        self.mock_connection.get_table_row_counts.return_value = {}
+        self.mock_connection.write_table_csv.side_effect = self._write_table_csv
+
+        # Tables whose CSV is only written once this event is set
+        self.blocked_tables = set()
+        self.release = threading.Event()
+
+        self.dialog = ImportExportDialog(self.mock_connection, mode="export")
+        self.dialog.format_combo.setCurrentIndex(1)  # CSV
+
+    def tearDown(self):
+        """Let blocked exports finish and remove the files"""
+        self.release.set()
+        QThreadPool.globalInstance().waitForDone()
+        app.processEvents()
+        self.temp_dir.cleanup()
+
+    def _write_table_csv(self, table, f):
+        """Stand-in for DatabaseConnection.write_table_csv"""
+        if table in self.blocked_tables:
+            self.release.wait(5)
+        f.write(f"id,name\n1,{table}\n")
+
+    def _track_spools(self):
+        """Record the spool of every table written during an export"""
+        spools = []
+        real_spool = tempfile.SpooledTemporaryFile
+
+        def create(*args, **kwargs):
+            spool = real_spool(*args, **kwargs)
+            spools.append(spool)
+            return spool
+
+        return spools, patch('src.ui.import_export_dialog.tempfile.SpooledTemporaryFile', side_effect=create)
+
+    def _wait_until(self, condition):
+        """Wait up to five seconds for condition() to become true"""
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+    def test_multi_table_csv_written_to_zip(self):
+        """Exporting several tables as CSV should write one zip entry per table"""
+        self.dialog.file_path = os.path.join(self.temp_dir.name, "export.csv")
+        zip_path = os.path.join(self.temp_dir.name, "export.zip")
+
+        with patch('src.ui.import_export_dialog.QMessageBox.information') as information:
+            self.dialog._handle_export()
+            QThreadPool.globalInstance().waitForDone()
+            app.processEvents()
+
+        information.assert_called_once()
+        self.assertEqual(self.dialog.file_path, zip_path)
+        with zipfile.ZipFile(zip_path) as zipf:
+            self.assertEqual(sorted(zipf.namelist()), ["t1.csv", "t2.csv", "t3.csv"])
+            for table in ("t1", "t2", "t3"):
+                self.assertEqual(zipf.read(f"{table}.csv").decode('utf-8'), f"id,name\n1,{table}\n")
+
+    def test_cancel_removes_archive_and_closes_spools(self):
+        """Cancelling a multi-table CSV export should leave no file and no open spool"""
+        self.dialog.file_path = os.path.join(self.temp_dir.name, "export.csv")
+        zip_path = os.path.join(self.temp_dir.name, "export.zip")
+        self.blocked_tables = {"t2"}
+
+        spools, spool_patch = self._track_spools()
+        with spool_patch, patch('src.ui.import_export_dialog.QMessageBox.information') as information:
+            self.dialog._handle_export()
+            self.dialog.findChild(QProgressDialog).findChild(QPushButton).click()
+            self.release.set()
+            QThreadPool.globalInstance().waitForDone()
+            app.processEvents()
+
+        information.assert_not_called()
+        self.assertFalse(os.path.exists(zip_path))
+        self.assertEqual(len(spools), 3)
+        self.assertTrue(self._wait_until(lambda: all(spool.closed for spool in spools)))
+
+    def test_cancel_does_not_wait_for_running_tables(self):
+        """A cancelled archive should return at once and close late spools when they finish"""
+        self.blocked_tables = {"t2"}
+        cancelled = threading.Event()
+
+        # Cancel as soon as the first table is reported
+        def progress(value, text):
+            cancelled.set()
+
+        spools, spool_patch = self._track_spools()
+        with spool_patch, zipfile.ZipFile(os.path.join(self.temp_dir.name, "export.zip"), 'w') as zipf:
+            with self.assertRaises(ExportCancelled):
+                self.dialog._write_csv_archive(zipf, ["t1", "t2", "t3"], cancelled, progress)
+
+            # t2 is still being read
+            self.assertFalse(self.release.is_set())
+            self.assertEqual(sum(spool.closed for spool in spools), 2)
+
+        self.release.set()
+        self.assertTrue(self._wait_until(lambda: len(spools) == 3 and all(spool.closed for spool in spools)))
+
+    def test_overwrite_confirmed_once(self):
+        """An output file confirmed when browsing should not be asked about again"""
+        zip_path = os.path.join(self.temp_dir.name, "export.zip")
+        open(zip_path, 'w').close()
+
+        with patch('src.ui.import_export_dialog.QFileDialog.getExistingDirectory',
+                   return_value=self.temp_dir.name), \
+             patch('src.ui.import_export_dialog.QInputDialog.getText', return_value=("export.csv", True)), \
+             patch('src.ui.import_export_dialog.QMessageBox.question',
+                   return_value=QMessageBox.StandardButton.Yes) as question, \
+             patch('src.ui.import_export_dialog.run_in_background') as run:
+            self.dialog._browse_file()
+            self.dialog._handle_export()
+
+            question.assert_called_once()
+            self.assertEqual(run.call_args.args[3], zip_path)
+
+            # A different output file is confirmed again
+            self.dialog.tables_list.item(0).setSelected(True)
+            self.dialog.selected_tables_radio.setChecked(True)
+            open(self.dialog.file_path, 'w').close()
+            self.dialog._handle_export()
+            self.assertEqual(question.call_count, 2)
+
+    def test_cancel_button_only_for_cancellable_exports(self):
+        """Exports that cannot stop between tables should not offer Cancel"""
+        self.dialog.file_path = os.path.join(self.temp_dir.name, "export.sql")
+
+        for format_index, cancellable in ((0, False), (1, True), (2, True)):
+            with self.subTest(format_index=format_index), \
+                 patch('src.ui.import_export_dialog.run_in_background'):
+                self.dialog.format_combo.setCurrentIndex(format_index)
+                self.dialog._confirmed_path = None
+                self.dialog._handle_export()
+
+                progress = self.dialog.findChildren(QProgressDialog)[-1]
+                self.assertEqual(progress.findChild(QPushButton) is not None, cancellable)
+                progress.close()
+                progress.deleteLater()
+                app.processEvents()
+
+
+if __name__ == '__main__':
+    unittest.main()
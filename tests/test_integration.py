@@ -62,7 +62,7 @@ class TestDatabaseManagerIntegration(unittest.TestCase):
     def test_open_database_manager(self):
         """Test opening the database manager from the main window"""
         # Mock the DatabaseManagerDialog
-        with patch('src.ui.main_window.DatabaseManagerDialog') as mock_dialog:
+        with patch('src.ui.database_manager.DatabaseManagerDialog') as mock_dialog:
             # Mock the exec method to return a value
             mock_dialog_instance = MagicMock()
             mock_dialog.return_value = mock_dialog_instance
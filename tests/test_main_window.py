@@ -24,10 +24,12 @@ from src.ui.main_window import MainWindow
 from src.ui.connection_dialog import ConnectionDialog
 
 # Define patches for use in individual tests
-# We don't start them globally to avoid conflicts with external patching
-connection_dialog_patch = patch('src.ui.main_window.ConnectionDialog')
-connection_tab_patch = patch('src.ui.main_window.ConnectionTab')
-import_export_dialog_patch = patch('src.ui.main_window.ImportExportDialog')
+# We don't start them globally to avoid conflicts with external patching.
+# MainWindow imports the dialogs and ConnectionTab when it first needs them,
+# so they are patched in their own modules.
+connection_dialog_patch = patch('src.ui.connection_dialog.ConnectionDialog')
+connection_tab_patch = patch('src.ui.connection_tab.ConnectionTab')
+import_export_dialog_patch = patch('src.ui.import_export_dialog.ImportExportDialog')
 theme_manager_patch = patch('src.ui.main_window.ThemeManager')
 
 
@@ -156,6 +158,34 @@ class TestMainWindow(unittest.TestCase):
         # Check that the connection label was updated
         self.assertEqual(self.window.connection_label.text(), "Connected: Test Connection")
     
+    def test_new_connection_updates_welcome_list(self):
+        """Test that the welcome tab lists a new connection without being rebuilt"""
+        mock_connection = MagicMock()
+        mock_connection.params = {'name': 'Test Connection'}
+        self.window.connection_manager.create_connection = MagicMock(return_value=mock_connection)
+        self.window.connection_manager.get_connection_names = MagicMock(return_value=['Test Connection'])
+        welcome_list = self.window._welcome_conn_list
+        
+        self.window._new_connection()
+        
+        # The welcome tab is kept and its list is updated in place
+        self.window.connection_tabs.removeTab.assert_not_called()
+        self.assertIs(self.window._welcome_conn_list, welcome_list)
+        self.assertEqual(welcome_list.count(), 1)
+        self.assertEqual(welcome_list.item(0).text(), 'Test Connection')
+        self.assertFalse(self.window._welcome_saved_widget.isHidden())
+    
+    def test_welcome_list_double_click_connects(self):
+        """Test that double-clicking a saved connection in the welcome tab opens it"""
+        self.window.connection_manager.get_connection_names = MagicMock(return_value=['Saved'])
+        self.window._refresh_welcome_connections()
+        
+        with patch.object(self.window, '_connect_to_saved') as connect:
+            welcome_list = self.window._welcome_conn_list
+            welcome_list.itemDoubleClicked.emit(welcome_list.item(0))
+        
+        connect.assert_called_once_with('Saved')
+    
     def test_new_connection_failure(self):
         """Test creating a new connection with an error"""
         # Mock the connection manager to raise an exception
@@ -239,6 +269,18 @@ class TestMainWindow(unittest.TestCase):
         # Check that the tab was added
         self.assertTrue(self.window.connection_tabs.addTab.called)
         
+    def test_connect_to_saved_already_open(self):
+        """Test that connecting to an open connection switches to its tab"""
+        open_tab = MagicMock()
+        self.window._tab_by_conn['Open Connection'] = open_tab
+        self.window.connection_tabs.setCurrentWidget = MagicMock()
+        self.window.connection_manager.get_connection = MagicMock()
+        
+        self.window._connect_to_saved('Open Connection')
+        
+        self.window.connection_tabs.setCurrentWidget.assert_called_once_with(open_tab)
+        self.window.connection_manager.get_connection.assert_not_called()
+        
     def test_connect_to_saved_with_password(self):
         """Test connecting to a saved connection that requires a password"""
         # Mock the connection manager
@@ -308,6 +350,15 @@ class TestMainWindow(unittest.TestCase):
             # Check that create_connection was not called
             self.window.connection_manager.create_connection.assert_not_called()
     
+    def test_saved_connections_menu_action(self):
+        """Test that a saved connection action in the menu opens that connection"""
+        self.window.connection_manager.get_connection_names = MagicMock(return_value=['Saved Connection'])
+        self.window._populate_connections_menu()
+        
+        with patch.object(self.window, '_connect_to_saved') as mock_connect:
+            self.window.connections_menu.actions()[0].trigger()
+            mock_connect.assert_called_once_with('Saved Connection')
+    
     def test_close_connection_tab(self):
         """Test closing a connection tab"""
         # Create a mock connection tab
@@ -336,6 +387,15 @@ class TestMainWindow(unittest.TestCase):
     #     """Test toggling the database browser visibility"""
     #     pass
     
+    def test_welcome_tab_is_not_a_connection_tab(self):
+        """Test that the welcome tab disables the connection actions"""
+        self.window.connection_tabs.widget.return_value = self.window._welcome_widget
+        
+        self.assertIsNone(self.window._connection_tab(0))
+        self.window._update_connection_label()
+        self.assertEqual(self.window.connection_label.text(), "Not connected")
+        self.assertFalse(self.window.run_action.isEnabled())
+    
     def test_show_about(self):
         """Test showing the about dialog"""
         # Mock QMessageBox.about
@@ -421,6 +481,17 @@ class TestMainWindow(unittest.TestCase):
         # Test with dark theme
         theme_manager_mock.get_current_theme.return_value = "Dark Default"
         self.assertTrue(self.window._is_dark_theme())
+    
+    def test_logo_pixmap_is_cached(self):
+        """Test that the logo is only looked up once for each kind of theme"""
+        self.window._logo_cache.clear()
+        with patch('src.ui.main_window.QPixmap') as mock_pixmap:
+            mock_pixmap.return_value.isNull.return_value = False
+            logo = self.window._get_logo_pixmap(True)
+            lookups = mock_pixmap.call_count
+            
+            self.assertIs(self.window._get_logo_pixmap(True), logo)
+            self.assertEqual(mock_pixmap.call_count, lookups)
 
 
 if __name__ == '__main__':
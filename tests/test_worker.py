@@ -0,0 +1,79 @@
+"""
+Tests for the background worker helpers
+"""
+
+import unittest
+import os
+import sys
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Create a QApplication instance for the tests
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from src.ui import worker
+from src.ui.worker import run_in_background
+
+
+class TestRunInBackground(unittest.TestCase):
+    """Test cases for run_in_background"""
+    
+    def _wait(self):
+        QThreadPool.globalInstance().waitForDone()
+        app.processEvents()
+    
+    def test_result_delivered_to_on_finished(self):
+        """The return value should be passed to on_finished"""
+        results = []
+        errors = []
+        
+        run_in_background(lambda a, b: a + b, 2, 3, on_finished=results.append, on_error=errors.append)
+        self._wait()
+        
+        self.assertEqual(results, [5])
+        self.assertEqual(errors, [])
+    
+    def test_exception_delivered_to_on_error(self):
+        """An exception raised by the callable should be passed to on_error"""
+        results = []
+        errors = []
+        
+        def fail():
+            raise ValueError("boom")
+        
+        run_in_background(fail, on_finished=results.append, on_error=errors.append)
+        self._wait()
+        
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+    
+    def test_progress_delivered_to_on_progress(self):
+        """Progress reported by the callable should reach on_progress"""
+        reports = []
+        
+        def work(progress):
+            progress(50, "halfway")
+            return "done"
+        
+        run_in_background(work, on_progress=lambda *report: reports.append(report))
+        self._wait()
+        
+        self.assertEqual(reports, [(50, "halfway")])
+    
+    def test_worker_released_after_completion(self):
+        """Finished workers should not be kept alive"""
+        run_in_background(lambda: None)
+        self._wait()
+        
+        self.assertEqual(len(worker._active_workers), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()